@@ -13,7 +13,8 @@ from datetime import date
 import re
 
 from ..models.tax_return import TaxReturn, FilingStatus, gaap_round
-from ..calculations.tax_engine import TaxEngine
+from ..calculations.tax_engine import TaxEngine, to_cents
+from ..core.tax_tables import BASIS_POINTS, marginal_rate
 
 
 # ===========================================
@@ -240,7 +241,7 @@ class DeductionOptimizer:
 
         # Calculate current tax position
         current_results = self.tax_engine.calculate_final_tax(tax_return)
-        current_refund = current_results["refund_amount"]
+        current_refund = current_results.refund_amount
 
         # Run all analyzers
         suggestions.extend(self._analyze_above_the_line(tax_return))
@@ -621,19 +622,9 @@ class DeductionOptimizer:
     ) -> Decimal:
         """Estimate tax savings based on marginal tax rate"""
         # Determine marginal rate based on AGI
-        from ..core.config import TAX_BRACKETS_2025
+        rate = Decimal(marginal_rate(filing_status, to_cents(agi))) / BASIS_POINTS
 
-        brackets = TAX_BRACKETS_2025.get(filing_status.value, TAX_BRACKETS_2025["single"])
-        marginal_rate = Decimal("0.22")  # Default to 22%
-
-        cumulative = Decimal("0")
-        for threshold, rate in brackets:
-            if agi <= Decimal(str(threshold)):
-                marginal_rate = Decimal(str(rate))
-                break
-            cumulative = Decimal(str(threshold))
-
-        return gaap_round(deduction_amount * marginal_rate)
+        return gaap_round(deduction_amount * rate)
 
     def _calculate_audit_risk(
         self,
@@ -0,0 +1,100 @@
+"""
+GONZALES TAX PLATFORM - Response Content Negotiation
+Agent Valentina - Backend/API Master
+
+JSON (orjson) or MessagePack responses, picked per request from the Accept
+header: clients sending `Accept: application/x-msgpack` (mobile and internal
+services) get MessagePack, everyone else JSON. Either way the payload is the
+same JSON-mode data (Decimals, UUIDs and datetimes as strings), encoded once.
+"""
+from contextvars import ContextVar
+from typing import Any
+
+import msgpack
+import orjson
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+MSGPACK_MEDIA_TYPES = ("application/x-msgpack", "application/msgpack")
+
+# Whether the current request asked for MessagePack; set by
+# ContentNegotiationMiddleware
+_wants_msgpack: ContextVar[bool] = ContextVar("wants_msgpack", default=False)
+
+
+def accepts_msgpack(accept: str) -> bool:
+    """True if the Accept header lists a MessagePack media type (q > 0)"""
+    for entry in accept.split(","):
+        media_type, *params = entry.strip().split(";")
+        if media_type.strip().lower() not in MSGPACK_MEDIA_TYPES:
+            continue
+        for param in params:
+            name, _, value = param.strip().partition("=")
+            if name.strip() == "q":
+                try:
+                    return float(value) > 0
+                except ValueError:
+                    return False
+        return True
+    return False
+
+
+def negotiated_etag(etag: str) -> str:
+    """
+    The ETag for the representation this request gets. The MessagePack
+    body differs from the JSON one, so it carries its own validator
+    (W/"abc" -> W/"abc-msgpack") and a cached JSON body is never
+    revalidated as MessagePack or vice versa.
+    """
+    if _wants_msgpack.get():
+        return f'{etag[:-1]}-msgpack"'
+    return etag
+
+
+class NegotiatedResponse(JSONResponse):
+    """
+    JSON response that renders as MessagePack when the request asked for it.
+
+    Used as the app's default response class, so route return values and
+    response models are serialized straight into the requested format.
+    """
+
+    def __init__(self, content: Any, *args, **kwargs):
+        # Response.__init__ reads media_type for the content-type header
+        if _wants_msgpack.get():
+            self.media_type = MSGPACK_MEDIA_TYPES[0]
+        super().__init__(content, *args, **kwargs)
+
+    def render(self, content: Any) -> bytes:
+        if self.media_type == MSGPACK_MEDIA_TYPES[0]:
+            return msgpack.packb(content)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+class ContentNegotiationMiddleware:
+    """
+    Record the request's preferred format for NegotiatedResponse and mark
+    every response as varying on Accept, so shared caches keep the JSON
+    and MessagePack representations apart.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_vary(message: Message):
+            if message["type"] == "http.response.start":
+                MutableHeaders(raw=message["headers"]).add_vary_header("Accept")
+            await send(message)
+
+        token = _wants_msgpack.set(accepts_msgpack(Headers(scope=scope).get("accept", "")))
+        try:
+            await self.app(scope, receive, send_with_vary)
+        finally:
+            _wants_msgpack.reset(token)
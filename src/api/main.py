@@ -7,12 +7,12 @@ FastAPI application entry point with all routes and middleware.
 from fastapi import FastAPI, Request, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 import logging
 import time
 from typing import Callable
 
+from .content_negotiation import ContentNegotiationMiddleware, NegotiatedResponse
 from .routers import auth, returns, calculations, documents, efile, users, optimizer, mef
 from ..core.config import get_settings, Environment
 
@@ -86,6 +86,7 @@ def create_app() -> FastAPI:
         docs_url="/docs" if settings.ENVIRONMENT != Environment.PRODUCTION else None,
         redoc_url="/redoc" if settings.ENVIRONMENT != Environment.PRODUCTION else None,
         lifespan=lifespan,
+        default_response_class=NegotiatedResponse,
     )
 
     # Add middleware
@@ -129,6 +130,9 @@ def configure_middleware(app: FastAPI, settings):
         expose_headers=["X-Request-ID", "X-RateLimit-Remaining"],
     )
 
+    # JSON or MessagePack responses, per the Accept header
+    app.add_middleware(ContentNegotiationMiddleware)
+
     # Gzip compression
     app.add_middleware(GZipMiddleware, minimum_size=1000)
 
@@ -249,7 +253,7 @@ def configure_exception_handlers(app: FastAPI):
 
     @app.exception_handler(HTTPException)
     async def http_exception_handler(request: Request, exc: HTTPException):
-        return JSONResponse(
+        return NegotiatedResponse(
             status_code=exc.status_code,
             content={
                 "error": {
@@ -263,7 +267,7 @@ def configure_exception_handlers(app: FastAPI):
     @app.exception_handler(ValueError)
     async def value_error_handler(request: Request, exc: ValueError):
         logger.error(f"ValueError: {exc}")
-        return JSONResponse(
+        return NegotiatedResponse(
             status_code=400,
             content={
                 "error": {
@@ -282,7 +286,7 @@ def configure_exception_handlers(app: FastAPI):
         # In production, don't expose internal errors
         message = "An internal error occurred" if settings.is_production else str(exc)
 
-        return JSONResponse(
+        return NegotiatedResponse(
             status_code=500,
             content={
                 "error": {
@@ -10,7 +10,10 @@ from decimal import Decimal
 from typing import Optional, Dict, Any
 
 from ...models.tax_return import FilingStatus, gaap_round
-from ...calculations.tax_engine import TaxEngine, OBBBAProvisions
+from ...calculations.tax_engine import (
+    OBBBA, TAX_BRACKETS_DEC, STANDARD_DEDUCTIONS_DEC, to_cents, from_cents
+)
+from ...core.tax_tables import bracket_liability, marginal_rate as bracket_marginal_rate
 
 router = APIRouter()
 
@@ -79,8 +82,7 @@ async def quick_calculate(request: QuickCalcRequest):
     Provides a fast estimate without creating a full return.
     Includes OBBBA provisions (tips, overtime, senior deduction).
     """
-    engine = TaxEngine(2025)
-    obbba = OBBBAProvisions()
+    obbba = OBBBA
 
     # Calculate gross income
     gross_income = (
@@ -108,8 +110,7 @@ async def quick_calculate(request: QuickCalcRequest):
     agi = gross_income - total_adjustments
 
     # Deduction (standard vs itemized)
-    from ...core.config import STANDARD_DEDUCTIONS_2025
-    standard_deduction = Decimal(str(STANDARD_DEDUCTIONS_2025.get(request.filing_status.value, 14600)))
+    standard_deduction = STANDARD_DEDUCTIONS_DEC[request.filing_status]
     standard_deduction += senior_deduction
 
     if request.itemized_deductions > standard_deduction:
@@ -123,7 +124,7 @@ async def quick_calculate(request: QuickCalcRequest):
     taxable_income = max(agi - deduction_amount, Decimal("0"))
 
     # Tax liability
-    tax_liability = engine._calculate_bracket_tax(taxable_income, request.filing_status)
+    tax_liability = from_cents(bracket_liability(request.filing_status, to_cents(taxable_income)))
 
     # Add SE tax
     tax_liability += se_tax
@@ -137,14 +138,8 @@ async def quick_calculate(request: QuickCalcRequest):
     # Effective and marginal rates
     effective_rate = (tax_liability / gross_income * 100) if gross_income > 0 else Decimal("0")
 
-    # Find marginal rate
-    from ...core.config import TAX_BRACKETS_2025
-    brackets = TAX_BRACKETS_2025.get(request.filing_status.value, TAX_BRACKETS_2025["single"])
-    marginal_rate = Decimal("10")
-    for threshold, rate in brackets:
-        if taxable_income <= Decimal(str(threshold)):
-            marginal_rate = Decimal(str(rate)) * 100
-            break
+    # Marginal rate (basis points -> percent)
+    marginal_rate = Decimal(bracket_marginal_rate(request.filing_status, to_cents(taxable_income))) / 100
 
     # Tax after credits
     tax_after_credits = max(tax_liability - total_credits, Decimal("0"))
@@ -185,21 +180,17 @@ async def get_tax_brackets(filing_status: FilingStatus):
 
     Returns 2025 tax brackets with rates.
     """
-    from ...core.config import TAX_BRACKETS_2025
-
-    brackets = TAX_BRACKETS_2025.get(filing_status.value, TAX_BRACKETS_2025["single"])
-
     result = []
     prev_threshold = Decimal("0")
 
-    for threshold, rate in brackets:
+    for threshold, rate in TAX_BRACKETS_DEC[filing_status]:
         result.append({
             "bracket_start": prev_threshold,
-            "bracket_end": Decimal(str(threshold)) if threshold != float("inf") else None,
-            "rate": Decimal(str(rate)) * 100,
+            "bracket_end": threshold if threshold.is_finite() else None,
+            "rate": rate * 100,
             "rate_display": f"{float(rate) * 100:.0f}%"
         })
-        prev_threshold = Decimal(str(threshold))
+        prev_threshold = threshold
 
     return {"filing_status": filing_status.value, "tax_year": 2025, "brackets": result}
 
@@ -209,9 +200,9 @@ async def get_standard_deductions():
     """
     Get standard deduction amounts for all filing statuses.
     """
-    from ...core.config import STANDARD_DEDUCTIONS_2025, ADDITIONAL_STANDARD_DEDUCTION_2025
+    from ...core.tax_tables import STANDARD_DEDUCTIONS_2025, ADDITIONAL_STANDARD_DEDUCTION_2025
 
-    obbba = OBBBAProvisions()
+    obbba = OBBBA
 
     return {
         "tax_year": 2025,
@@ -226,7 +217,7 @@ async def get_obbba_provisions():
     """
     Get all OBBBA (One Big Beautiful Bill Act) provisions.
     """
-    obbba = OBBBAProvisions()
+    obbba = OBBBA
 
     return {
         "child_tax_credit": {
@@ -279,13 +270,10 @@ async def estimate_withholding(
 
     Helps users adjust their W-4 for accurate withholding.
     """
-    engine = TaxEngine(2025)
-
     # Calculate annual tax
-    from ...core.config import STANDARD_DEDUCTIONS_2025
-    standard_deduction = Decimal(str(STANDARD_DEDUCTIONS_2025.get(filing_status.value, 14600)))
+    standard_deduction = STANDARD_DEDUCTIONS_DEC[filing_status]
     taxable_income = max(annual_income - pre_tax_deductions - standard_deduction, Decimal("0"))
-    annual_tax = engine._calculate_bracket_tax(taxable_income, filing_status)
+    annual_tax = from_cents(bracket_liability(filing_status, to_cents(taxable_income)))
 
     # Pay periods per year
     pay_periods = {
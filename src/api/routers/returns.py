@@ -4,19 +4,26 @@ Agent Valentina - Backend/API Master
 
 API endpoints for tax return CRUD operations.
 """
-from fastapi import APIRouter, HTTPException, Depends, Query, Path
-from typing import List, Optional
+from fastapi import (
+    APIRouter, HTTPException, Depends, Query, Path, Body, Request, Response, BackgroundTasks
+)
+from typing import Any, AsyncContextManager, Callable, Dict, List, Optional, Tuple
+import hashlib
+from collections import OrderedDict
 from uuid import UUID
 from datetime import datetime
 from decimal import Decimal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from ...models.tax_return import (
     TaxReturn, ReturnStatus, ReturnType, FilingStatus,
     TaxpayerInfo, Dependent, W2Income, Form1099,
     SelfEmploymentIncome, ItemizedDeductions, TaxCredits
 )
-from ...calculations.tax_engine import TaxEngine
+from ...calculations.tax_engine import TaxEngine, FinalTaxResult
+from ...core.utils import mutation_time, new_uuid
+from ...services.return_store import ReturnStore, get_return_store
+from ..content_negotiation import negotiated_etag
 
 
 router = APIRouter()
@@ -27,6 +34,8 @@ router = APIRouter()
 # ===========================================
 class CreateReturnRequest(BaseModel):
     """Request to create a new tax return"""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     tax_year: int = Field(..., ge=2020, le=2030)
     filing_status: FilingStatus
     return_type: ReturnType = ReturnType.FORM_1040
@@ -34,6 +43,8 @@ class CreateReturnRequest(BaseModel):
 
 class UpdateReturnRequest(BaseModel):
     """Request to update a tax return"""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     filing_status: Optional[FilingStatus] = None
     taxpayer: Optional[TaxpayerInfo] = None
     spouse: Optional[TaxpayerInfo] = None
@@ -76,10 +87,104 @@ class CalculationSummary(BaseModel):
 
 
 # ===========================================
-# MOCK DATABASE (Replace with real DB)
+# RETURN STORAGE
+# ===========================================
+# Backend (in-memory or Redis) is selected by RETURN_STORE_BACKEND
+_returns_db: ReturnStore = get_return_store()
+
+# Upper bound on items accepted by the bulk-add endpoints
+MAX_BULK_ITEMS = 200
+
+# Last engine results per return, stamped with the updated_at they were
+# computed for. Lets a request that queued behind an identical
+# calculation reuse the result instead of running the engine again.
+# Least recently used entries are evicted past MAX_CACHED_RESULTS.
+MAX_CACHED_RESULTS = 1024
+_last_results: "OrderedDict[UUID, Tuple[datetime, FinalTaxResult]]" = OrderedDict()
+
+
+def _get_return_lock(return_id: UUID) -> AsyncContextManager:
+    """The store's lock for a tax return (shared by all workers on Redis)"""
+    return _returns_db.lock(return_id)
+
+
+def _remember_results(tax_return: TaxReturn, results: FinalTaxResult):
+    """Record results as current for the return's updated_at"""
+    _last_results[tax_return.id] = (tax_return.updated_at, results)
+    _last_results.move_to_end(tax_return.id)
+    while len(_last_results) > MAX_CACHED_RESULTS:
+        _last_results.popitem(last=False)
+
+
+def _current_results(tax_return: TaxReturn) -> Optional[FinalTaxResult]:
+    """Results from a previous calculation, if inputs haven't changed since"""
+    cached = _last_results.get(tax_return.id)
+    if cached and cached[0] == tax_return.updated_at:
+        _last_results.move_to_end(tax_return.id)
+        return cached[1]
+    return None
+
+
+# Engine results copied onto the return (and reported by /calculate)
+_RESULT_FIELDS = (
+    "gross_income",
+    "adjusted_gross_income",
+    "taxable_income",
+    "tax_liability",
+    "total_credits",
+    "total_payments",
+    "refund_amount",
+    "amount_owed",
+)
+
+
+def _apply_results(tax_return: TaxReturn, results: FinalTaxResult):
+    """Store the calculated fields on the return"""
+    for field in _RESULT_FIELDS:
+        setattr(tax_return, field, getattr(results, field))
+
+
+def _recalculate(tax_return: TaxReturn) -> FinalTaxResult:
+    """Run the tax engine and store the calculated fields on the return"""
+    engine = TaxEngine(tax_return.tax_year)
+    results = engine.calculate_final_tax(tax_return)
+    _apply_results(tax_return, results)
+    return results
+
+
+async def recalculate_and_store(return_id: UUID):
+    """Background task: recalculate a return after its inputs changed"""
+    async with _get_return_lock(return_id):
+        tax_return = await _returns_db.get(return_id)
+        if not tax_return:
+            return  # Deleted before the task ran
+        results = _recalculate(tax_return)
+        tax_return.updated_at = mutation_time(tax_return.updated_at)  # Invalidate cached ETags
+        _remember_results(tax_return, results)
+        await _returns_db.put(tax_return)
+
+
+# ===========================================
+# CONDITIONAL GET HELPERS
 # ===========================================
-# In production, this would be replaced with actual database operations
-_returns_db: dict = {}
+CACHE_CONTROL = "private, must-revalidate"
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the client's If-None-Match header matches the ETag"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [tag.strip() for tag in header.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def _not_modified(etag: str) -> Response:
+    """Build a 304 response carrying the validator headers"""
+    return Response(
+        status_code=304,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    )
 
 
 def get_current_user_id() -> UUID:
@@ -92,8 +197,10 @@ def get_current_user_id() -> UUID:
 # ===========================================
 # ENDPOINTS
 # ===========================================
-@router.get("", response_model=ReturnListResponse)
+@router.get("", response_model=ReturnListResponse, response_model_exclude_none=True)
 async def list_returns(
+    request: Request,
+    response: Response,
     tax_year: Optional[int] = Query(None, description="Filter by tax year"),
     status: Optional[ReturnStatus] = Query(None, description="Filter by status"),
     page: int = Query(1, ge=1, description="Page number"),
@@ -103,29 +210,31 @@ async def list_returns(
     """
     List all tax returns for the current user.
 
-    Returns paginated list of tax return summaries.
+    Returns paginated list of tax return summaries. Supports conditional
+    GET via ETag / If-None-Match.
     """
-    # Filter returns for user
-    user_returns = [r for r in _returns_db.values() if r.user_id == user_id]
-
-    # Apply filters
-    if tax_year:
-        user_returns = [r for r in user_returns if r.tax_year == tax_year]
-    if status:
-        user_returns = [r for r in user_returns if r.status == status]
-
-    # Sort by updated_at descending
-    user_returns.sort(key=lambda x: x.updated_at, reverse=True)
-
-    # Paginate
-    total = len(user_returns)
-    start = (page - 1) * page_size
-    end = start + page_size
-    page_returns = user_returns[start:end]
+    # Filter, sort by updated_at descending and paginate in the store
+    page_returns, total = await _returns_db.list_for_user(
+        user_id,
+        tax_year=tax_year,
+        status=status,
+        offset=(page - 1) * page_size,
+        limit=page_size
+    )
 
-    # Convert to summaries
+    # Conditional GET - skip serialization when the page is unchanged
+    last_updated = max((r.updated_at for r in page_returns), default=None)
+    fingerprint = repr((last_updated, total, page, page_size, tax_year, status))
+    etag = negotiated_etag(f'W/"{hashlib.sha1(fingerprint.encode()).hexdigest()}"')
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
+    # Convert to summaries - fields come from already-validated returns,
+    # so skip re-validation
     summaries = [
-        ReturnSummary(
+        ReturnSummary.model_construct(
             id=r.id,
             tax_year=r.tax_year,
             return_type=r.return_type,
@@ -141,7 +250,7 @@ async def list_returns(
         for r in page_returns
     ]
 
-    return ReturnListResponse(
+    return ReturnListResponse.model_construct(
         returns=summaries,
         total=total,
         page=page,
@@ -159,7 +268,6 @@ async def create_return(
 
     Initializes a new tax return in draft status.
     """
-    from uuid import uuid4
     from datetime import date
 
     # Create default taxpayer info (to be filled in)
@@ -175,7 +283,7 @@ async def create_return(
 
     # Create the return
     tax_return = TaxReturn(
-        id=uuid4(),
+        id=new_uuid(),
         user_id=user_id,
         tax_year=request.tax_year,
         return_type=request.return_type,
@@ -185,22 +293,25 @@ async def create_return(
     )
 
     # Save to database
-    _returns_db[tax_return.id] = tax_return
+    await _returns_db.put(tax_return)
 
     return tax_return
 
 
-@router.get("/{return_id}", response_model=TaxReturn)
+@router.get("/{return_id}", response_model=TaxReturn, response_model_exclude_none=True)
 async def get_return(
+    request: Request,
+    response: Response,
     return_id: UUID = Path(..., description="Tax return ID"),
     user_id: UUID = Depends(get_current_user_id)
 ):
     """
     Get a specific tax return by ID.
 
-    Returns the complete tax return with all details.
+    Returns the complete tax return with all details. Responds with
+    304 Not Modified when If-None-Match matches the current ETag.
     """
-    tax_return = _returns_db.get(return_id)
+    tax_return = await _returns_db.get(return_id)
 
     if not tax_return:
         raise HTTPException(status_code=404, detail="Tax return not found")
@@ -208,6 +319,12 @@ async def get_return(
     if tax_return.user_id != user_id:
         raise HTTPException(status_code=403, detail="Access denied")
 
+    etag = negotiated_etag(f'W/"{tax_return.updated_at.timestamp()}-{tax_return.id}"')
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
     return tax_return
 
 
@@ -222,53 +339,44 @@ async def update_return(
 
     Only draft and in_progress returns can be updated.
     """
-    tax_return = _returns_db.get(return_id)
-
-    if not tax_return:
-        raise HTTPException(status_code=404, detail="Tax return not found")
+    # Serialize overlapping saves (e.g. UI autosave) of the same return
+    async with _get_return_lock(return_id):
+        tax_return = await _returns_db.get(return_id)
 
-    if tax_return.user_id != user_id:
-        raise HTTPException(status_code=403, detail="Access denied")
+        if not tax_return:
+            raise HTTPException(status_code=404, detail="Tax return not found")
 
-    if tax_return.status not in (ReturnStatus.DRAFT, ReturnStatus.IN_PROGRESS):
-        raise HTTPException(
-            status_code=400,
-            detail="Cannot update a submitted or accepted return"
-        )
+        if tax_return.user_id != user_id:
+            raise HTTPException(status_code=403, detail="Access denied")
 
-    # Update fields
-    if request.filing_status:
-        tax_return.filing_status = request.filing_status
-    if request.taxpayer:
-        tax_return.taxpayer = request.taxpayer
-    if request.spouse:
-        tax_return.spouse = request.spouse
-    if request.dependents is not None:
-        tax_return.dependents = request.dependents
+        if tax_return.status not in (ReturnStatus.DRAFT, ReturnStatus.IN_PROGRESS):
+            raise HTTPException(
+                status_code=400,
+                detail="Cannot update a submitted or accepted return"
+            )
 
-    # Update timestamp
-    tax_return.updated_at = datetime.utcnow()
+        # Update fields
+        if request.filing_status:
+            tax_return.filing_status = request.filing_status
+        if request.taxpayer:
+            tax_return.taxpayer = request.taxpayer
+        if request.spouse:
+            tax_return.spouse = request.spouse
+        if request.dependents is not None:
+            tax_return.dependents = request.dependents
 
-    # Update status to in_progress if was draft
-    if tax_return.status == ReturnStatus.DRAFT:
-        tax_return.status = ReturnStatus.IN_PROGRESS
+        # Update timestamp
+        tax_return.updated_at = mutation_time(tax_return.updated_at)
 
-    # Recalculate tax
-    engine = TaxEngine(tax_return.tax_year)
-    results = engine.calculate_final_tax(tax_return)
+        # Update status to in_progress if was draft
+        if tax_return.status == ReturnStatus.DRAFT:
+            tax_return.status = ReturnStatus.IN_PROGRESS
 
-    # Update calculated fields
-    tax_return.gross_income = results["gross_income"]
-    tax_return.adjusted_gross_income = results["adjusted_gross_income"]
-    tax_return.taxable_income = results["taxable_income"]
-    tax_return.tax_liability = results["tax_liability"]
-    tax_return.total_credits = results["total_nonrefundable_credits"] + results["total_refundable_credits"]
-    tax_return.total_payments = results["total_payments"]
-    tax_return.refund_amount = results["refund_amount"]
-    tax_return.amount_owed = results["amount_owed"]
+        # Recalculate tax
+        _remember_results(tax_return, _recalculate(tax_return))
 
-    # Save
-    _returns_db[return_id] = tax_return
+        # Save
+        await _returns_db.put(tax_return)
 
     return tax_return
 
@@ -283,22 +391,24 @@ async def delete_return(
 
     Only draft returns can be deleted. Submitted returns are archived.
     """
-    tax_return = _returns_db.get(return_id)
+    async with _get_return_lock(return_id):
+        tax_return = await _returns_db.get(return_id)
 
-    if not tax_return:
-        raise HTTPException(status_code=404, detail="Tax return not found")
+        if not tax_return:
+            raise HTTPException(status_code=404, detail="Tax return not found")
 
-    if tax_return.user_id != user_id:
-        raise HTTPException(status_code=403, detail="Access denied")
+        if tax_return.user_id != user_id:
+            raise HTTPException(status_code=403, detail="Access denied")
 
-    if tax_return.status not in (ReturnStatus.DRAFT, ReturnStatus.IN_PROGRESS):
-        raise HTTPException(
-            status_code=400,
-            detail="Cannot delete a submitted or accepted return"
-        )
+        if tax_return.status not in (ReturnStatus.DRAFT, ReturnStatus.IN_PROGRESS):
+            raise HTTPException(
+                status_code=400,
+                detail="Cannot delete a submitted or accepted return"
+            )
 
-    # Delete (soft delete in production)
-    del _returns_db[return_id]
+        # Delete (soft delete in production)
+        await _returns_db.delete(tax_return)
+        _last_results.pop(return_id, None)
 
 
 @router.post("/{return_id}/calculate", response_model=CalculationSummary)
@@ -309,115 +419,167 @@ async def calculate_return(
     """
     Calculate/recalculate tax for a return.
 
-    Returns detailed calculation summary.
+    Returns detailed calculation summary. Concurrent requests for the
+    same return are coalesced: whoever queued behind a calculation on
+    unchanged inputs reuses its result.
     """
-    tax_return = _returns_db.get(return_id)
+    async with _get_return_lock(return_id):
+        tax_return = await _returns_db.get(return_id)
 
-    if not tax_return:
-        raise HTTPException(status_code=404, detail="Tax return not found")
+        if not tax_return:
+            raise HTTPException(status_code=404, detail="Tax return not found")
 
-    if tax_return.user_id != user_id:
-        raise HTTPException(status_code=403, detail="Access denied")
+        if tax_return.user_id != user_id:
+            raise HTTPException(status_code=403, detail="Access denied")
 
-    # Calculate
-    engine = TaxEngine(tax_return.tax_year)
-    results = engine.calculate_final_tax(tax_return)
+        results = _current_results(tax_return)
+        if results is None:
+            # Calculate and update return with calculated values
+            results = _recalculate(tax_return)
+            tax_return.updated_at = mutation_time(tax_return.updated_at)
+            _remember_results(tax_return, results)
 
-    # Update return with calculated values
-    tax_return.gross_income = results["gross_income"]
-    tax_return.adjusted_gross_income = results["adjusted_gross_income"]
-    tax_return.taxable_income = results["taxable_income"]
-    tax_return.tax_liability = results["tax_liability"]
-    tax_return.total_credits = results["total_nonrefundable_credits"] + results["total_refundable_credits"]
-    tax_return.total_payments = results["total_payments"]
-    tax_return.refund_amount = results["refund_amount"]
-    tax_return.amount_owed = results["amount_owed"]
-    tax_return.updated_at = datetime.utcnow()
-
-    _returns_db[return_id] = tax_return
-
-    return CalculationSummary(
-        gross_income=results["gross_income"],
-        adjusted_gross_income=results["adjusted_gross_income"],
-        taxable_income=results["taxable_income"],
-        tax_liability=results["tax_liability"],
-        total_credits=results["total_nonrefundable_credits"] + results["total_refundable_credits"],
-        total_payments=results["total_payments"],
-        refund_amount=results["refund_amount"],
-        amount_owed=results["amount_owed"]
-    )
+            await _returns_db.put(tax_return)
+
+    return CalculationSummary(**{field: getattr(results, field) for field in _RESULT_FIELDS})
+
+
+@router.post("/{return_id}/w2/bulk")
+async def add_w2s(
+    return_id: UUID,
+    background_tasks: BackgroundTasks,
+    w2s: List[W2Income] = Body(..., min_length=1, max_length=MAX_BULK_ITEMS),
+    user_id: UUID = Depends(get_current_user_id)
+):
+    """Add several W-2s to the tax return in one request"""
+    # Serialize with other writers (and the background recalculation)
+    async with _get_return_lock(return_id):
+        tax_return = await _returns_db.get(return_id)
+
+        if not tax_return:
+            raise HTTPException(status_code=404, detail="Tax return not found")
+
+        if tax_return.user_id != user_id:
+            raise HTTPException(status_code=403, detail="Access denied")
+
+        tax_return.w2_income.extend(w2s)
+        tax_return.updated_at = mutation_time(tax_return.updated_at)
+
+        # Recalculate federal withheld
+        tax_return.federal_withheld = tax_return.total_federal_withheld
+
+        await _returns_db.put(tax_return)
+
+    # Recalculate once for the whole batch, off the response path
+    background_tasks.add_task(recalculate_and_store, return_id)
+
+    return {
+        "message": f"{len(w2s)} W-2(s) added successfully",
+        "added": len(w2s),
+        "w2_ids": [str(w2.id) for w2 in w2s]
+    }
 
 
 @router.post("/{return_id}/w2")
 async def add_w2(
     return_id: UUID,
     w2: W2Income,
+    background_tasks: BackgroundTasks,
     user_id: UUID = Depends(get_current_user_id)
 ):
     """Add a W-2 to the tax return"""
-    tax_return = _returns_db.get(return_id)
+    result = await add_w2s(return_id, background_tasks, [w2], user_id)
+    return {"message": "W-2 added successfully", "w2_id": result["w2_ids"][0]}
 
-    if not tax_return:
-        raise HTTPException(status_code=404, detail="Tax return not found")
 
-    if tax_return.user_id != user_id:
-        raise HTTPException(status_code=403, detail="Access denied")
+@router.post("/{return_id}/1099/bulk")
+async def add_1099s(
+    return_id: UUID,
+    background_tasks: BackgroundTasks,
+    forms: List[Form1099] = Body(..., min_length=1, max_length=MAX_BULK_ITEMS),
+    user_id: UUID = Depends(get_current_user_id)
+):
+    """Add several 1099s to the tax return in one request"""
+    # Serialize with other writers (and the background recalculation)
+    async with _get_return_lock(return_id):
+        tax_return = await _returns_db.get(return_id)
+
+        if not tax_return:
+            raise HTTPException(status_code=404, detail="Tax return not found")
+
+        if tax_return.user_id != user_id:
+            raise HTTPException(status_code=403, detail="Access denied")
 
-    tax_return.w2_income.append(w2)
-    tax_return.updated_at = datetime.utcnow()
+        tax_return.form_1099s.extend(forms)
+        tax_return.updated_at = mutation_time(tax_return.updated_at)
 
-    # Recalculate federal withheld
-    tax_return.federal_withheld = tax_return.total_federal_withheld
+        await _returns_db.put(tax_return)
 
-    _returns_db[return_id] = tax_return
+    # Recalculate once for the whole batch, off the response path
+    background_tasks.add_task(recalculate_and_store, return_id)
 
-    return {"message": "W-2 added successfully", "w2_id": str(w2.id)}
+    return {
+        "message": f"{len(forms)} 1099(s) added successfully",
+        "added": len(forms),
+        "form_ids": [str(form.id) for form in forms]
+    }
 
 
 @router.post("/{return_id}/1099")
 async def add_1099(
     return_id: UUID,
     form_1099: Form1099,
+    background_tasks: BackgroundTasks,
     user_id: UUID = Depends(get_current_user_id)
 ):
     """Add a 1099 to the tax return"""
-    tax_return = _returns_db.get(return_id)
+    result = await add_1099s(return_id, background_tasks, [form_1099], user_id)
+    return {"message": "1099 added successfully", "form_id": result["form_ids"][0]}
 
-    if not tax_return:
-        raise HTTPException(status_code=404, detail="Tax return not found")
 
-    if tax_return.user_id != user_id:
-        raise HTTPException(status_code=403, detail="Access denied")
+@router.post("/{return_id}/dependent/bulk")
+async def add_dependents(
+    return_id: UUID,
+    background_tasks: BackgroundTasks,
+    dependents: List[Dependent] = Body(..., min_length=1, max_length=MAX_BULK_ITEMS),
+    user_id: UUID = Depends(get_current_user_id)
+):
+    """Add several dependents to the tax return in one request"""
+    # Serialize with other writers (and the background recalculation)
+    async with _get_return_lock(return_id):
+        tax_return = await _returns_db.get(return_id)
+
+        if not tax_return:
+            raise HTTPException(status_code=404, detail="Tax return not found")
+
+        if tax_return.user_id != user_id:
+            raise HTTPException(status_code=403, detail="Access denied")
 
-    tax_return.form_1099s.append(form_1099)
-    tax_return.updated_at = datetime.utcnow()
+        tax_return.dependents.extend(dependents)
+        tax_return.updated_at = mutation_time(tax_return.updated_at)
 
-    _returns_db[return_id] = tax_return
+        await _returns_db.put(tax_return)
 
-    return {"message": "1099 added successfully", "form_id": str(form_1099.id)}
+    # Recalculate once for the whole batch, off the response path
+    background_tasks.add_task(recalculate_and_store, return_id)
+
+    return {
+        "message": f"{len(dependents)} dependent(s) added successfully",
+        "added": len(dependents),
+        "dependent_ids": [str(dependent.id) for dependent in dependents]
+    }
 
 
 @router.post("/{return_id}/dependent")
 async def add_dependent(
     return_id: UUID,
     dependent: Dependent,
+    background_tasks: BackgroundTasks,
     user_id: UUID = Depends(get_current_user_id)
 ):
     """Add a dependent to the tax return"""
-    tax_return = _returns_db.get(return_id)
-
-    if not tax_return:
-        raise HTTPException(status_code=404, detail="Tax return not found")
-
-    if tax_return.user_id != user_id:
-        raise HTTPException(status_code=403, detail="Access denied")
-
-    tax_return.dependents.append(dependent)
-    tax_return.updated_at = datetime.utcnow()
-
-    _returns_db[return_id] = tax_return
-
-    return {"message": "Dependent added successfully", "dependent_id": str(dependent.id)}
+    result = await add_dependents(return_id, background_tasks, [dependent], user_id)
+    return {"message": "Dependent added successfully", "dependent_id": result["dependent_ids"][0]}
 
 
 @router.post("/{return_id}/ready-to-file")
@@ -430,52 +592,51 @@ async def mark_ready_to_file(
 
     Validates the return and marks it ready for e-filing.
     """
-    tax_return = _returns_db.get(return_id)
+    async with _get_return_lock(return_id):
+        tax_return = await _returns_db.get(return_id)
 
-    if not tax_return:
-        raise HTTPException(status_code=404, detail="Tax return not found")
+        if not tax_return:
+            raise HTTPException(status_code=404, detail="Tax return not found")
 
-    if tax_return.user_id != user_id:
-        raise HTTPException(status_code=403, detail="Access denied")
+        if tax_return.user_id != user_id:
+            raise HTTPException(status_code=403, detail="Access denied")
 
-    # Validate return
-    errors = validate_return(tax_return)
-    if errors:
-        raise HTTPException(status_code=400, detail={"errors": errors})
+        # Validate return
+        errors = validate_return(tax_return)
+        if errors:
+            raise HTTPException(status_code=400, detail={"errors": errors})
 
-    tax_return.status = ReturnStatus.READY_TO_FILE
-    tax_return.updated_at = datetime.utcnow()
+        tax_return.status = ReturnStatus.READY_TO_FILE
+        tax_return.updated_at = mutation_time(tax_return.updated_at)
 
-    _returns_db[return_id] = tax_return
+        await _returns_db.put(tax_return)
 
     return {"message": "Return marked as ready to file", "status": "ready_to_file"}
 
 
+# ===========================================
+# FILING VALIDATION RULES
+# ===========================================
+# (predicate, message) pairs evaluated in order; a rule fires when its
+# predicate returns True. New rules only need an entry here.
+_VALIDATION_RULES: List[Tuple[Callable[[TaxReturn], bool], str]] = [
+    # Taxpayer info
+    (lambda r: not r.taxpayer.first_name, "Taxpayer first name is required"),
+    (lambda r: not r.taxpayer.last_name, "Taxpayer last name is required"),
+    (lambda r: not (r.taxpayer.ssn_encrypted or r.taxpayer.ssn_last_four),
+     "Taxpayer SSN is required"),
+    (lambda r: r.taxpayer.street_address == "", "Taxpayer address is required"),
+    # Spouse if MFJ
+    (lambda r: r.filing_status == FilingStatus.MARRIED_FILING_JOINTLY and not r.spouse,
+     "Spouse information required for Married Filing Jointly"),
+    # Income sources
+    (lambda r: not (r.w2_income or r.self_employment or r.form_1099s),
+     "At least one income source is required"),
+    # Zero income (warning, not error)
+    (lambda r: r.gross_income == 0, "Warning: Gross income is $0"),
+]
+
+
 def validate_return(tax_return: TaxReturn) -> List[str]:
     """Validate a tax return before filing"""
-    errors = []
-
-    # Check taxpayer info
-    if not tax_return.taxpayer.first_name:
-        errors.append("Taxpayer first name is required")
-    if not tax_return.taxpayer.last_name:
-        errors.append("Taxpayer last name is required")
-    if not tax_return.taxpayer.ssn_encrypted and not tax_return.taxpayer.ssn_last_four:
-        errors.append("Taxpayer SSN is required")
-    if tax_return.taxpayer.street_address == "":
-        errors.append("Taxpayer address is required")
-
-    # Check spouse if MFJ
-    if tax_return.filing_status == FilingStatus.MARRIED_FILING_JOINTLY:
-        if not tax_return.spouse:
-            errors.append("Spouse information required for Married Filing Jointly")
-
-    # Check income sources
-    if not tax_return.w2_income and not tax_return.self_employment and not tax_return.form_1099s:
-        errors.append("At least one income source is required")
-
-    # Check for zero income (warning, not error)
-    if tax_return.gross_income == 0:
-        errors.append("Warning: Gross income is $0")
-
-    return errors
+    return [message for predicate, message in _VALIDATION_RULES if predicate(tax_return)]
@@ -1,2 +1,5 @@
 """Tax calculation engine"""
-from .tax_engine import TaxEngine, OBBBAProvisions
+from .tax_engine import (
+    TaxEngine, FinalTaxResult, OBBBAProvisions, OBBBA,
+    TAX_BRACKETS_DEC, STANDARD_DEDUCTIONS_DEC
+)
@@ -7,19 +7,29 @@ and GAAP-compliant financial calculations.
 
 100% ACCURACY GUARANTEE - All calculations validated against IRS publications.
 """
+import sys
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Tuple, Dict, Optional, List
+from functools import wraps
+from typing import Any, Callable, Tuple, Dict, Optional, List, NamedTuple
 from dataclasses import dataclass
 from enum import Enum
 
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # Optional: pip install gonzales-tax-platform[jit]
+    numba = None
+
 from ..models.tax_return import (
     TaxReturn, FilingStatus, DeductionType,
-    W2Income, SelfEmploymentIncome, ItemizedDeductions, TaxCredits,
+    W2Income, Form1099, SelfEmploymentIncome, ItemizedDeductions, TaxCredits,
     gaap_round
 )
-from ..core.config import (
-    TAX_BRACKETS_2025, STANDARD_DEDUCTIONS_2025,
-    ADDITIONAL_STANDARD_DEDUCTION_2025, get_settings
+from ..core.config import get_settings
+from ..core.tax_tables import (
+    TAX_BRACKETS_2025, TOP_BRACKET_THRESHOLD, STANDARD_DEDUCTIONS_2025,
+    ADDITIONAL_STANDARD_DEDUCTION_2025, bracket_liability
 )
 
 
@@ -33,53 +43,553 @@ class TaxBracket:
     rate: Decimal
 
 
+# ===========================================
+# FIXED-POINT (INTEGER CENTS) HELPERS
+# ===========================================
+# Hot loops run on int cents; Decimal is only used at the boundaries.
+CENTS = Decimal("0.01")
+BASIS_POINTS = 10000
+
+
+def to_cents(amount: Decimal) -> int:
+    """Convert a dollar amount to int cents (half-up)"""
+    if isinstance(amount, int):  # sum() over an empty list
+        return amount * 100
+    return int(amount.quantize(CENTS, rounding=ROUND_HALF_UP).scaleb(2))
+
+
+def from_cents(cents: int) -> Decimal:
+    """Convert int cents back to a 2-place Decimal dollar amount"""
+    return Decimal(cents).scaleb(-2)
+
+
+def _apply_rate_bp(cents: int, rate_bp: int) -> int:
+    """cents * rate, rounded half-up (away from zero) to the cent (GAAP)"""
+    if cents < 0:
+        return -_apply_rate_bp(-cents, rate_bp)
+    return (cents * rate_bp * 2 + BASIS_POINTS) // (2 * BASIS_POINTS)
+
+
+def _div_half_up(numerator: int, denominator: int) -> int:
+    """numerator / denominator rounded half-up (away from zero); denominator > 0"""
+    if numerator < 0:
+        return -_div_half_up(-numerator, denominator)
+    return (numerator * 2 + denominator) // (2 * denominator)
+
+
+# Rates (basis points) and limits (cents) for the int-cents tax kernels
+SE_NET_EARNINGS_BP = 9235       # 92.35% of net profit
+SE_SOCIAL_SECURITY_BP = 1240    # 12.4%
+SE_MEDICARE_BP = 290            # 2.9%
+SE_TAX_DEDUCTIBLE_BP = 5000     # 50% of SE tax is an adjustment
+SS_WAGE_BASE_CENTS = 168600_00  # 2025
+NIIT_BP = 380                   # 3.8%
+ADDITIONAL_MEDICARE_BP = 90     # 0.9%
+SS_BASE_THRESHOLD_CENTS = 25000_00        # Social Security taxability
+SS_ADDITIONAL_THRESHOLD_CENTS = 34000_00
+CG_RATE_15_BP = 1500
+CG_RATE_20_BP = 2000
+
+
+def _by_status(default, **overrides) -> Dict[FilingStatus, Any]:
+    """Table with an entry for every FilingStatus; overrides keyed by member name"""
+    table = {status: default for status in FilingStatus}
+    for name, value in overrides.items():
+        table[FilingStatus[name]] = value
+    return table
+
+
+# Long-term capital gains (0% max, 15% max) taxable income, 2025 (approximate)
+_CG_THRESHOLDS_CENTS = _by_status(
+    (47025_00, 291850_00),
+    SINGLE=(47025_00, 518900_00),
+    MARRIED_FILING_JOINTLY=(94050_00, 583750_00),
+)
+# MAGI thresholds for NIIT and Additional Medicare Tax
+_NIIT_THRESHOLDS_CENTS = _by_status(250000_00, SINGLE=200000_00)
+_ADDITIONAL_MEDICARE_THRESHOLDS_CENTS = _by_status(250000_00, SINGLE=200000_00)
+
+
+def _build_brackets_cents() -> Dict[FilingStatus, List[Tuple[int, int]]]:
+    """
+    TAX_BRACKETS_2025 as (upper_threshold_cents, rate_basis_points) per
+    filing status. The open-ended top bracket gets an effectively
+    unbounded threshold; statuses without a schedule use single.
+    """
+    table = {}
+    for status in FilingStatus:
+        brackets = TAX_BRACKETS_2025.get(status.value, TAX_BRACKETS_2025["single"])
+        table[status] = [
+            (
+                sys.maxsize if threshold == TOP_BRACKET_THRESHOLD else int(threshold) * 100,
+                round(rate * BASIS_POINTS)
+            )
+            for threshold, rate in brackets
+        ]
+    return table
+
+
+_BRACKETS_CENTS = _build_brackets_cents()
+
+# Decimal views of the config tables, keyed by FilingStatus, for callers
+# outside the engine that stay in Decimal (the routers and the deduction
+# optimizer), converted once here instead of Decimal(str(...)) per
+# iteration. The top bracket's threshold becomes Decimal("Infinity") so
+# is_finite() still marks it open-ended.
+TAX_BRACKETS_DEC: Dict[FilingStatus, List[Tuple[Decimal, Decimal]]] = {
+    status: [
+        (
+            Decimal("Infinity") if threshold == TOP_BRACKET_THRESHOLD else Decimal(threshold),
+            Decimal(str(rate))
+        )
+        for threshold, rate in TAX_BRACKETS_2025.get(status.value, TAX_BRACKETS_2025["single"])
+    ]
+    for status in FilingStatus
+}
+STANDARD_DEDUCTIONS_DEC: Dict[FilingStatus, Decimal] = {
+    status: Decimal(STANDARD_DEDUCTIONS_2025.get(status.value, 14600))
+    for status in FilingStatus
+}
+
+# Standard deduction tables in cents, keyed by FilingStatus member (no
+# .value / .get per lookup). Statuses missing from the config table get
+# the 14600 default, as before.
+_STANDARD_DEDUCTION_CENTS: Dict[FilingStatus, int] = {
+    status: STANDARD_DEDUCTIONS_2025.get(status.value, 14600) * 100
+    for status in FilingStatus
+}
+_ADDITIONAL_DEDUCTION_CENTS: Dict[FilingStatus, int] = {
+    status: ADDITIONAL_STANDARD_DEDUCTION_2025[
+        "single" if status in (FilingStatus.SINGLE, FilingStatus.HEAD_OF_HOUSEHOLD) else "married"
+    ] * 100
+    for status in FilingStatus
+}
+
+
+# ===========================================
+# DECIMAL CONSTANTS
+# ===========================================
+# Built once at import; Decimal("...") parses its string on every call.
+_D_ZERO = Decimal("0")
+_D_ONE = Decimal("1")
+_D_THOUSAND = Decimal("1000")
+
+_D_EDUCATOR_EXPENSE_MAX = Decimal("300")
+_D_STUDENT_LOAN_INTEREST_MAX = Decimal("2500")
+_D_MEDICAL_AGI_FLOOR = Decimal("0.075")
+_D_CHARITABLE_AGI_LIMIT = Decimal("0.60")
+_D_QBI_RATE = Decimal("0.20")
+_D_QBI_THRESHOLD_SINGLE = Decimal("191950")
+_D_QBI_THRESHOLD_OTHER = Decimal("383900")
+_D_TIPS_PHASEOUT_RATE = Decimal("0.10")
+_D_OTHER_DEPENDENT_CREDIT = Decimal("500")
+
+# EIC (max AGI, max credit) by (married filing jointly, qualifying children capped at 3), 2025 (approximate)
+_EIC_LIMITS: Dict[Tuple[bool, int], Tuple[Decimal, Decimal]] = {
+    (True, 3): (Decimal("63398"), Decimal("7830")),
+    (True, 2): (Decimal("59478"), Decimal("6960")),
+    (True, 1): (Decimal("53120"), Decimal("4213")),
+    (True, 0): (Decimal("24210"), Decimal("632")),
+    (False, 3): (Decimal("56838"), Decimal("7830")),
+    (False, 2): (Decimal("52918"), Decimal("6960")),
+    (False, 1): (Decimal("46560"), Decimal("4213")),
+    (False, 0): (Decimal("17640"), Decimal("632")),
+}
+
+
+# ===========================================
+# GENERATED PER-STATUS BRACKET FUNCTIONS
+# ===========================================
+def _build_bracket_tax_fn(status: FilingStatus, brackets: List[Tuple[int, int]]) -> Callable[[int], int]:
+    """
+    Generate straight-line bracket tax for one schedule (int cents in, int
+    cents out). Every bracket folds to one compare and
+    (income * 2 * rate + k) // (2 * BASIS_POINTS), where k carries the
+    tax of the brackets below and the half-up rounding offset, so the
+    cents * basis points total is still rounded once. Same results as
+    walking the table: every full bracket is whole dollars times a
+    whole-percent rate, so only the top partial bracket can carry a
+    fraction of a cent.
+    """
+    name = f"_bracket_tax_{status.name.lower()}"
+    lines = [f"def {name}(income):", "    if income <= 0:", "        return 0"]
+
+    accumulated_bp = 0
+    previous_threshold = 0
+    for threshold, rate_bp in brackets:
+        k = accumulated_bp * 2 + BASIS_POINTS - previous_threshold * 2 * rate_bp
+        step = f"(income * {2 * rate_bp} + {k}) // {2 * BASIS_POINTS}"
+        if threshold == sys.maxsize:  # open-ended top bracket
+            lines.append(f"    income = min(income, {threshold})")
+            lines.append(f"    return {step}")
+            break
+        lines.append(f"    if income <= {threshold}:")
+        lines.append(f"        return {step}")
+        accumulated_bp += (threshold - previous_threshold) * rate_bp
+        previous_threshold = threshold
+
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace)
+    return namespace[name]
+
+
+_BRACKET_TAX_FNS: Dict[FilingStatus, Callable[[int], int]] = {
+    status: _build_bracket_tax_fn(status, brackets)
+    for status, brackets in _BRACKETS_CENTS.items()
+}
+
+
+# ===========================================
+# JIT BRACKET KERNEL (optional numba)
+# ===========================================
+def _bracket_tax_int(income, thresholds, rates_bp):
+    """
+    Bracket tax on int cents over parallel int64 arrays; income must be >= 0.
+    Accumulates cents * basis points and rounds half-up once at the end.
+    Used per element by the batch kernel; scalar calls go through the
+    generated _BRACKET_TAX_FNS.
+    """
+    tax_bp = 0
+    previous_threshold = 0
+    for i in range(thresholds.shape[0]):
+        if income <= previous_threshold:
+            break
+        upper = thresholds[i]
+        if income < upper:
+            upper = income
+        tax_bp += (upper - previous_threshold) * rates_bp[i]
+        previous_threshold = thresholds[i]
+    return (tax_bp * 2 + BASIS_POINTS) // (2 * BASIS_POINTS)
+
+
+# Largest income the int64 kernel handles without overflowing cents * rate * 2
+_JIT_MAX_INCOME_CENTS = np.iinfo(np.int64).max // (2 * BASIS_POINTS)
+
+if numba is not None:
+    _bracket_tax_jit = numba.njit(
+        numba.int64(numba.int64, numba.int64[:], numba.int64[:]),
+        cache=True
+    )(_bracket_tax_int)
+else:
+    _bracket_tax_jit = None
+
+# Bracket tables stacked as [status index, bracket] int64 arrays for the
+# batch kernel; shorter schedules are padded with their open-ended top
+# bracket, which the walk never gets past
+_BRACKET_COUNT = max(len(brackets) for brackets in _BRACKETS_CENTS.values())
+_BRACKET_THRESHOLDS_2D = np.array(
+    [
+        [threshold for threshold, _ in brackets] + [brackets[-1][0]] * (_BRACKET_COUNT - len(brackets))
+        for brackets in (_BRACKETS_CENTS[status] for status in FilingStatus)
+    ],
+    dtype=np.int64
+)
+_BRACKET_RATES_2D = np.array(
+    [
+        [rate_bp for _, rate_bp in brackets] + [brackets[-1][1]] * (_BRACKET_COUNT - len(brackets))
+        for brackets in (_BRACKETS_CENTS[status] for status in FilingStatus)
+    ],
+    dtype=np.int64
+)
+
+# Below this many incomes the serial kernel beats spinning up threads
+_PARALLEL_MIN_BATCH = 4096
+
+if numba is not None:
+    def _bracket_tax_batch_int(incomes, status_idx, thresholds, rates_bp):
+        """_bracket_tax_int over parallel income / status index arrays"""
+        tax = np.empty(incomes.shape[0], dtype=np.int64)
+        for i in numba.prange(incomes.shape[0]):
+            tax[i] = _bracket_tax_jit(incomes[i], thresholds[status_idx[i]], rates_bp[status_idx[i]])
+        return tax
+
+    _BATCH_SIGNATURE = numba.int64[:](
+        numba.int64[:], numba.int64[:], numba.int64[:, :], numba.int64[:, :]
+    )
+    _bracket_tax_batch_parallel = numba.njit(
+        _BATCH_SIGNATURE, parallel=True, cache=True
+    )(_bracket_tax_batch_int)
+    _bracket_tax_batch_serial = numba.njit(
+        _BATCH_SIGNATURE, cache=True
+    )(_bracket_tax_batch_int)
+else:
+    _bracket_tax_batch_parallel = _bracket_tax_batch_serial = None
+
+
+# ===========================================
+# 1099 BUCKETING
+# ===========================================
+def _bucket_1099s(forms: List[Form1099]) -> Tuple[Decimal, Decimal, Decimal]:
+    """
+    Sum 1099 amounts into (interest, dividends, other) in one pass.
+
+    Deliberately a plain loop: the amounts live on pydantic objects, so a
+    NumPy bincount first has to pull every amount and type out in Python
+    (np.fromiter), which costs 2-3x this loop even at N=1000, and float64
+    weights would not keep the sums exact to the cent.
+    """
+    interest = dividends = other = _D_ZERO
+    for f in forms:
+        form_type = f.form_type
+        if form_type == "1099-INT":
+            interest += f.amount
+        elif form_type == "1099-DIV":
+            dividends += f.amount
+        else:
+            other += f.amount
+    return interest, dividends, other
+
+
+# ===========================================
+# RETURN SNAPSHOT
+# ===========================================
+@dataclass(slots=True)
+class _ReturnSnapshot:
+    """
+    Values derived from a TaxReturn's computed properties that the engine
+    reads several times per calculation, taken once (see TaxEngine._snapshot)
+    """
+    total_w2_wages: Decimal
+    earned_income: Decimal  # W-2 wages + Schedule C net profit
+    is_senior: bool
+    qualifying_children_count: int
+    other_dependents_count: int
+
+
+# ===========================================
+# BATCH (COLUMNAR) INPUTS
+# ===========================================
+# Filing statuses are carried as small ints in batch arrays
+_STATUS_ORDER: Tuple[FilingStatus, ...] = tuple(FilingStatus)
+_STATUS_INDEX: Dict[FilingStatus, int] = {status: i for i, status in enumerate(_STATUS_ORDER)}
+_MFJ_INDEX = _STATUS_INDEX[FilingStatus.MARRIED_FILING_JOINTLY]
+
+# Base standard deduction (cents) by status index, for one-gather lookups
+# over a column of status indices
+_STANDARD_DEDUCTION_ARRAY = np.array(
+    [_STANDARD_DEDUCTION_CENTS[status] for status in _STATUS_ORDER], dtype=np.int64
+)
+
+# NIIT thresholds by status index; EIC limits by [is_joint, min(children, 3)]
+_NIIT_THRESHOLD_ARRAY = np.array(
+    [_NIIT_THRESHOLDS_CENTS[status] for status in _STATUS_ORDER], dtype=np.int64
+)
+_EIC_MAX_AGI_ARRAY = np.array(
+    [[to_cents(_EIC_LIMITS[joint, children][0]) for children in range(4)] for joint in (False, True)],
+    dtype=np.int64
+)
+_EIC_MAX_CREDIT_ARRAY = np.array(
+    [[to_cents(_EIC_LIMITS[joint, children][1]) for children in range(4)] for joint in (False, True)],
+    dtype=np.int64
+)
+
+# One row per return from TaxEngine.calculate_batch, amounts in int cents
+BATCH_RESULT_DTYPE = np.dtype([
+    ("child_tax_credit", np.int64),
+    ("child_tax_credit_refundable", np.int64),
+    ("earned_income_credit", np.int64),
+    ("niit", np.int64),
+])
+
+
+@dataclass(slots=True)
+class BatchedReturns:
+    """
+    Inputs of the credit/NIIT formulas for many returns as parallel int64
+    arrays (structure of arrays), amounts in int cents
+    """
+    agi: np.ndarray
+    filing_status: np.ndarray  # index into _STATUS_ORDER
+    num_children: np.ndarray  # CTC-qualifying children
+    earned_income: np.ndarray
+    investment_income: np.ndarray
+
+
+def _apply_rate_bp_array(cents: np.ndarray, rate_bp: int) -> np.ndarray:
+    """Element-wise _apply_rate_bp (half-up away from zero)"""
+    return np.sign(cents) * ((np.abs(cents) * rate_bp * 2 + BASIS_POINTS) // (2 * BASIS_POINTS))
+
+
+# ===========================================
+# FUSED SECONDARY-TAX KERNEL (optional numba)
+# ===========================================
+# Thresholds by status index, read by the kernel as frozen globals
+_CG_THRESHOLDS_ARRAY = np.array(
+    [_CG_THRESHOLDS_CENTS[status] for status in _STATUS_ORDER], dtype=np.int64
+)
+_ADDITIONAL_MEDICARE_THRESHOLD_ARRAY = np.array(
+    [_ADDITIONAL_MEDICARE_THRESHOLDS_CENTS[status] for status in _STATUS_ORDER], dtype=np.int64
+)
+
+
+def _secondary_taxes_int(taxable_income, long_term_gains, agi, investment_income,
+                         earned_income, status_idx):
+    """
+    (capital gains tax, NIIT, Additional Medicare Tax) in int cents.
+
+    The three share one shape (threshold compare, min, basis-point rate,
+    half-up), so they are computed in one call; the results match
+    _capital_gains_tax_cents, _niit_cents and
+    _additional_medicare_tax_cents. Inputs must be within
+    _JIT_MAX_INCOME_CENTS in magnitude.
+    """
+    half = 2 * BASIS_POINTS
+
+    cap_gains_tax = 0
+    if long_term_gains > 0 and taxable_income > _CG_THRESHOLDS_ARRAY[status_idx, 0]:
+        if taxable_income <= _CG_THRESHOLDS_ARRAY[status_idx, 1]:
+            cap_gains_tax = (long_term_gains * CG_RATE_15_BP * 2 + BASIS_POINTS) // half
+        else:
+            cap_gains_tax = (long_term_gains * CG_RATE_20_BP * 2 + BASIS_POINTS) // half
+
+    niit = 0
+    threshold = _NIIT_THRESHOLD_ARRAY[status_idx]
+    if agi > threshold:
+        niit_base = min(investment_income, agi - threshold)
+        if niit_base < 0:  # net investment loss; round away from zero
+            niit = -((-niit_base * NIIT_BP * 2 + BASIS_POINTS) // half)
+        else:
+            niit = (niit_base * NIIT_BP * 2 + BASIS_POINTS) // half
+
+    additional_medicare = 0
+    threshold = _ADDITIONAL_MEDICARE_THRESHOLD_ARRAY[status_idx]
+    if earned_income > threshold:
+        additional_medicare = ((earned_income - threshold) * ADDITIONAL_MEDICARE_BP * 2 + BASIS_POINTS) // half
+
+    return cap_gains_tax, niit, additional_medicare
+
+
+if numba is not None:
+    _secondary_taxes_jit = numba.njit(
+        numba.types.UniTuple(numba.int64, 3)(
+            numba.int64, numba.int64, numba.int64, numba.int64, numba.int64, numba.int64
+        ),
+        cache=True
+    )(_secondary_taxes_int)
+else:
+    _secondary_taxes_jit = None
+
+
+# ===========================================
+# FINAL TAX RESULT
+# ===========================================
+@dataclass(slots=True)
+class FinalTaxResult:
+    """
+    Complete calculation for one return (TaxEngine.calculate_final_tax).
+    Amounts are GAAP-rounded Decimals.
+    """
+    gross_income: Decimal
+    adjustments: Decimal
+    adjusted_gross_income: Decimal
+    deduction_type: str
+    deduction_amount: Decimal
+    taxable_income: Decimal
+    tax_liability: Decimal
+    total_nonrefundable_credits: Decimal
+    total_refundable_credits: Decimal
+    tax_after_credits: Decimal
+    total_payments: Decimal
+    federal_withheld: Decimal
+    estimated_payments: Decimal
+    refund_amount: Decimal
+    amount_owed: Decimal
+    # OBBBA specific
+    tips_deduction: Decimal
+    overtime_deduction: Decimal
+    child_tax_credit: Decimal
+    total_credits: Decimal
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Field name -> value, in declaration order (the former dict shape)"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+# ===========================================
+# PER-CALCULATION MEMOIZATION
+# ===========================================
+def _memoized(method: Callable) -> Callable:
+    """
+    Cache a TaxEngine method's result for the duration of one
+    calculate_final_tax call, keyed by method name and positional
+    arguments (TaxReturn arguments by identity). Keyword arguments are
+    precomputed inputs the method would otherwise derive from the
+    positional ones, so they are not part of the key. Outside that scope
+    the method runs uncached, so a long-lived engine never sees stale
+    results when a return is mutated between calls.
+    """
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        memo = self._memo
+        if memo is None:
+            return method(self, *args, **kwargs)
+        key = (name,) + tuple(id(a) if isinstance(a, TaxReturn) else a for a in args)
+        try:
+            return memo[key]
+        except KeyError:
+            result = memo[key] = method(self, *args, **kwargs)
+            return result
+
+    return wrapper
+
+
 # ===========================================
 # OBBBA PROVISIONS (One Big Beautiful Bill Act)
 # ===========================================
-class OBBBAProvisions:
+class OBBBAProvisions(NamedTuple):
     """
     One Big Beautiful Bill Act Tax Provisions
     Agent Lliset's Knowledge Base
+
+    Immutable; use the shared OBBBA instance. Field access on a NamedTuple
+    is an index load instead of a class __dict__ lookup.
     """
 
     # Child Tax Credit (Section: Child and Family Tax Credits)
-    CTC_AMOUNT = Decimal("2200")  # Per qualifying child under 17
-    CTC_REFUNDABLE = Decimal("1700")  # Refundable portion
-    CTC_PHASEOUT_SINGLE = Decimal("200000")
-    CTC_PHASEOUT_JOINT = Decimal("400000")
-    CTC_PHASEOUT_RATE = Decimal("50")  # Per $1,000 over threshold
+    CTC_AMOUNT: Decimal = Decimal("2200")  # Per qualifying child under 17
+    CTC_REFUNDABLE: Decimal = Decimal("1700")  # Refundable portion
+    CTC_PHASEOUT_SINGLE: Decimal = Decimal("200000")
+    CTC_PHASEOUT_JOINT: Decimal = Decimal("400000")
+    CTC_PHASEOUT_RATE: Decimal = Decimal("50")  # Per $1,000 over threshold
 
     # Trump Accounts (MAGA Accounts)
-    TRUMP_ACCOUNT_SEED = Decimal("1000")  # Government contribution at birth
-    TRUMP_ACCOUNT_ANNUAL_LIMIT = Decimal("5000")
+    TRUMP_ACCOUNT_SEED: Decimal = Decimal("1000")  # Government contribution at birth
+    TRUMP_ACCOUNT_ANNUAL_LIMIT: Decimal = Decimal("5000")
 
     # No Tax on Tips
-    TIPS_DEDUCTION_MAX = Decimal("25000")
-    TIPS_PHASEOUT_SINGLE = Decimal("160000")
-    TIPS_PHASEOUT_JOINT = Decimal("320000")
+    TIPS_DEDUCTION_MAX: Decimal = Decimal("25000")
+    TIPS_PHASEOUT_SINGLE: Decimal = Decimal("160000")
+    TIPS_PHASEOUT_JOINT: Decimal = Decimal("320000")
 
     # No Tax on Overtime
-    OVERTIME_DEDUCTION_MAX_HOURLY = Decimal("10000")  # Hourly workers
-    OVERTIME_DEDUCTION_MAX_SALARY = Decimal("25000")  # For < $100k salary
-    OVERTIME_SALARY_THRESHOLD = Decimal("100000")
+    OVERTIME_DEDUCTION_MAX_HOURLY: Decimal = Decimal("10000")  # Hourly workers
+    OVERTIME_DEDUCTION_MAX_SALARY: Decimal = Decimal("25000")  # For < $100k salary
+    OVERTIME_SALARY_THRESHOLD: Decimal = Decimal("100000")
 
     # Auto Loan Interest Deduction
-    AUTO_LOAN_INTEREST_MAX = Decimal("10000")
-    AUTO_LOAN_AMERICAN_MADE_ONLY = True
+    AUTO_LOAN_INTEREST_MAX: Decimal = Decimal("10000")
+    AUTO_LOAN_AMERICAN_MADE_ONLY: bool = True
 
     # Senior Citizens Deduction
-    SENIOR_DEDUCTION = Decimal("6000")  # Age 65+ not itemizing
-    SENIOR_AGE_THRESHOLD = 65
+    SENIOR_DEDUCTION: Decimal = Decimal("6000")  # Age 65+ not itemizing
+    SENIOR_AGE_THRESHOLD: int = 65
 
     # Social Security (No Tax on Social Security)
-    SS_TAX_EXEMPT = True  # Social Security benefits tax-free
+    SS_TAX_EXEMPT: bool = True  # Social Security benefits tax-free
 
     # SALT Deduction Cap
-    SALT_CAP = Decimal("40000")  # Increased from $10,000
-    SALT_REVERT_YEAR = 2030  # Reverts to $10,000
+    SALT_CAP: Decimal = Decimal("40000")  # Increased from $10,000
+    SALT_REVERT_YEAR: int = 2030  # Reverts to $10,000
 
     # Estate Tax Exemption
-    ESTATE_TAX_EXEMPTION = Decimal("15000000")  # $15 million permanent
+    ESTATE_TAX_EXEMPTION: Decimal = Decimal("15000000")  # $15 million permanent
+
+
+OBBBA = OBBBAProvisions()
+
+_SENIOR_DEDUCTION_CENTS = to_cents(OBBBA.SENIOR_DEDUCTION)
 
 
 # ===========================================
@@ -94,91 +604,145 @@ class TaxEngine:
     def __init__(self, tax_year: int = 2025):
         self.tax_year = tax_year
         self.settings = get_settings()
-        self.obbba = OBBBAProvisions()
+        self.obbba = OBBBA
+        self._memo: Optional[Dict[Tuple, Any]] = None
+
+    def reset_cache(self):
+        """Drop memoized sub-results (see calculate_final_tax)"""
+        self._memo = None
 
     # ===========================================
     # GROSS INCOME CALCULATION
     # ===========================================
+    @_memoized
     def calculate_gross_income(self, tax_return: TaxReturn) -> Decimal:
         """
         Calculate gross income (IRC Section 61)
         Gross income = All income from whatever source derived
         """
-        components = []
-
         # W-2 Wages
-        w2_total = sum(w2.box_1_wages for w2 in tax_return.w2_income)
-        components.append(("W-2 Wages", w2_total))
+        subtotal = sum(w2.box_1_wages for w2 in tax_return.w2_income)
 
         # Self-Employment Income
-        se_total = sum(se.net_profit for se in tax_return.self_employment)
-        components.append(("Self-Employment", se_total))
-
-        # Tips (may be deductible under OBBBA)
-        components.append(("Tips", tax_return.tip_income))
+        se_total, _ = self._self_employment_totals(tax_return)
+        subtotal += se_total
 
-        # Overtime (may be deductible under OBBBA)
-        components.append(("Overtime", tax_return.overtime_income))
+        # Tips and Overtime (may be deductible under OBBBA)
+        subtotal += tax_return.tip_income
+        subtotal += tax_return.overtime_income
 
-        # 1099 Income
-        interest_income = sum(
-            f.amount for f in tax_return.form_1099s
-            if f.form_type == "1099-INT"
-        )
-        dividend_income = sum(
-            f.amount for f in tax_return.form_1099s
-            if f.form_type == "1099-DIV"
-        )
-        other_1099 = sum(
-            f.amount for f in tax_return.form_1099s
-            if f.form_type not in ("1099-INT", "1099-DIV")
-        )
-        components.append(("Interest", interest_income))
-        components.append(("Dividends", dividend_income))
-        components.append(("Other 1099", other_1099))
+        # 1099 Income (interest, dividends, other)
+        interest_income, dividend_income, other_1099 = self._form_1099_totals(tax_return)
+        subtotal += interest_income
+        subtotal += dividend_income
+        subtotal += other_1099
 
         # Capital Gains
-        components.append(("Short-term Capital Gains", tax_return.capital_gains_short))
-        components.append(("Long-term Capital Gains", tax_return.capital_gains_long))
+        subtotal += tax_return.capital_gains_short
+        subtotal += tax_return.capital_gains_long
 
         # Rental Income
-        components.append(("Rental Income", tax_return.rental_income))
+        subtotal += tax_return.rental_income
 
         # Social Security (OBBBA: Tax-free)
-        if self.obbba.SS_TAX_EXEMPT:
-            components.append(("Social Security (Tax-Free)", Decimal("0")))
-        else:
-            taxable_ss = self._calculate_taxable_social_security(
+        if not self.obbba.SS_TAX_EXEMPT:
+            subtotal += self._calculate_taxable_social_security(
                 tax_return.social_security_income,
-                sum(c[1] for c in components)
+                subtotal
             )
-            components.append(("Taxable Social Security", taxable_ss))
 
         # Other Income
-        components.append(("Other Income", tax_return.other_income))
+        subtotal += tax_return.other_income
+
+        return gaap_round(subtotal)
+
+    @_memoized
+    def _form_1099_totals(self, tax_return: TaxReturn) -> Tuple[Decimal, Decimal, Decimal]:
+        """(interest, dividends, other) 1099 totals in a single pass"""
+        return _bucket_1099s(tax_return.form_1099s)
+
+    @_memoized
+    def _snapshot(self, tax_return: TaxReturn) -> _ReturnSnapshot:
+        """Snapshot repeatedly-read derived values (one dependents pass)"""
+        wages, _ = self._w2_totals(tax_return)
+        se_total, _ = self._self_employment_totals(tax_return)
+
+        children = other = 0
+        for dependent in tax_return.dependents:
+            children += dependent.qualifies_for_ctc
+            other += dependent.qualifies_for_odc
+
+        return _ReturnSnapshot(
+            total_w2_wages=wages,
+            earned_income=wages + se_total,
+            is_senior=tax_return.is_senior,
+            qualifying_children_count=children,
+            other_dependents_count=other,
+        )
 
-        gross_income = sum(c[1] for c in components)
-        return gaap_round(gross_income)
+    @_memoized
+    def _w2_totals(self, tax_return: TaxReturn) -> Tuple[Decimal, Decimal]:
+        """(box 1 wages, box 2 federal withholding) over all W-2s in a single pass"""
+        wages = withheld = _D_ZERO
+        for w2 in tax_return.w2_income:
+            wages += w2.box_1_wages
+            withheld += w2.box_2_federal_withheld
+        return gaap_round(wages), withheld
+
+    @_memoized
+    def _total_federal_withheld(self, tax_return: TaxReturn) -> Decimal:
+        """W-2 plus 1099 federal withholding (TaxReturn.total_federal_withheld)"""
+        f1099_withheld = _D_ZERO
+        for f in tax_return.form_1099s:
+            f1099_withheld += f.federal_withheld
+        return gaap_round(self._w2_totals(tax_return)[1] + f1099_withheld)
+
+    @_memoized
+    def _self_employment_totals(self, tax_return: TaxReturn) -> Tuple[Decimal, Decimal]:
+        """
+        (net profit, positive net profit) over all Schedule Cs in a single
+        pass; net_profit is a computed property, so read it once per business
+        """
+        total = _D_ZERO
+        positive = _D_ZERO
+        for se in tax_return.self_employment:
+            profit = se.net_profit
+            total += profit
+            if profit > 0:
+                positive += profit
+        return total, positive
 
     # ===========================================
     # ADJUSTMENTS TO INCOME (Above-the-Line)
     # ===========================================
-    def calculate_adjustments(self, tax_return: TaxReturn) -> Decimal:
+    @_memoized
+    def calculate_adjustments(
+        self,
+        tax_return: TaxReturn,
+        *,
+        gross_income: Optional[Decimal] = None
+    ) -> Decimal:
         """
         Calculate adjustments to income (above-the-line deductions)
         These reduce AGI and are available regardless of itemizing
+
+        Pass gross_income when the caller already has it (the tips
+        phaseout needs it) to skip a second gross income pass.
         """
-        adjustments = Decimal("0")
+        if gross_income is None:
+            gross_income = self.calculate_gross_income(tax_return)
+
+        adjustments = _D_ZERO
 
         # Educator Expenses (up to $300)
-        adjustments += min(tax_return.educator_expenses, Decimal("300"))
+        adjustments += min(tax_return.educator_expenses, _D_EDUCATOR_EXPENSE_MAX)
 
         # HSA Deduction
         adjustments += tax_return.hsa_deduction
 
         # Self-Employment Tax Deduction (50% of SE tax)
-        se_tax = self._calculate_self_employment_tax(tax_return)
-        adjustments += gaap_round(se_tax * Decimal("0.5"))
+        se_tax = self._self_employment_tax_cents(tax_return)
+        adjustments += from_cents(_apply_rate_bp(se_tax, SE_TAX_DEDUCTIBLE_BP))
 
         # Self-Employed Health Insurance
         adjustments += tax_return.self_employment_health_insurance
@@ -187,7 +751,7 @@ class TaxEngine:
         adjustments += tax_return.sep_simple_qualified
 
         # Student Loan Interest (up to $2,500)
-        adjustments += min(tax_return.student_loan_interest, Decimal("2500"))
+        adjustments += min(tax_return.student_loan_interest, _D_STUDENT_LOAN_INTEREST_MAX)
 
         # IRA Deduction
         adjustments += tax_return.ira_deduction
@@ -199,7 +763,7 @@ class TaxEngine:
         # No Tax on Tips Deduction
         tips_deduction = self._calculate_tips_deduction(
             tax_return.tip_income,
-            self.calculate_gross_income(tax_return),
+            gross_income,
             tax_return.filing_status
         )
         adjustments += tips_deduction
@@ -207,7 +771,7 @@ class TaxEngine:
         # No Tax on Overtime Deduction
         overtime_deduction = self._calculate_overtime_deduction(
             tax_return.overtime_income,
-            tax_return.total_w2_wages,
+            self._snapshot(tax_return).total_w2_wages,
             tax_return.filing_status
         )
         adjustments += overtime_deduction
@@ -217,18 +781,20 @@ class TaxEngine:
     # ===========================================
     # ADJUSTED GROSS INCOME (AGI)
     # ===========================================
+    @_memoized
     def calculate_agi(self, tax_return: TaxReturn) -> Decimal:
         """
         Calculate Adjusted Gross Income
         AGI = Gross Income - Adjustments
         """
         gross_income = self.calculate_gross_income(tax_return)
-        adjustments = self.calculate_adjustments(tax_return)
+        adjustments = self.calculate_adjustments(tax_return, gross_income=gross_income)
         return gaap_round(gross_income - adjustments)
 
     # ===========================================
     # DEDUCTIONS (Standard or Itemized)
     # ===========================================
+    @_memoized
     def calculate_deduction(self, tax_return: TaxReturn) -> Tuple[Decimal, DeductionType]:
         """
         Calculate the best deduction (standard or itemized)
@@ -238,7 +804,7 @@ class TaxEngine:
         standard = self._calculate_standard_deduction(tax_return)
 
         # Calculate Itemized Deductions if provided
-        itemized = Decimal("0")
+        itemized = _D_ZERO
         if tax_return.itemized_deductions:
             itemized = self._calculate_itemized_deductions(
                 tax_return.itemized_deductions,
@@ -252,38 +818,24 @@ class TaxEngine:
 
     def _calculate_standard_deduction(self, tax_return: TaxReturn) -> Decimal:
         """Calculate standard deduction including additional amounts"""
-        # Base standard deduction
-        filing_key = tax_return.filing_status.value
-        base_deduction = Decimal(str(STANDARD_DEDUCTIONS_2025.get(filing_key, 14600)))
-
-        # Additional standard deduction for 65+ or blind
-        additional = Decimal("0")
-
-        # Taxpayer additional deduction
-        if tax_return.taxpayer.age_at_year_end >= 65:
-            if tax_return.filing_status in (FilingStatus.SINGLE, FilingStatus.HEAD_OF_HOUSEHOLD):
-                additional += Decimal(str(ADDITIONAL_STANDARD_DEDUCTION_2025["single"]))
-            else:
-                additional += Decimal(str(ADDITIONAL_STANDARD_DEDUCTION_2025["married"]))
-
-        if tax_return.taxpayer.is_blind:
-            if tax_return.filing_status in (FilingStatus.SINGLE, FilingStatus.HEAD_OF_HOUSEHOLD):
-                additional += Decimal(str(ADDITIONAL_STANDARD_DEDUCTION_2025["single"]))
-            else:
-                additional += Decimal(str(ADDITIONAL_STANDARD_DEDUCTION_2025["married"]))
-
-        # Spouse additional deduction (if MFJ)
-        if tax_return.spouse and tax_return.filing_status == FilingStatus.MARRIED_FILING_JOINTLY:
-            if tax_return.spouse.age_at_year_end >= 65:
-                additional += Decimal(str(ADDITIONAL_STANDARD_DEDUCTION_2025["married"]))
-            if tax_return.spouse.is_blind:
-                additional += Decimal(str(ADDITIONAL_STANDARD_DEDUCTION_2025["married"]))
-
-        # OBBBA Senior Deduction ($6,000 for 65+ not itemizing)
-        if tax_return.is_senior:
-            additional += self.obbba.SENIOR_DEDUCTION
-
-        return gaap_round(base_deduction + additional)
+        filing_status = tax_return.filing_status
+        taxpayer = tax_return.taxpayer
+
+        # Count 65+ / blind conditions (bools sum as ints). The taxpayer's
+        # 65+ test is the same one as the OBBBA senior deduction's.
+        taxpayer_senior = self._snapshot(tax_return).is_senior
+        conditions = taxpayer_senior + taxpayer.is_blind
+
+        # Spouse conditions count only on a joint return
+        spouse = tax_return.spouse
+        if spouse and filing_status == FilingStatus.MARRIED_FILING_JOINTLY:
+            conditions += (spouse.age_at_year_end >= 65) + spouse.is_blind
+
+        return from_cents(
+            _STANDARD_DEDUCTION_CENTS[filing_status]
+            + _ADDITIONAL_DEDUCTION_CENTS[filing_status] * conditions
+            + _SENIOR_DEDUCTION_CENTS * taxpayer_senior  # OBBBA $6,000 for 65+
+        )
 
     def _calculate_itemized_deductions(
         self,
@@ -291,11 +843,11 @@ class TaxEngine:
         agi: Decimal
     ) -> Decimal:
         """Calculate total itemized deductions with limitations"""
-        total = Decimal("0")
+        total = _D_ZERO
 
         # Medical/Dental (subject to 7.5% AGI floor)
-        medical_floor = gaap_round(agi * Decimal("0.075"))
-        medical_deduction = max(itemized.medical_dental_expenses - medical_floor, Decimal("0"))
+        medical_floor = gaap_round(agi * _D_MEDICAL_AGI_FLOOR)
+        medical_deduction = max(itemized.medical_dental_expenses - medical_floor, _D_ZERO)
         total += medical_deduction
 
         # Taxes Paid (SALT capped at $40,000 under OBBBA)
@@ -306,7 +858,8 @@ class TaxEngine:
 
         # Charitable Contributions (various limitations apply)
         # 60% AGI limit for cash, 30% for capital gain property
-        max_charitable = gaap_round(agi * Decimal("0.60"))
+        # (rounded with the total; rounding commutes with min for cent amounts)
+        max_charitable = agi * _D_CHARITABLE_AGI_LIMIT
         charitable = min(itemized.total_charitable, max_charitable)
         total += charitable
 
@@ -324,41 +877,49 @@ class TaxEngine:
     # ===========================================
     # TAXABLE INCOME
     # ===========================================
+    @_memoized
     def calculate_taxable_income(self, tax_return: TaxReturn) -> Decimal:
         """
         Calculate taxable income
         Taxable Income = AGI - Deduction - QBI Deduction
         """
-        agi = self.calculate_agi(tax_return)
         deduction, _ = self.calculate_deduction(tax_return)
 
         # QBI Deduction (Section 199A) for self-employed
-        qbi_deduction = self._calculate_qbi_deduction(tax_return, agi)
+        qbi_deduction = self._calculate_qbi_deduction(
+            tax_return, lambda: self.calculate_agi(tax_return)
+        )
 
-        taxable_income = agi - deduction - qbi_deduction
-        return gaap_round(max(taxable_income, Decimal("0")))
+        taxable_income = self.calculate_agi(tax_return) - deduction - qbi_deduction
+        return gaap_round(max(taxable_income, _D_ZERO))
 
-    def _calculate_qbi_deduction(self, tax_return: TaxReturn, agi: Decimal) -> Decimal:
+    def _calculate_qbi_deduction(
+        self,
+        tax_return: TaxReturn,
+        agi_fn: Callable[[], Decimal]
+    ) -> Decimal:
         """
         Calculate Qualified Business Income Deduction (Section 199A)
         Generally 20% of QBI for pass-through income
+
+        AGI is passed as a thunk and only evaluated for returns with QBI.
         """
         if not tax_return.self_employment:
-            return Decimal("0")
+            return _D_ZERO
 
         # Sum qualified business income
-        qbi = sum(se.net_profit for se in tax_return.self_employment if se.net_profit > 0)
+        _, qbi = self._self_employment_totals(tax_return)
 
         if qbi <= 0:
-            return Decimal("0")
+            return _D_ZERO
 
         # Simplified calculation (full calculation has more limitations)
         # 20% of QBI, limited to 20% of taxable income
-        deduction_amount = gaap_round(qbi * Decimal("0.20"))
+        deduction_amount = gaap_round(qbi * _D_QBI_RATE)
 
         # Phase-out for high income (simplified)
-        threshold = Decimal("191950") if tax_return.filing_status == FilingStatus.SINGLE else Decimal("383900")
-        if agi > threshold:
+        threshold = _D_QBI_THRESHOLD_SINGLE if tax_return.filing_status == FilingStatus.SINGLE else _D_QBI_THRESHOLD_OTHER
+        if agi_fn() > threshold:
             # Complex phase-out calculation would go here
             pass
 
@@ -374,29 +935,54 @@ class TaxEngine:
         taxable_income = self.calculate_taxable_income(tax_return)
 
         # Regular income tax
-        regular_tax = self._calculate_bracket_tax(
-            taxable_income,
+        regular_tax = self._bracket_tax_cents(
+            to_cents(taxable_income),
             tax_return.filing_status
         )
 
         # Self-employment tax
-        se_tax = self._calculate_self_employment_tax(tax_return)
+        se_tax = self._self_employment_tax_cents(tax_return)
 
-        # Capital gains tax (preferential rates)
-        cap_gains_tax = self._calculate_capital_gains_tax(
-            tax_return.capital_gains_long,
-            taxable_income,
-            tax_return.filing_status
+        # Capital gains tax (preferential rates), Net Investment Income Tax
+        # (3.8% for high earners) and Additional Medicare Tax
+        cap_gains_tax, niit, additional_medicare = self._secondary_taxes_cents(
+            tax_return, to_cents(taxable_income)
         )
 
-        # Net Investment Income Tax (3.8% for high earners)
-        niit = self._calculate_niit(tax_return)
+        total_tax = regular_tax + se_tax + cap_gains_tax + niit + additional_medicare
+        return from_cents(total_tax)
 
-        # Additional Medicare Tax
-        additional_medicare = self._calculate_additional_medicare_tax(tax_return)
+    def _secondary_taxes_cents(
+        self,
+        tax_return: TaxReturn,
+        taxable_income: int
+    ) -> Tuple[int, int, int]:
+        """
+        (capital gains tax, NIIT, Additional Medicare Tax) in int cents;
+        one fused kernel call when numba is available
+        """
+        long_term_gains = to_cents(tax_return.capital_gains_long)
+        if _secondary_taxes_jit is not None:
+            interest_income, dividend_income, _ = self._form_1099_totals(tax_return)
+            inputs = (
+                taxable_income,
+                long_term_gains,
+                to_cents(self.calculate_agi(tax_return)),
+                to_cents(
+                    interest_income + dividend_income +
+                    tax_return.capital_gains_short + tax_return.capital_gains_long +
+                    tax_return.rental_income
+                ),
+                to_cents(self._snapshot(tax_return).earned_income),
+            )
+            if max(map(abs, inputs)) <= _JIT_MAX_INCOME_CENTS:
+                return _secondary_taxes_jit(*inputs, _STATUS_INDEX[tax_return.filing_status])
 
-        total_tax = regular_tax + se_tax + cap_gains_tax + niit + additional_medicare
-        return gaap_round(total_tax)
+        return (
+            self._capital_gains_tax_cents(long_term_gains, taxable_income, tax_return.filing_status),
+            self._niit_cents(tax_return),
+            self._additional_medicare_tax_cents(tax_return),
+        )
 
     def _calculate_bracket_tax(
         self,
@@ -407,47 +993,90 @@ class TaxEngine:
         Calculate tax using progressive tax brackets
         """
         if taxable_income <= 0:
-            return Decimal("0")
+            return _D_ZERO
+        return from_cents(self._bracket_tax_cents(to_cents(taxable_income), filing_status))
 
-        brackets = TAX_BRACKETS_2025.get(filing_status.value, TAX_BRACKETS_2025["single"])
-        tax = Decimal("0")
-        previous_threshold = Decimal("0")
-
-        for threshold, rate in brackets:
-            threshold = Decimal(str(threshold))
-            rate = Decimal(str(rate))
+    @staticmethod
+    def _bracket_tax_cents(income: int, filing_status: FilingStatus) -> int:
+        """
+        Progressive bracket tax on int cents, via the straight-line function
+        generated for the status (plain int math, so exact at any size)
+        """
+        return _BRACKET_TAX_FNS[filing_status](income)
 
-            if taxable_income <= previous_threshold:
-                break
+    @staticmethod
+    def batch_bracket_tax(incomes, statuses) -> np.ndarray:
+        """
+        Bracket tax over many taxable incomes at once (planning scenarios
+        over an income grid).
+
+        incomes are int cents; statuses is one FilingStatus for all of them
+        or one per income. Returns int64 cents, element for element equal
+        to _bracket_tax_cents. With numba, large batches are split across
+        cores (prange) and small ones use the serial kernel; without it,
+        each filing status is one vectorized bracket_liability call.
+        """
+        incomes = np.ascontiguousarray(incomes, dtype=np.int64)
+        if isinstance(statuses, FilingStatus):
+            status_idx = np.full(incomes.shape[0], _STATUS_INDEX[statuses], dtype=np.int64)
+        else:
+            status_idx = np.fromiter(
+                (_STATUS_INDEX[status] for status in statuses), dtype=np.int64, count=incomes.shape[0]
+            )
 
-            taxable_in_bracket = min(taxable_income, threshold) - previous_threshold
-            if taxable_in_bracket > 0:
-                tax += gaap_round(taxable_in_bracket * rate)
+        if _bracket_tax_batch_parallel is None:
+            # Without numba: one vectorized cumulative-table lookup per
+            # filing status present in the batch
+            tax = np.empty(incomes.shape[0], dtype=np.int64)
+            for index in np.unique(status_idx):
+                in_status = status_idx == index
+                tax[in_status] = bracket_liability(_STATUS_ORDER[index], incomes[in_status])
+            return tax
+
+        if incomes.shape[0] >= _PARALLEL_MIN_BATCH:
+            kernel = _bracket_tax_batch_parallel
+        else:
+            kernel = _bracket_tax_batch_serial
+        tax = kernel(incomes, status_idx, _BRACKET_THRESHOLDS_2D, _BRACKET_RATES_2D)
 
-            previous_threshold = threshold
+        # Incomes too large for the int64 kernel take the exact int path
+        for i in np.flatnonzero(incomes > _JIT_MAX_INCOME_CENTS):
+            tax[i] = TaxEngine._bracket_tax_cents(int(incomes[i]), _STATUS_ORDER[status_idx[i]])
+        return tax
 
-        return gaap_round(tax)
+    @staticmethod
+    def batch_standard_deduction(status_idx) -> np.ndarray:
+        """
+        Base standard deduction (int64 cents, before the 65+/blind
+        additions) for a column of status indices into _STATUS_ORDER, as
+        carried in BatchedReturns.filing_status
+        """
+        return _STANDARD_DEDUCTION_ARRAY[np.asarray(status_idx, dtype=np.intp)]
 
     def _calculate_self_employment_tax(self, tax_return: TaxReturn) -> Decimal:
         """
         Calculate self-employment tax (Social Security + Medicare)
         """
-        se_income = sum(se.net_profit for se in tax_return.self_employment)
+        return from_cents(self._self_employment_tax_cents(tax_return))
+
+    @_memoized
+    def _self_employment_tax_cents(self, tax_return: TaxReturn) -> int:
+        """Self-employment tax in int cents"""
+        se_income = to_cents(self._self_employment_totals(tax_return)[0])
 
         if se_income <= 0:
-            return Decimal("0")
+            return 0
 
         # Net self-employment earnings (92.35% of net profit)
-        net_se_earnings = gaap_round(se_income * Decimal("0.9235"))
+        net_se_earnings = _apply_rate_bp(se_income, SE_NET_EARNINGS_BP)
 
         # Social Security portion (12.4% up to wage base)
-        ss_wage_base = Decimal("168600")  # 2025
-        ss_tax = gaap_round(min(net_se_earnings, ss_wage_base) * Decimal("0.124"))
+        ss_tax = _apply_rate_bp(min(net_se_earnings, SS_WAGE_BASE_CENTS), SE_SOCIAL_SECURITY_BP)
 
         # Medicare portion (2.9% on all earnings)
-        medicare_tax = gaap_round(net_se_earnings * Decimal("0.029"))
+        medicare_tax = _apply_rate_bp(net_se_earnings, SE_MEDICARE_BP)
 
-        return gaap_round(ss_tax + medicare_tax)
+        return ss_tax + medicare_tax
 
     def _calculate_capital_gains_tax(
         self,
@@ -459,43 +1088,50 @@ class TaxEngine:
         Calculate preferential tax on long-term capital gains
         Rates: 0%, 15%, 20%
         """
+        return from_cents(self._capital_gains_tax_cents(
+            to_cents(long_term_gains), to_cents(taxable_income), filing_status
+        ))
+
+    @staticmethod
+    def _capital_gains_tax_cents(
+        long_term_gains: int,
+        taxable_income: int,
+        filing_status: FilingStatus
+    ) -> int:
+        """Capital gains tax in int cents"""
         if long_term_gains <= 0:
-            return Decimal("0")
+            return 0
 
         # 2025 thresholds (approximate)
-        if filing_status == FilingStatus.SINGLE:
-            zero_rate_max = Decimal("47025")
-            fifteen_rate_max = Decimal("518900")
-        elif filing_status == FilingStatus.MARRIED_FILING_JOINTLY:
-            zero_rate_max = Decimal("94050")
-            fifteen_rate_max = Decimal("583750")
-        else:
-            zero_rate_max = Decimal("47025")
-            fifteen_rate_max = Decimal("291850")
+        zero_rate_max, fifteen_rate_max = _CG_THRESHOLDS_CENTS[filing_status]
 
         # Determine which bracket applies
         if taxable_income <= zero_rate_max:
-            return Decimal("0")
+            return 0
         elif taxable_income <= fifteen_rate_max:
-            return gaap_round(long_term_gains * Decimal("0.15"))
+            return _apply_rate_bp(long_term_gains, CG_RATE_15_BP)
         else:
-            return gaap_round(long_term_gains * Decimal("0.20"))
+            return _apply_rate_bp(long_term_gains, CG_RATE_20_BP)
 
     def _calculate_niit(self, tax_return: TaxReturn) -> Decimal:
         """
         Net Investment Income Tax (3.8%)
         Applies to investment income when MAGI exceeds threshold
         """
-        threshold = Decimal("200000") if tax_return.filing_status == FilingStatus.SINGLE else Decimal("250000")
-        agi = self.calculate_agi(tax_return)
+        return from_cents(self._niit_cents(tax_return))
+
+    def _niit_cents(self, tax_return: TaxReturn) -> int:
+        """Net Investment Income Tax in int cents"""
+        threshold = _NIIT_THRESHOLDS_CENTS[tax_return.filing_status]
+        agi = to_cents(self.calculate_agi(tax_return))
 
         if agi <= threshold:
-            return Decimal("0")
+            return 0
 
         # Calculate net investment income
-        investment_income = (
-            sum(f.amount for f in tax_return.form_1099s if f.form_type == "1099-INT") +
-            sum(f.amount for f in tax_return.form_1099s if f.form_type == "1099-DIV") +
+        interest_income, dividend_income, _ = self._form_1099_totals(tax_return)
+        investment_income = to_cents(
+            interest_income + dividend_income +
             tax_return.capital_gains_short + tax_return.capital_gains_long +
             tax_return.rental_income
         )
@@ -503,28 +1139,31 @@ class TaxEngine:
         # NIIT is 3.8% of lesser of NII or excess over threshold
         excess = agi - threshold
         niit_base = min(investment_income, excess)
-        return gaap_round(niit_base * Decimal("0.038"))
+        return _apply_rate_bp(niit_base, NIIT_BP)
 
     def _calculate_additional_medicare_tax(self, tax_return: TaxReturn) -> Decimal:
         """
         Additional Medicare Tax (0.9%)
         Applies to wages/SE income over threshold
         """
-        threshold = Decimal("200000") if tax_return.filing_status == FilingStatus.SINGLE else Decimal("250000")
+        return from_cents(self._additional_medicare_tax_cents(tax_return))
 
-        total_wages = tax_return.total_w2_wages + sum(
-            se.net_profit for se in tax_return.self_employment
-        )
+    def _additional_medicare_tax_cents(self, tax_return: TaxReturn) -> int:
+        """Additional Medicare Tax in int cents"""
+        threshold = _ADDITIONAL_MEDICARE_THRESHOLDS_CENTS[tax_return.filing_status]
+
+        total_wages = to_cents(self._snapshot(tax_return).earned_income)
 
         if total_wages <= threshold:
-            return Decimal("0")
+            return 0
 
         excess = total_wages - threshold
-        return gaap_round(excess * Decimal("0.009"))
+        return _apply_rate_bp(excess, ADDITIONAL_MEDICARE_BP)
 
     # ===========================================
     # OBBBA SPECIFIC CALCULATIONS
     # ===========================================
+    @_memoized
     def _calculate_tips_deduction(
         self,
         tip_income: Decimal,
@@ -536,7 +1175,7 @@ class TaxEngine:
         Up to $25,000 deduction with income phaseout
         """
         if tip_income <= 0:
-            return Decimal("0")
+            return _D_ZERO
 
         # Determine phaseout threshold
         if filing_status == FilingStatus.MARRIED_FILING_JOINTLY:
@@ -550,11 +1189,12 @@ class TaxEngine:
         # Apply phaseout if over threshold
         if gross_income > threshold:
             excess = gross_income - threshold
-            phaseout = gaap_round(excess * Decimal("0.10"))  # 10% phaseout rate
-            base_deduction = max(base_deduction - phaseout, Decimal("0"))
+            phaseout = gaap_round(excess * _D_TIPS_PHASEOUT_RATE)  # 10% phaseout rate
+            base_deduction = max(base_deduction - phaseout, _D_ZERO)
 
         return gaap_round(base_deduction)
 
+    @_memoized
     def _calculate_overtime_deduction(
         self,
         overtime_income: Decimal,
@@ -566,11 +1206,11 @@ class TaxEngine:
         $10,000 for hourly workers, $25,000 for salary < $100k
         """
         if overtime_income <= 0:
-            return Decimal("0")
+            return _D_ZERO
 
         # Determine max deduction based on salary level
         if total_wages >= self.obbba.OVERTIME_SALARY_THRESHOLD:
-            return Decimal("0")  # Not eligible if salary >= $100k
+            return _D_ZERO  # Not eligible if salary >= $100k
 
         max_deduction = self.obbba.OVERTIME_DEDUCTION_MAX_HOURLY
         return gaap_round(min(overtime_income, max_deduction))
@@ -585,9 +1225,9 @@ class TaxEngine:
 
         Returns: (total_credit, refundable_portion)
         """
-        num_children = tax_return.qualifying_children_count
+        num_children = self._snapshot(tax_return).qualifying_children_count
         if num_children == 0:
-            return (Decimal("0"), Decimal("0"))
+            return (_D_ZERO, _D_ZERO)
 
         agi = self.calculate_agi(tax_return)
 
@@ -605,11 +1245,11 @@ class TaxEngine:
         if agi > threshold:
             excess = agi - threshold
             # $50 reduction per $1,000 over threshold
-            reduction = gaap_round((excess / Decimal("1000")).quantize(
-                Decimal("1"), rounding=ROUND_HALF_UP
+            reduction = gaap_round((excess / _D_THOUSAND).quantize(
+                _D_ONE, rounding=ROUND_HALF_UP
             ) * self.obbba.CTC_PHASEOUT_RATE)
 
-            base_credit = max(base_credit - reduction, Decimal("0"))
+            base_credit = max(base_credit - reduction, _D_ZERO)
             base_refundable = min(base_refundable, base_credit)
 
         return (gaap_round(base_credit), gaap_round(base_refundable))
@@ -630,7 +1270,7 @@ class TaxEngine:
 
         # Other Dependent Credit ($500 per)
         credits.other_dependent_credit = gaap_round(
-            Decimal("500") * tax_return.other_dependents_count
+            _D_OTHER_DEPENDENT_CREDIT * self._snapshot(tax_return).other_dependents_count
         )
 
         # Earned Income Credit (simplified)
@@ -654,54 +1294,48 @@ class TaxEngine:
         Simplified Earned Income Credit calculation
         Full calculation requires detailed earned income and AGI checks
         """
-        # Basic eligibility check
-        agi = self.calculate_agi(tax_return)
-        earned_income = tax_return.total_w2_wages + sum(
-            se.net_profit for se in tax_return.self_employment
-        )
+        # Basic eligibility check (before the AGI lookup)
+        snapshot = self._snapshot(tax_return)
+        earned_income = snapshot.earned_income
 
         if earned_income <= 0:
-            return Decimal("0")
+            return _D_ZERO
 
-        num_children = tax_return.qualifying_children_count
+        agi = self.calculate_agi(tax_return)
+        num_children = snapshot.qualifying_children_count
 
         # 2025 EIC thresholds (approximate)
-        if tax_return.filing_status == FilingStatus.MARRIED_FILING_JOINTLY:
-            if num_children >= 3:
-                max_agi, max_credit = Decimal("63398"), Decimal("7830")
-            elif num_children == 2:
-                max_agi, max_credit = Decimal("59478"), Decimal("6960")
-            elif num_children == 1:
-                max_agi, max_credit = Decimal("53120"), Decimal("4213")
-            else:
-                max_agi, max_credit = Decimal("24210"), Decimal("632")
-        else:
-            if num_children >= 3:
-                max_agi, max_credit = Decimal("56838"), Decimal("7830")
-            elif num_children == 2:
-                max_agi, max_credit = Decimal("52918"), Decimal("6960")
-            elif num_children == 1:
-                max_agi, max_credit = Decimal("46560"), Decimal("4213")
-            else:
-                max_agi, max_credit = Decimal("17640"), Decimal("632")
+        max_agi, max_credit = _EIC_LIMITS[
+            tax_return.filing_status == FilingStatus.MARRIED_FILING_JOINTLY, min(num_children, 3)
+        ]
 
         if agi > max_agi:
-            return Decimal("0")
+            return _D_ZERO
 
         # Simplified credit calculation (actual uses tables)
-        return gaap_round(max_credit * (Decimal("1") - (agi / max_agi)))
+        return gaap_round(max_credit * (_D_ONE - (agi / max_agi)))
 
     # ===========================================
     # FINAL TAX CALCULATION
     # ===========================================
-    def calculate_final_tax(self, tax_return: TaxReturn) -> Dict[str, Decimal]:
+    def calculate_final_tax(self, tax_return: TaxReturn) -> FinalTaxResult:
         """
         Calculate complete tax return with all components
         Returns detailed breakdown of calculations
+
+        Gross income, AGI, deductions etc. are memoized for the duration
+        of the call, so each is computed once per return.
         """
+        self._memo = {}
+        try:
+            return self._calculate_final_tax(tax_return)
+        finally:
+            self.reset_cache()
+
+    def _calculate_final_tax(self, tax_return: TaxReturn) -> FinalTaxResult:
         # Calculate all components
         gross_income = self.calculate_gross_income(tax_return)
-        adjustments = self.calculate_adjustments(tax_return)
+        adjustments = self.calculate_adjustments(tax_return, gross_income=gross_income)
         agi = self.calculate_agi(tax_return)
         deduction, deduction_type = self.calculate_deduction(tax_return)
         taxable_income = self.calculate_taxable_income(tax_return)
@@ -713,11 +1347,11 @@ class TaxEngine:
         total_refundable = credits.total_refundable
 
         # Nonrefundable credits can only reduce tax to zero
-        tax_after_nonrefundable = max(tax_liability - total_nonrefundable, Decimal("0"))
+        tax_after_nonrefundable = max(tax_liability - total_nonrefundable, _D_ZERO)
 
         # Calculate total payments
         total_payments = (
-            tax_return.total_federal_withheld +
+            self._total_federal_withheld(tax_return) +
             tax_return.estimated_payments +
             tax_return.amount_paid_with_extension +
             total_refundable
@@ -726,36 +1360,131 @@ class TaxEngine:
         # Final balance
         if total_payments >= tax_after_nonrefundable:
             refund = total_payments - tax_after_nonrefundable
-            amount_owed = Decimal("0")
+            amount_owed = _D_ZERO
         else:
-            refund = Decimal("0")
+            refund = _D_ZERO
             amount_owed = tax_after_nonrefundable - total_payments
 
-        return {
-            "gross_income": gaap_round(gross_income),
-            "adjustments": gaap_round(adjustments),
-            "adjusted_gross_income": gaap_round(agi),
-            "deduction_type": deduction_type.value,
-            "deduction_amount": gaap_round(deduction),
-            "taxable_income": gaap_round(taxable_income),
-            "tax_liability": gaap_round(tax_liability),
-            "total_nonrefundable_credits": gaap_round(total_nonrefundable),
-            "total_refundable_credits": gaap_round(total_refundable),
-            "tax_after_credits": gaap_round(tax_after_nonrefundable),
-            "total_payments": gaap_round(total_payments),
-            "federal_withheld": gaap_round(tax_return.total_federal_withheld),
-            "estimated_payments": gaap_round(tax_return.estimated_payments),
-            "refund_amount": gaap_round(refund),
-            "amount_owed": gaap_round(amount_owed),
-            # OBBBA specific
-            "tips_deduction": self._calculate_tips_deduction(
+        nonrefundable_credits = gaap_round(total_nonrefundable)
+        refundable_credits = gaap_round(total_refundable)
+
+        return FinalTaxResult(
+            gross_income=gaap_round(gross_income),
+            adjustments=gaap_round(adjustments),
+            adjusted_gross_income=gaap_round(agi),
+            deduction_type=deduction_type.value,
+            deduction_amount=gaap_round(deduction),
+            taxable_income=gaap_round(taxable_income),
+            tax_liability=gaap_round(tax_liability),
+            total_nonrefundable_credits=nonrefundable_credits,
+            total_refundable_credits=refundable_credits,
+            tax_after_credits=gaap_round(tax_after_nonrefundable),
+            total_payments=gaap_round(total_payments),
+            federal_withheld=self._total_federal_withheld(tax_return),
+            estimated_payments=gaap_round(tax_return.estimated_payments),
+            refund_amount=gaap_round(refund),
+            amount_owed=gaap_round(amount_owed),
+            # OBBBA specific (memo hits: calculate_adjustments computed both)
+            tips_deduction=self._calculate_tips_deduction(
                 tax_return.tip_income, gross_income, tax_return.filing_status
             ),
-            "overtime_deduction": self._calculate_overtime_deduction(
-                tax_return.overtime_income, tax_return.total_w2_wages, tax_return.filing_status
+            overtime_deduction=self._calculate_overtime_deduction(
+                tax_return.overtime_income, self._snapshot(tax_return).total_w2_wages, tax_return.filing_status
             ),
-            "child_tax_credit": credits.child_tax_credit + credits.child_tax_credit_refundable,
-        }
+            child_tax_credit=credits.child_tax_credit + credits.child_tax_credit_refundable,
+            total_credits=nonrefundable_credits + refundable_credits,
+        )
+
+    # ===========================================
+    # BATCH CALCULATIONS
+    # ===========================================
+    def calculate_batch(self, returns: List[TaxReturn]) -> np.ndarray:
+        """
+        Child Tax Credit, EIC and NIIT for many returns at once (bulk
+        import, projection scenarios).
+
+        The per-return inputs are gathered into a BatchedReturns once; the
+        phaseout formulas then run as whole-array NumPy operations instead
+        of one Python call per return. Returns a BATCH_RESULT_DTYPE
+        structured array in int cents, matching the scalar methods.
+        """
+        batch = self._batch_inputs(returns)
+        results = np.zeros(len(returns), dtype=BATCH_RESULT_DTYPE)
+        results["child_tax_credit"], results["child_tax_credit_refundable"] = self._ctc_batch(batch)
+        results["earned_income_credit"] = self._eic_batch(batch)
+        results["niit"] = self._niit_batch(batch)
+        return results
+
+    def _batch_inputs(self, returns: List[TaxReturn]) -> BatchedReturns:
+        """Gather the columnar inputs (AGI, children, earned/investment income)"""
+        n = len(returns)
+        batch = BatchedReturns(
+            agi=np.empty(n, dtype=np.int64),
+            filing_status=np.empty(n, dtype=np.int64),
+            num_children=np.empty(n, dtype=np.int64),
+            earned_income=np.empty(n, dtype=np.int64),
+            investment_income=np.empty(n, dtype=np.int64),
+        )
+
+        self._memo = {}
+        try:
+            for i, tax_return in enumerate(returns):
+                self._memo.clear()
+                snapshot = self._snapshot(tax_return)
+                interest_income, dividend_income, _ = self._form_1099_totals(tax_return)
+
+                batch.agi[i] = to_cents(self.calculate_agi(tax_return))
+                batch.filing_status[i] = _STATUS_INDEX[tax_return.filing_status]
+                batch.num_children[i] = snapshot.qualifying_children_count
+                batch.earned_income[i] = to_cents(snapshot.earned_income)
+                batch.investment_income[i] = to_cents(
+                    interest_income + dividend_income +
+                    tax_return.capital_gains_short + tax_return.capital_gains_long +
+                    tax_return.rental_income
+                )
+        finally:
+            self.reset_cache()
+
+        return batch
+
+    def _ctc_batch(self, batch: BatchedReturns) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized calculate_child_tax_credit: (total_credit, refundable_portion)"""
+        credit = batch.num_children * to_cents(self.obbba.CTC_AMOUNT)
+        refundable = batch.num_children * to_cents(self.obbba.CTC_REFUNDABLE)
+
+        threshold = np.where(
+            batch.filing_status == _MFJ_INDEX,
+            to_cents(self.obbba.CTC_PHASEOUT_JOINT),
+            to_cents(self.obbba.CTC_PHASEOUT_SINGLE)
+        )
+        excess = np.maximum(batch.agi - threshold, 0)
+
+        # $50 reduction per $1,000 over threshold (thousands rounded half-up)
+        thousands = (excess * 2 + 1000_00) // (2 * 1000_00)
+        reduction = thousands * to_cents(self.obbba.CTC_PHASEOUT_RATE)
+
+        credit = np.maximum(credit - reduction, 0)
+        return credit, np.minimum(refundable, credit)
+
+    def _eic_batch(self, batch: BatchedReturns) -> np.ndarray:
+        """Vectorized _calculate_eic"""
+        is_joint = (batch.filing_status == _MFJ_INDEX).astype(np.intp)
+        children = np.minimum(batch.num_children, 3)
+        max_agi = _EIC_MAX_AGI_ARRAY[is_joint, children]
+        max_credit = _EIC_MAX_CREDIT_ARRAY[is_joint, children]
+
+        eligible = (batch.earned_income > 0) & (batch.agi <= max_agi)
+
+        # max_credit * (1 - agi / max_agi), rounded half-up to the cent
+        numerator = max_credit * (max_agi - batch.agi)
+        credit = (numerator * 2 + max_agi) // (2 * max_agi)
+        return np.where(eligible, credit, 0)
+
+    def _niit_batch(self, batch: BatchedReturns) -> np.ndarray:
+        """Vectorized _niit_cents"""
+        threshold = _NIIT_THRESHOLD_ARRAY[batch.filing_status]
+        niit_base = np.minimum(batch.investment_income, batch.agi - threshold)
+        return np.where(batch.agi > threshold, _apply_rate_bp_array(niit_base, NIIT_BP), 0)
 
     # ===========================================
     # HELPER METHODS
@@ -767,26 +1496,25 @@ class TaxEngine:
     ) -> Decimal:
         """Calculate taxable portion of Social Security (if not OBBBA exempt)"""
         if ss_benefits <= 0:
-            return Decimal("0")
-
-        # Provisional income = other income + 50% of SS
-        provisional = other_income + (ss_benefits * Decimal("0.5"))
-
-        # Thresholds (single filer)
-        base_threshold = Decimal("25000")
-        additional_threshold = Decimal("34000")
-
-        if provisional <= base_threshold:
-            return Decimal("0")
-        elif provisional <= additional_threshold:
-            return gaap_round(min(
-                (provisional - base_threshold) * Decimal("0.5"),
-                ss_benefits * Decimal("0.5")
-            ))
-        else:
-            taxable = min(
-                (provisional - base_threshold) * Decimal("0.5") +
-                (provisional - additional_threshold) * Decimal("0.35"),
-                ss_benefits * Decimal("0.85")
-            )
-            return gaap_round(taxable)
+            return _D_ZERO
+
+        # Work on twice the provisional income (other income + 50% of SS)
+        # so everything stays in whole cents
+        ss = to_cents(ss_benefits)
+        provisional_x2 = 2 * to_cents(other_income) + ss
+
+        # Thresholds (single filer), doubled to match
+        if provisional_x2 <= 2 * SS_BASE_THRESHOLD_CENTS:
+            return _D_ZERO
+
+        # 50% of the excess over the base threshold, capped at 50% of SS:
+        #   min((prov - base) / 2, ss / 2) = min(2*prov - 2*base, 2*ss) / 4
+        over_base_x2 = provisional_x2 - 2 * SS_BASE_THRESHOLD_CENTS
+        if provisional_x2 <= 2 * SS_ADDITIONAL_THRESHOLD_CENTS:
+            return from_cents(_div_half_up(min(over_base_x2, 2 * ss), 4))
+
+        # Plus 35% of the excess over the additional threshold, capped at
+        # 85% of SS; everything scaled by 200
+        over_additional_x2 = provisional_x2 - 2 * SS_ADDITIONAL_THRESHOLD_CENTS
+        taxable_x200 = min(50 * over_base_x2 + 35 * over_additional_x2, 170 * ss)
+        return from_cents(_div_half_up(taxable_x200, 200))
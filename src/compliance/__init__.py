@@ -18,10 +18,18 @@ from .state_authorization import (
     StateFilingType,
     AuthorizationStatus,
     STATE_EFILE_CONFIGS,
+    get_state_config,
+    get_all_states,
+    get_income_tax_states,
     state_auth_manager,
 )
 
 from .compliance_framework import (
+    # Request clock
+    now,
+    request_clock,
+    RequestClockMiddleware,
+
     # Standards
     ComplianceStandard,
     RiskLevel,
@@ -32,6 +40,7 @@ from .compliance_framework import (
     AuditLogEntry,
     AuditLogger,
     audit_logger,
+    AuditScanner,
 
     # Consent
     ConsentType,
@@ -41,6 +50,7 @@ from .compliance_framework import (
 
     # Retention
     RetentionCategory,
+    RETENTION_CATEGORY_CODES,
     DataRetentionManager,
     retention_manager,
 
@@ -56,6 +66,7 @@ from .compliance_framework import (
     compliance_checker,
 
     # Decorators
+    compliance,
     audit_access,
     require_consent,
 )
@@ -68,9 +79,15 @@ __all__ = [
     "StateFilingType",
     "AuthorizationStatus",
     "STATE_EFILE_CONFIGS",
+    "get_state_config",
+    "get_all_states",
+    "get_income_tax_states",
     "state_auth_manager",
 
     # Compliance Framework
+    "now",
+    "request_clock",
+    "RequestClockMiddleware",
     "ComplianceStandard",
     "RiskLevel",
     "AccessAction",
@@ -78,11 +95,13 @@ __all__ = [
     "AuditLogEntry",
     "AuditLogger",
     "audit_logger",
+    "AuditScanner",
     "ConsentType",
     "ConsentRecord",
     "ConsentManager",
     "consent_manager",
     "RetentionCategory",
+    "RETENTION_CATEGORY_CODES",
     "DataRetentionManager",
     "retention_manager",
     "IncidentSeverity",
@@ -92,6 +111,7 @@ __all__ = [
     "incident_manager",
     "ComplianceChecker",
     "compliance_checker",
+    "compliance",
     "audit_access",
     "require_consent",
 ]
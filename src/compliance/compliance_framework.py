@@ -12,14 +12,110 @@ Implements:
 """
 
 from enum import Enum
-from typing import Dict, List, Optional, Any
+from typing import Deque, Dict, FrozenSet, Iterator, List, Optional, Any, Set, Tuple, Union
 from datetime import datetime, timedelta
-from pydantic import BaseModel, Field, EmailStr
+from collections import Counter, OrderedDict, deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from pydantic import (
+    BaseModel, Field, EmailStr, field_serializer, field_validator, model_serializer, model_validator
+)
+from pydantic_core import to_json
+import asyncio
+import atexit
 import hashlib
+import os
+import re
 import secrets
-import json
 import logging
-from functools import wraps
+import string
+import threading
+import time
+import warnings
+from functools import lru_cache, wraps
+
+import numpy as np
+
+try:
+    import hyperscan
+except ImportError:  # Optional: pip install gonzales-tax-platform[scan]
+    hyperscan = None
+
+
+# ============================================================================
+# REQUEST CLOCK
+# ============================================================================
+
+# Set once per request so consent / retention / incident checks in the same
+# request share one clock reading instead of calling datetime.now() each time
+_request_now: ContextVar[Optional[datetime]] = ContextVar("request_now", default=None)
+
+
+def now() -> datetime:
+    """Current time: the request's clock reading inside request_clock()."""
+    return _request_now.get() or datetime.now()
+
+
+@contextmanager
+def request_clock():
+    """Pin now() to a single reading for the enclosed block (one request)."""
+    token = _request_now.set(datetime.now())
+    try:
+        yield
+    finally:
+        _request_now.reset(token)
+
+
+class RequestClockMiddleware:
+    """ASGI middleware that runs each HTTP request inside request_clock().
+
+    Only worth registering on an app whose handlers call into the
+    compliance layer; elsewhere nothing reads the pinned clock.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with request_clock():
+            await self.app(scope, receive, send)
+
+
+# ============================================================================
+# RECORD IDS
+# ============================================================================
+
+# Random ids for audit entries, consents and incidents are sliced from a
+# per-thread urandom pool: one os.urandom call per 256 ids instead of one
+# per record
+_ID_BYTES = 16
+_ID_POOL_SIZE = 4096
+_id_pool = threading.local()
+
+
+def _new_id() -> str:
+    """128-bit random hex id (same shape as secrets.token_hex(16))."""
+    buf = getattr(_id_pool, "buf", None)
+    pos = getattr(_id_pool, "pos", _ID_POOL_SIZE)
+    if buf is None or pos >= _ID_POOL_SIZE:
+        buf = _id_pool.buf = os.urandom(_ID_POOL_SIZE)
+        pos = 0
+    _id_pool.pos = pos + _ID_BYTES
+    return buf[pos:pos + _ID_BYTES].hex()
+
+
+def _reset_id_pool():
+    """Discard pooled entropy in a forked child; the parent still holds it."""
+    global _id_pool
+    _id_pool = threading.local()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_id_pool)
 
 
 # ============================================================================
@@ -75,19 +171,87 @@ class DataCategory(str, Enum):
 # AUDIT LOGGING
 # ============================================================================
 
+# action, data_categories and risk_level are packed into one int per entry
+# (AuditLogEntry.flags) so the in-memory audit buffer holds a small int
+# instead of enum references and a set object:
+#   bits 0-6   data categories, one bit each (DataCategory order)
+#   bits 7-10  action index (AccessAction order)
+#   bits 11-12 risk level index (RiskLevel order)
+_ACTIONS = tuple(AccessAction)
+_RISK_LEVELS = tuple(RiskLevel)
+_CATEGORY_BIT = {category: 1 << i for i, category in enumerate(DataCategory)}
+_CATEGORY_MASK = (1 << len(_CATEGORY_BIT)) - 1
+_ACTION_SHIFT, _ACTION_MASK = 7, 0xF << 7
+_RISK_SHIFT, _RISK_MASK = 11, 0x3 << 11
+_FLAGS_BITS = 13
+_ACTION_CODE = {action: i << _ACTION_SHIFT for i, action in enumerate(_ACTIONS)}
+_RISK_CODE = {level: i << _RISK_SHIFT for i, level in enumerate(_RISK_LEVELS)}
+# One shared frozenset per possible category bitmap, for decoding; the
+# tuples hold the same categories in DataCategory order, for serializing
+_CATEGORY_SETS = tuple(
+    frozenset(category for category, bit in _CATEGORY_BIT.items() if bits & bit)
+    for bits in range(_CATEGORY_MASK + 1)
+)
+_CATEGORY_TUPLES = tuple(
+    tuple(category for category, bit in _CATEGORY_BIT.items() if bits & bit)
+    for bits in range(_CATEGORY_MASK + 1)
+)
+
+
+def _category_bits(data_categories) -> int:
+    bits = 0
+    for category in data_categories:
+        bits |= _CATEGORY_BIT[DataCategory(category)]
+    return bits
+
+
+def pack_audit_flags(
+    action: AccessAction,
+    data_categories=(),
+    risk_level: RiskLevel = RiskLevel.LOW
+) -> int:
+    """Pack an audit entry's action, data categories and risk level."""
+    return (
+        _ACTION_CODE[AccessAction(action)]
+        | _category_bits(data_categories)
+        | _RISK_CODE[RiskLevel(risk_level)]
+    )
+
+
+# AuditLogEntry keys stored in flags rather than as fields
+_PACKED_KEYS = frozenset({"action", "data_categories", "risk_level"})
+
+
+def _keeps_key(key: str, include, exclude) -> bool:
+    """Whether a model_dump include/exclude filter keeps a top-level key."""
+    if include is not None and key not in include:
+        return False
+    if exclude is not None and key in exclude:
+        # exclude is a set, or a dict whose True values drop the whole key
+        return not (isinstance(exclude, (set, frozenset)) or exclude[key] is True)
+    return True
+
+
+def _enum_json_schema(enum_cls) -> Dict[str, Any]:
+    return {"enum": [member.value for member in enum_cls], "title": enum_cls.__name__, "type": "string"}
+
+
 class AuditLogEntry(BaseModel):
-    """Audit log entry for compliance tracking."""
-    id: str = Field(default_factory=lambda: secrets.token_hex(16))
+    """Audit log entry for compliance tracking.
+
+    action, data_categories and risk_level are accepted and serialized as
+    before, but stored packed in flags; see pack_audit_flags.
+    """
+    id: str = Field(default_factory=_new_id)
     timestamp: datetime = Field(default_factory=datetime.now)
     user_id: str
     user_email: Optional[str] = None
     user_ip: str
     user_agent: Optional[str] = None
 
-    action: AccessAction
+    flags: int = 0  # action | data categories | risk level
     resource_type: str
     resource_id: str
-    data_categories: List[DataCategory] = []
 
     success: bool = True
     error_message: Optional[str] = None
@@ -98,9 +262,155 @@ class AuditLogEntry(BaseModel):
     changes: Optional[Dict[str, Any]] = None  # For update actions
 
     # Risk assessment
-    risk_level: RiskLevel = RiskLevel.LOW
     flagged_for_review: bool = False
 
+    @field_validator("flags")
+    @classmethod
+    def _check_flags(cls, flags: int) -> int:
+        # Reject bits outside the layout and action / risk indices past the
+        # end of their enums, which .action / .risk_level could not decode
+        if (
+            flags < 0
+            or flags >> _FLAGS_BITS
+            or (flags & _ACTION_MASK) >> _ACTION_SHIFT >= len(_ACTIONS)
+            or (flags & _RISK_MASK) >> _RISK_SHIFT >= len(_RISK_LEVELS)
+        ):
+            raise ValueError(f"invalid audit flags {flags:#x}")
+        return flags
+
+    @model_validator(mode="before")
+    @classmethod
+    def _pack_flags(cls, data: Any) -> Any:
+        if isinstance(data, dict) and "flags" not in data:
+            data = dict(data)
+            if "action" not in data:
+                raise ValueError("action is required")
+            data["flags"] = pack_audit_flags(
+                data.pop("action"),
+                data.pop("data_categories", None) or (),
+                data.pop("risk_level", RiskLevel.LOW),
+            )
+        return data
+
+    @model_serializer(mode="wrap")
+    def _expand_flags(self, handler, info):
+        data = handler(self)
+        data.pop("flags", None)
+        flags = self.flags
+        include, exclude = info.include, info.exclude
+        if _keeps_key("action", include, exclude):
+            data["action"] = _ACTIONS[(flags & _ACTION_MASK) >> _ACTION_SHIFT]
+        if _keeps_key("data_categories", include, exclude):
+            data["data_categories"] = list(_CATEGORY_TUPLES[flags & _CATEGORY_MASK])
+        if _keeps_key("risk_level", include, exclude):
+            data["risk_level"] = _RISK_LEVELS[(flags & _RISK_MASK) >> _RISK_SHIFT]
+        return {key: data[key] for key in _AUDIT_WIRE_ORDER if key in data}
+
+    @classmethod
+    def __get_pydantic_json_schema__(cls, core_schema, handler):
+        """Describe the wire format (action, data_categories, risk_level)
+        rather than the packed flags field."""
+        json_schema = handler(core_schema)
+        target = handler.resolve_ref_schema(json_schema)
+        properties = target["properties"]
+        properties.pop("flags", None)
+        properties["action"] = _enum_json_schema(AccessAction)
+        properties["data_categories"] = {
+            "type": "array",
+            "items": _enum_json_schema(DataCategory),
+            "title": "Data Categories",
+            "default": [],
+        }
+        properties["risk_level"] = {**_enum_json_schema(RiskLevel), "default": RiskLevel.LOW.value}
+        target["properties"] = {key: properties[key] for key in _AUDIT_WIRE_ORDER if key in properties}
+        target["required"] = [
+            key for key in _AUDIT_WIRE_ORDER
+            if key in target.get("required", ()) or key == "action"
+        ]
+        return json_schema
+
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False):
+        """model_copy that also accepts action / data_categories / risk_level
+        in update, folding them into flags like the property setters."""
+        if update and not _PACKED_KEYS.isdisjoint(update):
+            update = dict(update)
+            flags = update.get("flags", self.flags)
+            if "action" in update:
+                flags = (flags & ~_ACTION_MASK) | _ACTION_CODE[AccessAction(update.pop("action"))]
+            if "data_categories" in update:
+                flags = (flags & ~_CATEGORY_MASK) | _category_bits(update.pop("data_categories") or ())
+            if "risk_level" in update:
+                flags = (flags & ~_RISK_MASK) | _RISK_CODE[RiskLevel(update.pop("risk_level"))]
+            update["flags"] = flags
+        return super().model_copy(update=update, deep=deep)
+
+    @property
+    def action(self) -> AccessAction:
+        return _ACTIONS[(self.flags & _ACTION_MASK) >> _ACTION_SHIFT]
+
+    @action.setter
+    def action(self, value: AccessAction):
+        self.flags = (self.flags & ~_ACTION_MASK) | _ACTION_CODE[AccessAction(value)]
+
+    @property
+    def data_categories(self) -> FrozenSet[DataCategory]:
+        return _CATEGORY_SETS[self.flags & _CATEGORY_MASK]
+
+    @data_categories.setter
+    def data_categories(self, value):
+        self.flags = (self.flags & ~_CATEGORY_MASK) | _category_bits(value)
+
+    @property
+    def risk_level(self) -> RiskLevel:
+        return _RISK_LEVELS[(self.flags & _RISK_MASK) >> _RISK_SHIFT]
+
+    @risk_level.setter
+    def risk_level(self, value: RiskLevel):
+        self.flags = (self.flags & ~_RISK_MASK) | _RISK_CODE[RiskLevel(value)]
+
+
+# Serialized field order (the audit log line format predates flags)
+_AUDIT_WIRE_ORDER = (
+    "id", "timestamp", "user_id", "user_email", "user_ip", "user_agent",
+    "action", "resource_type", "resource_id", "data_categories",
+    "success", "error_message", "session_id", "request_id", "changes",
+    "risk_level", "flagged_for_review",
+)
+
+
+# Audit entries are buffered in memory and written in batches, once this
+# many are queued or every flush interval, whichever comes first
+AUDIT_BUFFER_SIZE = 1000
+AUDIT_FLUSH_INTERVAL = 1.0  # seconds
+
+# Append-only NDJSON audit log (one JSON entry per line). Rotation is left
+# to logrotate: the flusher reopens the path when it has been moved away
+AUDIT_LOG_PATH = "audit.log"
+
+# Scatter/gather writes for the flusher where available (POSIX)
+_HAVE_WRITEV = hasattr(os, "writev")
+_IOV_MAX = os.sysconf("SC_IOV_MAX") if hasattr(os, "sysconf") else 1024
+
+# Risk classification inputs for AuditLogger.log. Entry categories are a
+# bitmap, so the high-risk test is a single mask against entry.flags
+_HIGH_RISK_CATEGORY_BITS = _category_bits((DataCategory.SSN, DataCategory.FTI))
+_ELEVATED_ACTIONS = frozenset({AccessAction.DELETE, AccessAction.EXPORT, AccessAction.TRANSMIT})
+_HIGH_RISK_LEVELS = frozenset({RiskLevel.HIGH, RiskLevel.CRITICAL})
+
+# Indexes backing AuditLogger.query_logs once audit_logs lives in Postgres.
+# Every query is bounded by timestamp, so each index leads with the equality
+# column and ends in timestamp DESC to serve ORDER BY ... LIMIT directly
+AUDIT_LOG_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS audit_logs_user_ts ON audit_logs "
+    "(user_id, timestamp DESC) INCLUDE (action, risk_level, resource_id)",
+    "CREATE INDEX IF NOT EXISTS audit_logs_resource_ts ON audit_logs "
+    "(resource_id, timestamp DESC)",
+    "CREATE INDEX IF NOT EXISTS audit_logs_flagged ON audit_logs "
+    "(timestamp) WHERE flagged_for_review",
+)
+AUDIT_QUERY_DEFAULT_DAYS = 30
+AUDIT_QUERY_DEFAULT_LIMIT = 1000
+
 
 class AuditLogger:
     """
@@ -110,50 +420,191 @@ class AuditLogger:
     - IRS Pub 1075: Track all access to FTI
     - SOC-2: Maintain detailed audit trails
     - Retain logs for 7 years
+
+    log() only queues the entry; a background thread, started on the
+    first log() in each process (so forked workers get their own),
+    flushes the queue to the log file (one write) and the database (one
+    batch insert).
+    Pending entries are flushed at interpreter exit. Async callers that
+    need an entry on disk before continuing await log_async() instead.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        buffer_size: int = AUDIT_BUFFER_SIZE,
+        flush_interval: float = AUDIT_FLUSH_INTERVAL
+    ):
         self.logger = logging.getLogger("itf.audit")
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+
+        self._init_queue()
         self._setup_handlers()
 
+    def _init_queue(self):
+        """Create the queue, its locks and the flush workers (per process)."""
+        # Unbounded on purpose: dropping audit entries is not an option
+        self._queue: Deque[AuditLogEntry] = deque()
+        self._queue_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flush_requested = threading.Event()
+        # Runs on-demand flushes for log_async off the event loop; flushes
+        # are serialized by _flush_lock, so one worker is enough
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="audit")
+        # Background flusher, started by the first log() in this process
+        self._flusher: Optional[threading.Thread] = None
+
     def _setup_handlers(self):
-        """Configure logging handlers."""
+        """Configure the audit log sink and the exit/fork hooks."""
         # In production, use secure log storage (e.g., CloudWatch, Splunk)
-        handler = logging.FileHandler("audit.log")
-        handler.setFormatter(logging.Formatter(
-            '%(asctime)s - AUDIT - %(message)s'
-        ))
-        self.logger.addHandler(handler)
+        self.log_path = AUDIT_LOG_PATH
+        # Opened by the first flush, so constructing a logger (e.g. on
+        # import) leaves no file behind
+        self._fd: Optional[int] = None
+        self._fd_id: Optional[Tuple[int, int]] = None  # (st_dev, st_ino)
+
+        # The stdlib logger is only the fallback sink for write failures
         self.logger.setLevel(logging.INFO)
 
-    def log(self, entry: AuditLogEntry):
-        """Record an audit log entry."""
-        # Determine risk level based on action and data
-        if DataCategory.SSN in entry.data_categories or DataCategory.FTI in entry.data_categories:
-            entry.risk_level = RiskLevel.HIGH
+        atexit.register(self._flush)
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._after_fork)
+
+    def _after_fork(self):
+        """Forked child (e.g. a preloaded worker): the flusher and executor
+        threads did not survive the fork and the locks may have been held
+        by them, so start over. Entries queued before the fork are the
+        parent's to write."""
+        self._init_queue()
+
+    def _start_flusher(self):
+        """Start this process's background flusher thread (once)."""
+        with self._queue_lock:
+            if self._flusher is not None:
+                return
+            self._flusher = threading.Thread(
+                target=self._flush_loop, name="audit-flush", daemon=True
+            )
+            self._flusher.start()
 
-        if entry.action in [AccessAction.DELETE, AccessAction.EXPORT, AccessAction.TRANSMIT]:
-            if entry.risk_level == RiskLevel.LOW:
-                entry.risk_level = RiskLevel.MEDIUM
+    def _flush_loop(self):
+        """Background thread: flush on the interval or when the buffer fills."""
+        while True:
+            self._flush_requested.wait(self.flush_interval)
+            self._flush_requested.clear()
+            try:
+                self._flush()
+            except Exception:
+                self.logger.exception("Audit log flush failed")
+
+    def _flush(self):
+        """Write every queued entry to the log file and database in one batch."""
+        with self._flush_lock:
+            with self._queue_lock:
+                if not self._queue:
+                    return
+                batch = list(self._queue)
+                self._queue.clear()
+
+            # pydantic-core serializes each entry (ISO datetimes, enum
+            # values) straight to bytes, without an intermediate dict or str;
+            # the lines are then gathered by writev rather than joined
+            to_json = AuditLogEntry.__pydantic_serializer__.to_json
+            bufs: List[bytes] = []
+            for entry in batch:
+                bufs.append(to_json(entry))
+                bufs.append(b"\n")
+            try:
+                self._write(bufs)
+            except OSError:
+                self.logger.exception(
+                    "Audit log write failed; %d entries follow", len(batch)
+                )
+                self.logger.error(b"".join(bufs).decode())
+
+            # In production: also write to database and SIEM
+            self._persist_to_database(batch)
+
+    def _open_log(self) -> int:
+        """Open the audit log for appending (O_APPEND: writes never interleave)."""
+        return os.open(self.log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+
+    def _ensure_open(self):
+        """Open the log, or reopen it if the path no longer names the open
+        file (moved or removed by logrotate), as
+        logging.handlers.WatchedFileHandler does."""
+        if self._fd is not None:
+            try:
+                st = os.stat(self.log_path)
+                if (st.st_dev, st.st_ino) == self._fd_id:
+                    return
+            except FileNotFoundError:
+                pass
+            os.close(self._fd)
+        self._fd = self._open_log()
+        st = os.fstat(self._fd)
+        self._fd_id = (st.st_dev, st.st_ino)
+
+    def _write(self, bufs: List[bytes]):
+        """Append a batch of NDJSON lines with as few write calls as possible.
+
+        With writev the lines go out as one scatter/gather call per
+        _IOV_MAX buffers, without first being copied into one buffer.
+        """
+        self._ensure_open()
+        if not _HAVE_WRITEV:
+            view = memoryview(b"".join(bufs))
+            while view:
+                written = os.write(self._fd, view)
+                view = view[written:]
+        else:
+            pending = [memoryview(buf) for buf in bufs]
+            start = 0
+            while start < len(pending):
+                written = os.writev(self._fd, pending[start:start + _IOV_MAX])
+                # Skip the fully written buffers; resume inside a partial one
+                while written and written >= len(pending[start]):
+                    written -= len(pending[start])
+                    start += 1
+                if written:
+                    pending[start] = pending[start][written:]
 
-        # Flag suspicious activity
-        if entry.action == AccessAction.FAILED_LOGIN:
+    def log(self, entry: AuditLogEntry):
+        """Record an audit log entry."""
+        # Determine risk level based on action and data (a failed login is
+        # always flagged as medium, even when it touched high-risk data)
+        action = entry.action
+        if action == AccessAction.FAILED_LOGIN:
             entry.flagged_for_review = True
             entry.risk_level = RiskLevel.MEDIUM
+        elif entry.flags & _HIGH_RISK_CATEGORY_BITS:
+            entry.risk_level = RiskLevel.HIGH
+        elif action in _ELEVATED_ACTIONS and entry.risk_level == RiskLevel.LOW:
+            entry.risk_level = RiskLevel.MEDIUM
 
-        # Log to file/database
-        log_data = entry.model_dump()
-        log_data['timestamp'] = entry.timestamp.isoformat()
-        self.logger.info(json.dumps(log_data))
-
-        # In production: also write to database and SIEM
-        self._persist_to_database(entry)
+        # Queue for the background flush to file/database
+        if self._flusher is None:
+            self._start_flusher()
+        with self._queue_lock:
+            self._queue.append(entry)
+            queued = len(self._queue)
+        if queued >= self.buffer_size:
+            self._flush_requested.set()
 
         return entry
 
-    def _persist_to_database(self, entry: AuditLogEntry):
-        """Persist audit log to database."""
-        # In production: save to audit_logs table
+    def log_async(self, entry: AuditLogEntry) -> "asyncio.Future":
+        """Record an entry and flush it in the audit executor.
+
+        The returned future completes once the entry has been written, so
+        awaiting it makes the entry durable without blocking the loop.
+        """
+        self.log(entry)
+        return asyncio.get_running_loop().run_in_executor(self._executor, self._flush)
+
+    def _persist_to_database(self, entries: List[AuditLogEntry]):
+        """Persist a batch of audit logs to the database."""
+        # In production: one executemany insert into the audit_logs table
         pass
 
     def query_logs(
@@ -164,10 +615,27 @@ class AuditLogger:
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
         risk_level: Optional[RiskLevel] = None,
-    ) -> List[AuditLogEntry]:
-        """Query audit logs with filters."""
-        # In production: query from database
-        return []
+        limit: Optional[int] = AUDIT_QUERY_DEFAULT_LIMIT,
+        only_high_risk: bool = False,
+        only_flagged: bool = False,
+    ) -> Iterator[AuditLogEntry]:
+        """Stream audit logs matching the filters, newest first.
+
+        The time window is always bounded (default: last 30 days) so the
+        query stays on the AUDIT_LOG_INDEXES range scans. only_high_risk
+        and only_flagged are applied in the WHERE clause, not in Python;
+        limit=None streams the whole window.
+        """
+        if start_date is None:
+            start_date = now() - timedelta(days=AUDIT_QUERY_DEFAULT_DAYS)
+        # In production: stream from a server-side cursor, e.g.
+        #   SELECT ... FROM audit_logs
+        #   WHERE user_id = :user_id AND timestamp >= :start_date [AND ...]
+        #     [AND risk_level IN ('high', 'critical')]    -- only_high_risk
+        #     [AND flagged_for_review]                    -- only_flagged
+        #   ORDER BY timestamp DESC [LIMIT :limit]
+        # and `yield from cursor` so rows are never materialized as a list
+        yield from ()
 
     def get_user_activity_report(
         self,
@@ -181,19 +649,106 @@ class AuditLogger:
         logs = self.query_logs(
             user_id=user_id,
             start_date=start_date,
-            end_date=end_date
+            end_date=end_date,
+            limit=None
         )
 
+        # One pass over the stream. With a database source, actions_by_type
+        # belongs in the query itself (SELECT action, COUNT(*) ... GROUP BY action)
+        high_risk: List[AuditLogEntry] = []
+        flagged: List[AuditLogEntry] = []
+        by_type: Counter = Counter()
+        total = 0
+        for entry in logs:
+            total += 1
+            by_type[entry.action] += 1
+            if entry.risk_level in _HIGH_RISK_LEVELS:
+                high_risk.append(entry)
+            if entry.flagged_for_review:
+                flagged.append(entry)
+
         return {
             "user_id": user_id,
             "period": f"{start_date.date()} to {end_date.date()}",
-            "total_actions": len(logs),
-            "actions_by_type": {},  # Aggregate by action type
-            "high_risk_actions": [l for l in logs if l.risk_level in [RiskLevel.HIGH, RiskLevel.CRITICAL]],
-            "flagged_actions": [l for l in logs if l.flagged_for_review],
+            "total_actions": total,
+            "actions_by_type": dict(by_type),
+            "high_risk_actions": high_risk,
+            "flagged_actions": flagged,
         }
 
 
+# Well-known compliance searches over persisted audit log lines, as
+# (pattern id, regex) pairs; ids are what AuditScanner.scan_line returns
+AUDIT_SCAN_SSN = 0
+AUDIT_SCAN_FTI = 1
+AUDIT_SCAN_ELEVATED_ACTION = 2
+AUDIT_SCAN_FAILED_LOGIN = 3
+AUDIT_SCAN_FLAGGED = 4
+
+AUDIT_SCAN_PATTERNS: Tuple[Tuple[int, bytes], ...] = (
+    (AUDIT_SCAN_SSN, rb"\b\d{3}-\d{2}-\d{4}\b"),
+    (AUDIT_SCAN_FTI, b'"' + DataCategory.FTI.value.encode() + b'"'),
+    (AUDIT_SCAN_ELEVATED_ACTION, rb'"action":"(?:delete|export|transmit)"'),
+    (AUDIT_SCAN_FAILED_LOGIN, rb'"action":"failed_login"'),
+    (AUDIT_SCAN_FLAGGED, rb'"flagged_for_review":true'),
+)
+
+
+class AuditScanner:
+    """
+    Multi-pattern matcher for audit log lines.
+
+    All patterns are compiled once into a single database and matched in
+    one pass per line: a Hyperscan block-mode database when hyperscan is
+    installed, otherwise one combined alternation regex (which reports
+    non-overlapping matches only).
+    """
+
+    def __init__(self, patterns: Tuple[Tuple[int, bytes], ...] = AUDIT_SCAN_PATTERNS):
+        self.patterns = patterns
+        if hyperscan is not None:
+            self._db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+            self._db.compile(
+                expressions=[regex for _, regex in patterns],
+                ids=[pattern_id for pattern_id, _ in patterns],
+                elements=len(patterns),
+                flags=[hyperscan.HS_FLAG_DOTALL | hyperscan.HS_FLAG_SINGLEMATCH] * len(patterns),
+            )
+            self._scratch = threading.local()
+            self._regex = None
+        else:
+            self._db = None
+            self._regex = re.compile(
+                b"|".join(b"(?P<p%d>%s)" % (pattern_id, regex) for pattern_id, regex in patterns),
+                re.DOTALL,
+            )
+
+    def scan_line(self, line: bytes) -> List[int]:
+        """Return the ids of the patterns that match the line, ascending."""
+        if self._db is None:
+            return sorted({int(m.lastgroup[1:]) for m in self._regex.finditer(line)})
+
+        matched: List[int] = []
+
+        def on_match(pattern_id, start, end, flags, context):
+            matched.append(pattern_id)
+
+        # Hyperscan scratch space is not thread-safe: one clone per thread
+        scratch = getattr(self._scratch, "scratch", None)
+        if scratch is None:
+            scratch = self._scratch.scratch = hyperscan.Scratch(self._db)
+        self._db.scan(line, match_event_handler=on_match, scratch=scratch)
+        return sorted(matched)
+
+    def scan_log(self, path: str = AUDIT_LOG_PATH):
+        """Yield (line, pattern ids) for every audit log line that matches."""
+        with open(path, "rb") as log:
+            for line in log:
+                matched = self.scan_line(line)
+                if matched:
+                    yield line, matched
+
+
 # ============================================================================
 # CONSENT MANAGEMENT (IRC §7216)
 # ============================================================================
@@ -207,7 +762,7 @@ class ConsentType(str, Enum):
 
 class ConsentRecord(BaseModel):
     """Record of taxpayer consent per IRC §7216."""
-    id: str = Field(default_factory=lambda: secrets.token_hex(16))
+    id: str = Field(default_factory=_new_id)
     taxpayer_id: str
     consent_type: ConsentType
     purpose: str
@@ -227,6 +782,27 @@ class ConsentRecord(BaseModel):
     disclosure_text_version: str
 
 
+@lru_cache(maxsize=1024)
+def _render_disclosure(
+    template: string.Template,
+    purpose: str,
+    recipient: str,
+    expiration: str
+) -> str:
+    """
+    Render the consent disclosure. Deployments repeat a small set of
+    purpose/recipient pairs and the expiration is a date, so most
+    requests are a cache hit.
+    """
+    return template.substitute(purpose=purpose, recipient=recipient, expiration=expiration)
+
+
+# At most this many taxpayers' consent histories stay in memory; the least
+# recently used are spilled to an append-only NDJSON cold tier
+CONSENT_MAX_HOT = 100_000
+CONSENT_SPILL_PATH = "consents_cold.ndjson"
+
+
 class ConsentManager:
     """
     Manages IRC §7216 consent requirements.
@@ -255,8 +831,89 @@ class ConsentManager:
     You may revoke this consent at any time by contacting us.
     """
 
-    def __init__(self):
-        self.consents: Dict[str, List[ConsentRecord]] = {}
+    # Tokenized once; see _render_disclosure
+    DISCLOSURE_TEMPLATE = string.Template(
+        DISCLOSURE_TEXT
+        .replace("{purpose}", "$purpose")
+        .replace("{recipient}", "$recipient")
+        .replace("{expiration}", "$expiration")
+    )
+
+    def __init__(
+        self,
+        max_hot: int = CONSENT_MAX_HOT,
+        spill_path: str = CONSENT_SPILL_PATH
+    ):
+        # Full, append-only consent history per hot taxpayer (audit trail),
+        # in LRU order; always go through _history() to read it
+        self.consents: OrderedDict[str, List[ConsentRecord]] = OrderedDict()
+        self.max_hot = max_hot
+        self.spill_path = spill_path
+        # Taxpayers whose history currently lives only in the cold tier
+        self._spilled: Set[str] = set()
+        # Granted, unrevoked consents by (taxpayer_id, consent_type, purpose),
+        # so check_consent is a hash probe instead of a history scan. Only
+        # hot taxpayers are indexed
+        self._active: Dict[Tuple[str, ConsentType, str], List[ConsentRecord]] = {}
+
+    def _history(self, taxpayer_id: str, create: bool = False) -> Optional[List[ConsentRecord]]:
+        """Consent history for a taxpayer, promoting it to most recently used.
+
+        Spilled histories are reloaded (and re-indexed) from the cold tier.
+        Returns None for an unknown taxpayer unless create is set.
+        """
+        history = self.consents.get(taxpayer_id)
+        if history is not None:
+            self.consents.move_to_end(taxpayer_id)
+            return history
+
+        if taxpayer_id in self._spilled:
+            history = self._load_spilled(taxpayer_id)
+            self._spilled.discard(taxpayer_id)
+            for record in history:
+                if record.granted and record.revoked_at is None:
+                    key = (taxpayer_id, record.consent_type, record.purpose)
+                    self._active.setdefault(key, []).append(record)
+        elif create:
+            history = []
+        else:
+            return None
+
+        self.consents[taxpayer_id] = history
+        if len(self.consents) > self.max_hot:
+            self._spill_lru()
+        return history
+
+    def _spill_lru(self):
+        """Move the least recently used taxpayer's history to the cold tier."""
+        taxpayer_id, history = self.consents.popitem(last=False)
+        for record in history:
+            self._active.pop((taxpayer_id, record.consent_type, record.purpose), None)
+
+        # Whole history in one O_APPEND write; on reload the latest copy of
+        # each record id wins, so re-spilled histories need no rewrite
+        if history:
+            fd = os.open(self.spill_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+            try:
+                os.write(fd, b"".join(record.model_dump_json().encode() + b"\n" for record in history))
+            finally:
+                os.close(fd)
+            self._spilled.add(taxpayer_id)
+
+    def _load_spilled(self, taxpayer_id: str) -> List[ConsentRecord]:
+        """Read a taxpayer's spilled history back (cold path: file scan)."""
+        marker = '"taxpayer_id":' + to_json(taxpayer_id).decode()
+        records: Dict[str, ConsentRecord] = {}
+        try:
+            with open(self.spill_path, encoding="utf-8") as cold:
+                for line in cold:
+                    if marker in line:  # cheap pre-filter before parsing
+                        record = ConsentRecord.model_validate_json(line)
+                        if record.taxpayer_id == taxpayer_id:
+                            records[record.id] = record
+        except FileNotFoundError:
+            pass
+        return list(records.values())
 
     def request_consent(
         self,
@@ -267,16 +924,15 @@ class ConsentManager:
         expiration_days: int = 365
     ) -> str:
         """Generate consent request and return disclosure text."""
-        expiration = datetime.now() + timedelta(days=expiration_days)
+        expiration = now() + timedelta(days=expiration_days)
 
-        disclosure = self.DISCLOSURE_TEXT.format(
-            purpose=purpose,
-            recipient=recipient or "N/A",
-            expiration=expiration.strftime("%B %d, %Y")
+        return _render_disclosure(
+            self.DISCLOSURE_TEMPLATE,
+            purpose,
+            recipient or "N/A",
+            expiration.strftime("%B %d, %Y")
         )
 
-        return disclosure
-
     def record_consent(
         self,
         taxpayer_id: str,
@@ -288,22 +944,24 @@ class ConsentManager:
         expiration_days: int = 365
     ) -> ConsentRecord:
         """Record taxpayer's consent decision."""
+        current = now()
         record = ConsentRecord(
             taxpayer_id=taxpayer_id,
             consent_type=consent_type,
             purpose=purpose,
             recipient=recipient,
             granted=granted,
-            granted_at=datetime.now(),
-            expires_at=datetime.now() + timedelta(days=expiration_days) if granted else None,
+            granted_at=current,
+            expires_at=current + timedelta(days=expiration_days) if granted else None,
             signature_method="electronic",
             signature_ip=signature_ip,
             disclosure_text_version="2025.1"
         )
 
-        if taxpayer_id not in self.consents:
-            self.consents[taxpayer_id] = []
-        self.consents[taxpayer_id].append(record)
+        self._history(taxpayer_id, create=True).append(record)
+
+        if granted:
+            self._active.setdefault((taxpayer_id, consent_type, purpose), []).append(record)
 
         return record
 
@@ -314,15 +972,15 @@ class ConsentManager:
         purpose: str
     ) -> bool:
         """Check if valid consent exists."""
-        if taxpayer_id not in self.consents:
+        if self._history(taxpayer_id) is None:
+            return False
+        active = self._active.get((taxpayer_id, consent_type, purpose))
+        if not active:
             return False
 
-        for consent in self.consents[taxpayer_id]:
-            if (consent.consent_type == consent_type and
-                consent.purpose == purpose and
-                consent.granted and
-                consent.revoked_at is None and
-                (consent.expires_at is None or consent.expires_at > datetime.now())):
+        current = now()
+        for consent in active:
+            if consent.expires_at is None or consent.expires_at > current:
                 return True
 
         return False
@@ -333,12 +991,22 @@ class ConsentManager:
         consent_id: str
     ) -> bool:
         """Revoke a previously granted consent."""
-        if taxpayer_id not in self.consents:
+        history = self._history(taxpayer_id)
+        if history is None:
             return False
 
-        for consent in self.consents[taxpayer_id]:
+        for consent in history:
             if consent.id == consent_id and consent.granted:
-                consent.revoked_at = datetime.now()
+                consent.revoked_at = now()
+
+                key = (taxpayer_id, consent.consent_type, consent.purpose)
+                active = self._active.get(key, [])
+                for i, record in enumerate(active):
+                    if record is consent:
+                        del active[i]
+                        break
+                if not active:
+                    self._active.pop(key, None)
                 return True
 
         return False
@@ -367,6 +1035,24 @@ RETENTION_PERIODS = {
     RetentionCategory.DOCUMENTS: 7 * 365,  # 7 years
     RetentionCategory.COMMUNICATIONS: 3 * 365,  # 3 years
 }
+DEFAULT_RETENTION_DAYS = 7 * 365
+
+# Retention in whole seconds, so expiry checks are one subtraction against
+# an epoch timestamp. For bulk sweeps, categories are encoded as their
+# index in RETENTION_CATEGORY_CODES and looked up in _RETENTION_SECS_ARRAY
+_RETENTION_SECS = {category: days * 86400 for category, days in RETENTION_PERIODS.items()}
+_RETENTION_DELTAS = {category: timedelta(days=days) for category, days in RETENTION_PERIODS.items()}
+RETENTION_CATEGORY_CODES = tuple(RetentionCategory)
+_RETENTION_SECS_ARRAY = np.array(
+    [_RETENTION_SECS.get(c, DEFAULT_RETENTION_DAYS * 86400) for c in RETENTION_CATEGORY_CODES],
+    dtype=np.int64,
+)
+
+
+def _epoch_now() -> float:
+    """now() as a POSIX timestamp, without building a datetime off-request."""
+    pinned = _request_now.get()
+    return pinned.timestamp() if pinned is not None else time.time()
 
 
 class DataRetentionManager:
@@ -381,17 +1067,37 @@ class DataRetentionManager:
 
     def get_retention_period(self, category: RetentionCategory) -> int:
         """Get retention period in days for a category."""
-        return RETENTION_PERIODS.get(category, 7 * 365)
+        return RETENTION_PERIODS.get(category, DEFAULT_RETENTION_DAYS)
 
     def is_retention_expired(
         self,
         category: RetentionCategory,
-        created_at: datetime
+        created_at: Union[datetime, int, float]
     ) -> bool:
-        """Check if data retention period has expired."""
-        retention_days = self.get_retention_period(category)
-        expiration = created_at + timedelta(days=retention_days)
-        return datetime.now() > expiration
+        """Check if data retention period has expired.
+
+        created_at may be a datetime or an epoch timestamp in seconds.
+        """
+        if isinstance(created_at, datetime):
+            created_at = created_at.timestamp()
+        retention_secs = _RETENTION_SECS.get(category, DEFAULT_RETENTION_DAYS * 86400)
+        return _epoch_now() - created_at > retention_secs
+
+    def expired_mask(
+        self,
+        category_codes: np.ndarray,
+        created_at: np.ndarray,
+        now_epoch: Optional[float] = None
+    ) -> np.ndarray:
+        """Vectorized is_retention_expired for bulk retention sweeps.
+
+        category_codes are indices into RETENTION_CATEGORY_CODES and
+        created_at is int64 epoch seconds; returns a boolean mask.
+        """
+        if now_epoch is None:
+            now_epoch = _epoch_now()
+        retention_secs = _RETENTION_SECS_ARRAY[category_codes]
+        return (np.int64(now_epoch) - created_at) > retention_secs
 
     def schedule_destruction(
         self,
@@ -400,8 +1106,10 @@ class DataRetentionManager:
         created_at: datetime
     ) -> datetime:
         """Schedule data for destruction after retention period."""
-        retention_days = self.get_retention_period(category)
-        destruction_date = created_at + timedelta(days=retention_days)
+        retention = _RETENTION_DELTAS.get(category)
+        if retention is None:
+            retention = timedelta(days=self.get_retention_period(category))
+        destruction_date = created_at + retention
 
         # Log the scheduled destruction
         # In production: save to destruction_schedule table
@@ -421,8 +1129,25 @@ class DataRetentionManager:
         - Electronic media: Secure wipe or physical destruction
         - Paper: Cross-cut shredding
         """
+        batch = self.execute_destruction_batch([resource_id], category, destroyed_by)
+        destruction_record = {"resource_id": resource_id, **batch}
+        del destruction_record["resource_ids"]
+        return destruction_record
+
+    def execute_destruction_batch(
+        self,
+        resource_ids: List[str],
+        category: RetentionCategory,
+        destroyed_by: str
+    ) -> Dict[str, Any]:
+        """
+        Securely destroy a batch of resources (retention sweep).
+
+        The batch shares one timestamp and verification token, recorded
+        against every resource id in a single destruction_log insert.
+        """
         destruction_record = {
-            "resource_id": resource_id,
+            "resource_ids": list(resource_ids),
             "category": category.value,
             "destroyed_at": datetime.now().isoformat(),
             "destroyed_by": destroyed_by,
@@ -430,8 +1155,11 @@ class DataRetentionManager:
             "verification": secrets.token_hex(32)
         }
 
-        # Log destruction for compliance
-        # In production: save to destruction_log table
+        # In production, one round trip each instead of one per resource:
+        #   DELETE FROM <table> WHERE id = ANY(:ids) RETURNING id
+        #   INSERT INTO destruction_log
+        #   SELECT unnest(:ids), :category, :destroyed_at, :destroyed_by,
+        #          :method, :verification
 
         return destruction_record
 
@@ -462,7 +1190,7 @@ class IncidentType(str, Enum):
 
 class SecurityIncident(BaseModel):
     """Security incident record."""
-    id: str = Field(default_factory=lambda: secrets.token_hex(16))
+    id: str = Field(default_factory=_new_id)
     severity: IncidentSeverity
     incident_type: IncidentType
     title: str
@@ -475,7 +1203,7 @@ class SecurityIncident(BaseModel):
     # Scope
     affected_systems: List[str] = []
     affected_users: List[str] = []
-    data_categories_affected: List[DataCategory] = []
+    data_categories_affected: FrozenSet[DataCategory] = frozenset()
     estimated_records_affected: int = 0
 
     # Response
@@ -490,6 +1218,19 @@ class SecurityIncident(BaseModel):
     users_notified: bool = False
     law_enforcement_notified: bool = False
 
+    @property
+    def data_categories_in_order(self) -> Tuple[DataCategory, ...]:
+        """The affected categories in DataCategory order (sets have none)"""
+        return _CATEGORY_TUPLES[_category_bits(self.data_categories_affected)]
+
+    @field_serializer("data_categories_affected")
+    def _serialize_data_categories(self, data_categories_affected) -> List[DataCategory]:
+        return list(self.data_categories_in_order)
+
+
+# Closed incidents move out of memory into this append-only NDJSON archive
+INCIDENT_ARCHIVE_PATH = "incidents_closed.ndjson"
+
 
 class IncidentResponseManager:
     """
@@ -504,8 +1245,10 @@ class IncidentResponseManager:
     IRS_INCIDENT_EMAIL = "e-help@irs.gov"
     IRS_INCIDENT_PHONE = "1-866-255-0654"
 
-    def __init__(self):
+    def __init__(self, archive_path: str = INCIDENT_ARCHIVE_PATH):
+        # Incidents that are not closed yet; closed ones are archived
         self.incidents: Dict[str, SecurityIncident] = {}
+        self.archive_path = archive_path
 
     def create_incident(
         self,
@@ -525,7 +1268,7 @@ class IncidentResponseManager:
             description=description,
             detected_by=detected_by,
             affected_systems=affected_systems or [],
-            data_categories_affected=data_categories or []
+            data_categories_affected=data_categories or frozenset()
         )
 
         self.incidents[incident.id] = incident
@@ -551,15 +1294,13 @@ class IncidentResponseManager:
         resolution: Optional[str] = None,
         assigned_to: Optional[str] = None
     ) -> SecurityIncident:
-        """Update incident status and details."""
-        incident = self.incidents.get(incident_id)
-        if not incident:
-            raise ValueError(f"Incident {incident_id} not found")
+        """Update incident status and details (closed incidents included)."""
+        incident, archived = self._find(incident_id)
 
         if status:
             incident.status = status
             if status == "resolved":
-                incident.resolved_at = datetime.now()
+                incident.resolved_at = now()
 
         if resolution:
             incident.resolution = resolution
@@ -567,8 +1308,55 @@ class IncidentResponseManager:
         if assigned_to:
             incident.assigned_to = assigned_to
 
+        if incident.status == "closed":
+            # Keep memory bounded to open incidents; an update to an
+            # archived incident appends its new version
+            self._archive(incident)
+            self.incidents.pop(incident_id, None)
+        elif archived:
+            # Reopened: open incidents live in memory again (they take
+            # precedence over their archived versions)
+            self.incidents[incident_id] = incident
+
         return incident
 
+    def _find(self, incident_id: str) -> Tuple[SecurityIncident, bool]:
+        """(incident, whether it came from the archive); raises if unknown."""
+        incident = self.incidents.get(incident_id)
+        if incident:
+            return incident, False
+        incident = self._load_archived(incident_id)
+        if not incident:
+            raise ValueError(f"Incident {incident_id} not found")
+        return incident, True
+
+    def _archive(self, incident: SecurityIncident):
+        """Append a closed incident to the archive (one O_APPEND write)."""
+        fd = os.open(self.archive_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+        try:
+            os.write(fd, incident.model_dump_json().encode() + b"\n")
+        finally:
+            os.close(fd)
+
+    def _load_archived(self, incident_id: str) -> Optional[SecurityIncident]:
+        """Find a closed incident in the archive (cold path: file scan).
+
+        Updates to archived incidents are appended, so the last version
+        in the file is the current one.
+        """
+        marker = f'"id":"{incident_id}"'
+        latest = None
+        try:
+            with open(self.archive_path, encoding="utf-8") as archive:
+                for line in archive:
+                    if marker in line:  # cheap pre-filter before parsing
+                        incident = SecurityIncident.model_validate_json(line)
+                        if incident.id == incident_id:
+                            latest = incident
+        except FileNotFoundError:
+            pass
+        return latest
+
     def notify_irs(self, incident_id: str) -> Dict[str, Any]:
         """
         Notify IRS of FTI breach.
@@ -577,32 +1365,33 @@ class IncidentResponseManager:
         - Report within 24 hours
         - Include: what happened, when, what data, remediation steps
         """
-        incident = self.incidents.get(incident_id)
-        if not incident:
-            raise ValueError(f"Incident {incident_id} not found")
+        incident, archived = self._find(incident_id)
 
+        current = now()
         notification = {
             "incident_id": incident.id,
             "notification_type": "IRS FTI Breach Report",
             "submitted_to": self.IRS_INCIDENT_EMAIL,
-            "submitted_at": datetime.now().isoformat(),
+            "submitted_at": current.isoformat(),
             "content": {
                 "incident_date": incident.detected_at.isoformat(),
                 "description": incident.description,
-                "data_affected": [d.value for d in incident.data_categories_affected],
+                "data_affected": [d.value for d in incident.data_categories_in_order],
                 "estimated_records": incident.estimated_records_affected,
                 "remediation_steps": incident.resolution or "Investigation in progress",
             }
         }
 
         incident.irs_notified = True
-        incident.irs_notification_date = datetime.now()
+        incident.irs_notification_date = current
+        if archived:
+            self._archive(incident)
 
         return notification
 
     def get_incident_report(self, incident_id: str) -> Dict[str, Any]:
         """Generate incident report for compliance documentation."""
-        incident = self.incidents.get(incident_id)
+        incident = self.incidents.get(incident_id) or self._load_archived(incident_id)
         if not incident:
             raise ValueError(f"Incident {incident_id} not found")
 
@@ -635,6 +1424,10 @@ class IncidentResponseManager:
 # COMPLIANCE CHECKER
 # ============================================================================
 
+# run_compliance_check results are reused for this long (seconds)
+COMPLIANCE_CHECK_TTL = 60.0
+
+
 class ComplianceChecker:
     """
     Overall compliance status checker.
@@ -651,11 +1444,24 @@ class ComplianceChecker:
         self.consent_manager = ConsentManager()
         self.retention_manager = DataRetentionManager()
         self.incident_manager = IncidentResponseManager()
+        self._check_cache: Optional[Tuple[float, Dict[str, Any]]] = None
 
     def run_compliance_check(self) -> Dict[str, Any]:
-        """Run comprehensive compliance check."""
+        """
+        Run comprehensive compliance check.
+
+        The checks are re-run at most every COMPLIANCE_CHECK_TTL seconds;
+        in between only the timestamp is new. The nested check dicts are
+        shared between calls, so treat the result as read-only.
+        """
+        cached = self._check_cache
+        if cached is None or time.monotonic() - cached[0] >= COMPLIANCE_CHECK_TTL:
+            cached = self._check_cache = (time.monotonic(), self._run_checks())
+        return {"timestamp": now().isoformat(), **cached[1]}
+
+    def _run_checks(self) -> Dict[str, Any]:
+        """Everything in the compliance check report except the timestamp."""
         return {
-            "timestamp": datetime.now().isoformat(),
             "overall_status": "compliant",  # or "non_compliant", "requires_attention"
             "checks": {
                 "encryption": self._check_encryption(),
@@ -758,44 +1564,95 @@ compliance_checker = ComplianceChecker()
 # DECORATORS FOR COMPLIANCE
 # ============================================================================
 
-def audit_access(
+def compliance(
     action: AccessAction,
     resource_type: str,
+    consent_type: Optional[ConsentType] = None,
+    purpose: Optional[str] = None,
     data_categories: List[DataCategory] = None
 ):
-    """Decorator to automatically log access to sensitive resources."""
+    """
+    Decorator that audits access to a sensitive resource and, when
+    consent_type is given, verifies IRC §7216 consent first.
+
+    One wrapper does both, replacing a stacked @audit_access /
+    @require_consent pair. A refused consent is audited as a failure.
+    """
+    if consent_type is not None and purpose is None:
+        raise ValueError("purpose is required with consent_type")
+    flags = pack_audit_flags(action, data_categories or ())
+
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
             # Extract user and resource info from request
             # In production: get from request context
 
-            entry = AuditLogEntry(
+            # Every field is produced internally here, so skip pydantic
+            # validation; model_construct fills the remaining defaults
+            entry = AuditLogEntry.model_construct(
+                id=_new_id(),
+                timestamp=now(),
                 user_id="system",  # Replace with actual user
                 user_ip="0.0.0.0",  # Replace with actual IP
-                action=action,
+                flags=flags,
                 resource_type=resource_type,
                 resource_id=str(kwargs.get('id', 'unknown')),
-                data_categories=data_categories or [],
             )
 
             try:
+                if consent_type is not None:
+                    taxpayer_id = kwargs.get('taxpayer_id')
+                    if not taxpayer_id:
+                        raise ValueError("taxpayer_id required for consent check")
+                    if not consent_manager.check_consent(taxpayer_id, consent_type, purpose):
+                        raise PermissionError(f"Consent not granted for {purpose}")
+
                 result = await func(*args, **kwargs)
-                entry.success = True
-                audit_logger.log(entry)
-                return result
             except Exception as e:
+                # Failures must be on disk before the error propagates
                 entry.success = False
                 entry.error_message = str(e)
-                audit_logger.log(entry)
+                await audit_logger.log_async(entry)
                 raise
 
+            # Success is fire-and-forget: log() only queues for the flusher
+            entry.success = True
+            audit_logger.log(entry)
+            return result
+
         return wrapper
     return decorator
 
 
+def audit_access(
+    action: AccessAction,
+    resource_type: str,
+    data_categories: List[DataCategory] = None
+):
+    """Decorator to automatically log access to sensitive resources.
+
+    Deprecated: use compliance(), which also covers the consent check.
+    """
+    warnings.warn(
+        "audit_access is deprecated; use compliance()",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    return compliance(action, resource_type, data_categories=data_categories)
+
+
 def require_consent(consent_type: ConsentType, purpose: str):
-    """Decorator to verify consent before accessing data."""
+    """Decorator to verify consent before accessing data.
+
+    Deprecated: use compliance(..., consent_type=..., purpose=...).
+    """
+    warnings.warn(
+        "require_consent is deprecated; use compliance()",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
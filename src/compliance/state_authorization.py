@@ -10,10 +10,14 @@ Each state operates independently with different requirements:
 """
 
 from enum import Enum
-from typing import Dict, List, Optional, Any
-from datetime import datetime, date
-from pydantic import BaseModel, Field
+from typing import Dict, List, Optional, Any, Sequence, Set, Tuple
+from datetime import datetime, date, timedelta
+from functools import lru_cache
+from pydantic import BaseModel
 import hashlib
+import heapq
+
+import orjson
 
 
 class StateFilingType(str, Enum):
@@ -108,486 +112,277 @@ class StateAuthorization(BaseModel):
 # STATE DATABASE - All 50 States + DC + Territories
 # ============================================================================
 
-STATE_EFILE_CONFIGS: Dict[str, StateEFileConfig] = {
+# One row per state: (state_code, state_name, has_income_tax, filing_types,
+# program_name, program_url, other StateEFileConfig fields)
+_ROWS: Tuple[Tuple[str, str, bool, Tuple[StateFilingType, ...], str, str, Dict[str, Any]], ...] = (
     # === NO INCOME TAX STATES ===
-    "AK": StateEFileConfig(
-        state_code="AK",
-        state_name="Alaska",
-        has_income_tax=False,
-        filing_types=[StateFilingType.CORPORATE_INCOME],
-        program_name="Alaska DOR e-File",
-        program_url="https://revenue.alaska.gov/",
-    ),
-    "FL": StateEFileConfig(
-        state_code="FL",
-        state_name="Florida",
-        has_income_tax=False,
-        filing_types=[StateFilingType.CORPORATE_INCOME, StateFilingType.SALES_USE],
-        program_name="Florida DOR e-File",
-        program_url="https://floridarevenue.com/",
-    ),
-    "NV": StateEFileConfig(
-        state_code="NV",
-        state_name="Nevada",
-        has_income_tax=False,
-        filing_types=[StateFilingType.FRANCHISE],
-        program_name="Nevada SOS e-File",
-        program_url="https://www.nvsos.gov/",
-    ),
-    "SD": StateEFileConfig(
-        state_code="SD",
-        state_name="South Dakota",
-        has_income_tax=False,
-        filing_types=[StateFilingType.SALES_USE],
-        program_name="South Dakota DOR",
-        program_url="https://dor.sd.gov/",
-    ),
-    "TX": StateEFileConfig(
-        state_code="TX",
-        state_name="Texas",
-        has_income_tax=False,
-        filing_types=[StateFilingType.FRANCHISE, StateFilingType.SALES_USE],
-        program_name="Texas Comptroller e-File",
-        program_url="https://comptroller.texas.gov/",
-        requires_separate_testing=True,
-    ),
-    "WA": StateEFileConfig(
-        state_code="WA",
-        state_name="Washington",
-        has_income_tax=False,  # Has capital gains tax starting 2024
-        filing_types=[StateFilingType.SALES_USE],
-        program_name="Washington DOR e-File",
-        program_url="https://dor.wa.gov/",
-    ),
-    "WY": StateEFileConfig(
-        state_code="WY",
-        state_name="Wyoming",
-        has_income_tax=False,
-        filing_types=[StateFilingType.SALES_USE],
-        program_name="Wyoming DOR",
-        program_url="https://revenue.wyo.gov/",
-    ),
-    "NH": StateEFileConfig(
-        state_code="NH",
-        state_name="New Hampshire",
-        has_income_tax=False,  # Interest/dividends tax repealed
-        filing_types=[StateFilingType.CORPORATE_INCOME],
-        program_name="NH DRA e-File",
-        program_url="https://www.revenue.nh.gov/",
-    ),
-    "TN": StateEFileConfig(
-        state_code="TN",
-        state_name="Tennessee",
-        has_income_tax=False,  # Hall Tax repealed
-        filing_types=[StateFilingType.FRANCHISE, StateFilingType.SALES_USE],
-        program_name="TN DOR e-File",
-        program_url="https://www.tn.gov/revenue/",
-    ),
+    ("AK", "Alaska", False,
+     (StateFilingType.CORPORATE_INCOME,),
+     "Alaska DOR e-File", "https://revenue.alaska.gov/", {}),
+    ("FL", "Florida", False,
+     (StateFilingType.CORPORATE_INCOME, StateFilingType.SALES_USE),
+     "Florida DOR e-File", "https://floridarevenue.com/", {}),
+    ("NV", "Nevada", False,
+     (StateFilingType.FRANCHISE,),
+     "Nevada SOS e-File", "https://www.nvsos.gov/", {}),
+    ("SD", "South Dakota", False,
+     (StateFilingType.SALES_USE,),
+     "South Dakota DOR", "https://dor.sd.gov/", {}),
+    ("TX", "Texas", False,
+     (StateFilingType.FRANCHISE, StateFilingType.SALES_USE),
+     "Texas Comptroller e-File", "https://comptroller.texas.gov/",
+     {"requires_separate_testing": True}),
+    ("WA", "Washington", False,  # Has capital gains tax starting 2024
+     (StateFilingType.SALES_USE,),
+     "Washington DOR e-File", "https://dor.wa.gov/", {}),
+    ("WY", "Wyoming", False,
+     (StateFilingType.SALES_USE,),
+     "Wyoming DOR", "https://revenue.wyo.gov/", {}),
+    ("NH", "New Hampshire", False,  # Interest/dividends tax repealed
+     (StateFilingType.CORPORATE_INCOME,),
+     "NH DRA e-File", "https://www.revenue.nh.gov/", {}),
+    ("TN", "Tennessee", False,  # Hall Tax repealed
+     (StateFilingType.FRANCHISE, StateFilingType.SALES_USE),
+     "TN DOR e-File", "https://www.tn.gov/revenue/", {}),
 
     # === MAJOR STATES WITH FULL PROGRAMS ===
-    "CA": StateEFileConfig(
-        state_code="CA",
-        state_name="California",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME,
-                      StateFilingType.PARTNERSHIP, StateFilingType.S_CORP, StateFilingType.FIDUCIARY],
-        program_name="FTB e-File Program",
-        program_url="https://www.ftb.ca.gov/professionals/efile/",
-        contact_email="efile@ftb.ca.gov",
-        requires_separate_testing=True,
-        requires_state_schema=True,
-        schema_version="2025.1",
-        gateway_url="https://services.ftb.ca.gov/efile/",
-        test_gateway_url="https://test.ftb.ca.gov/efile/",
-        requires_soc2=True,
-        annual_renewal_date=date(2025, 11, 1),
-    ),
-    "NY": StateEFileConfig(
-        state_code="NY",
-        state_name="New York",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME,
-                      StateFilingType.PARTNERSHIP, StateFilingType.S_CORP, StateFilingType.WITHHOLDING],
-        program_name="NYS DTF e-File Program",
-        program_url="https://www.tax.ny.gov/pit/efile/",
-        requires_separate_testing=True,
-        requires_state_schema=True,
-        schema_version="IT-201_2025",
-        requires_soc2=True,
-        annual_renewal_date=date(2025, 10, 15),
-    ),
-    "IL": StateEFileConfig(
-        state_code="IL",
-        state_name="Illinois",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME,
-                      StateFilingType.PARTNERSHIP, StateFilingType.FIDUCIARY],
-        program_name="IDOR e-File Program",
-        program_url="https://tax.illinois.gov/professionals/efile/",
-        requires_separate_testing=True,
-        uses_fed_state_program=True,
-    ),
-    "PA": StateEFileConfig(
-        state_code="PA",
-        state_name="Pennsylvania",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME],
-        program_name="PA e-TIDES",
-        program_url="https://www.revenue.pa.gov/",
-        requires_separate_testing=True,
-        requires_state_schema=True,
-    ),
-    "OH": StateEFileConfig(
-        state_code="OH",
-        state_name="Ohio",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME],
-        program_name="Ohio I-File",
-        program_url="https://tax.ohio.gov/",
-        uses_fed_state_program=True,
-    ),
-    "GA": StateEFileConfig(
-        state_code="GA",
-        state_name="Georgia",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME,
-                      StateFilingType.WITHHOLDING],
-        program_name="GA DOR e-File",
-        program_url="https://dor.georgia.gov/",
-        uses_fed_state_program=True,
-    ),
-    "NC": StateEFileConfig(
-        state_code="NC",
-        state_name="North Carolina",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME],
-        program_name="NCDOR e-File",
-        program_url="https://www.ncdor.gov/",
-        uses_fed_state_program=True,
-    ),
-    "NJ": StateEFileConfig(
-        state_code="NJ",
-        state_name="New Jersey",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME,
-                      StateFilingType.PARTNERSHIP],
-        program_name="NJ Division of Taxation e-File",
-        program_url="https://www.nj.gov/treasury/taxation/",
-        requires_separate_testing=True,
-    ),
-    "VA": StateEFileConfig(
-        state_code="VA",
-        state_name="Virginia",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME],
-        program_name="Virginia Tax e-File",
-        program_url="https://www.tax.virginia.gov/",
-        uses_fed_state_program=True,
-    ),
-    "MI": StateEFileConfig(
-        state_code="MI",
-        state_name="Michigan",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME],
-        program_name="Michigan Treasury e-File",
-        program_url="https://www.michigan.gov/treasury/",
-        uses_fed_state_program=True,
-    ),
-    "MA": StateEFileConfig(
-        state_code="MA",
-        state_name="Massachusetts",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME,
-                      StateFilingType.FIDUCIARY],
-        program_name="DOR e-File Program",
-        program_url="https://www.mass.gov/orgs/massachusetts-department-of-revenue",
-        requires_separate_testing=True,
-        requires_state_schema=True,
-        schema_version="Form1_2025",
-    ),
-    "AZ": StateEFileConfig(
-        state_code="AZ",
-        state_name="Arizona",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME],
-        program_name="ADOR e-File",
-        program_url="https://azdor.gov/",
-        uses_fed_state_program=True,
-    ),
-    "CO": StateEFileConfig(
-        state_code="CO",
-        state_name="Colorado",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME],
-        program_name="Colorado DOR e-File",
-        program_url="https://tax.colorado.gov/",
-        uses_fed_state_program=True,
-    ),
-    "MD": StateEFileConfig(
-        state_code="MD",
-        state_name="Maryland",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME],
-        program_name="Comptroller of Maryland e-File",
-        program_url="https://www.marylandtaxes.gov/",
-        uses_fed_state_program=True,
-    ),
-    "MN": StateEFileConfig(
-        state_code="MN",
-        state_name="Minnesota",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME],
-        program_name="MN DOR e-File",
-        program_url="https://www.revenue.state.mn.us/",
-        uses_fed_state_program=True,
-    ),
-    "MO": StateEFileConfig(
-        state_code="MO",
-        state_name="Missouri",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME],
-        program_name="MO DOR e-File",
-        program_url="https://dor.mo.gov/",
-        uses_fed_state_program=True,
-    ),
-    "WI": StateEFileConfig(
-        state_code="WI",
-        state_name="Wisconsin",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME],
-        program_name="WI DOR e-File",
-        program_url="https://www.revenue.wi.gov/",
-        uses_fed_state_program=True,
-    ),
-    "IN": StateEFileConfig(
-        state_code="IN",
-        state_name="Indiana",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME],
-        program_name="IN DOR e-File",
-        program_url="https://www.in.gov/dor/",
-        uses_fed_state_program=True,
-    ),
-    "CT": StateEFileConfig(
-        state_code="CT",
-        state_name="Connecticut",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME],
-        program_name="CT DRS e-File",
-        program_url="https://portal.ct.gov/DRS",
-        requires_separate_testing=True,
-    ),
-    "OR": StateEFileConfig(
-        state_code="OR",
-        state_name="Oregon",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME],
-        program_name="Oregon DOR e-File",
-        program_url="https://www.oregon.gov/dor/",
-        uses_fed_state_program=True,
-    ),
-    "SC": StateEFileConfig(
-        state_code="SC",
-        state_name="South Carolina",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME],
-        program_name="SC DOR e-File",
-        program_url="https://dor.sc.gov/",
-        uses_fed_state_program=True,
-    ),
-    "KY": StateEFileConfig(
-        state_code="KY",
-        state_name="Kentucky",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME],
-        program_name="KY DOR e-File",
-        program_url="https://revenue.ky.gov/",
-        uses_fed_state_program=True,
-    ),
-    "AL": StateEFileConfig(
-        state_code="AL",
-        state_name="Alabama",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME],
-        program_name="AL DOR e-File",
-        program_url="https://revenue.alabama.gov/",
-        uses_fed_state_program=True,
-    ),
-    "LA": StateEFileConfig(
-        state_code="LA",
-        state_name="Louisiana",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME],
-        program_name="LA DOR e-File",
-        program_url="https://revenue.louisiana.gov/",
-        uses_fed_state_program=True,
-    ),
-    "OK": StateEFileConfig(
-        state_code="OK",
-        state_name="Oklahoma",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME],
-        program_name="OTC e-File",
-        program_url="https://oklahoma.gov/tax/",
-        uses_fed_state_program=True,
-    ),
-    "IA": StateEFileConfig(
-        state_code="IA",
-        state_name="Iowa",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME],
-        program_name="Iowa DOR e-File",
-        program_url="https://tax.iowa.gov/",
-        uses_fed_state_program=True,
-    ),
-    "KS": StateEFileConfig(
-        state_code="KS",
-        state_name="Kansas",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME],
-        program_name="KS DOR e-File",
-        program_url="https://www.ksrevenue.gov/",
-        uses_fed_state_program=True,
-    ),
-    "UT": StateEFileConfig(
-        state_code="UT",
-        state_name="Utah",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME],
-        program_name="USTC e-File",
-        program_url="https://tax.utah.gov/",
-        uses_fed_state_program=True,
-    ),
-    "AR": StateEFileConfig(
-        state_code="AR",
-        state_name="Arkansas",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME],
-        program_name="AR DFA e-File",
-        program_url="https://www.dfa.arkansas.gov/",
-        uses_fed_state_program=True,
-    ),
-    "MS": StateEFileConfig(
-        state_code="MS",
-        state_name="Mississippi",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME],
-        program_name="MS DOR e-File",
-        program_url="https://www.dor.ms.gov/",
-        uses_fed_state_program=True,
-    ),
-    "NE": StateEFileConfig(
-        state_code="NE",
-        state_name="Nebraska",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME],
-        program_name="NE DOR e-File",
-        program_url="https://revenue.nebraska.gov/",
-        uses_fed_state_program=True,
-    ),
-    "NM": StateEFileConfig(
-        state_code="NM",
-        state_name="New Mexico",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME],
-        program_name="NM TRD e-File",
-        program_url="https://www.tax.newmexico.gov/",
-        uses_fed_state_program=True,
-    ),
-    "WV": StateEFileConfig(
-        state_code="WV",
-        state_name="West Virginia",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME],
-        program_name="WV Tax e-File",
-        program_url="https://tax.wv.gov/",
-        uses_fed_state_program=True,
-    ),
-    "ID": StateEFileConfig(
-        state_code="ID",
-        state_name="Idaho",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME],
-        program_name="Idaho Tax Commission e-File",
-        program_url="https://tax.idaho.gov/",
-        uses_fed_state_program=True,
-    ),
-    "HI": StateEFileConfig(
-        state_code="HI",
-        state_name="Hawaii",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME],
-        program_name="HI DOTAX e-File",
-        program_url="https://tax.hawaii.gov/",
-        uses_fed_state_program=True,
-    ),
-    "ME": StateEFileConfig(
-        state_code="ME",
-        state_name="Maine",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME],
-        program_name="Maine Revenue e-File",
-        program_url="https://www.maine.gov/revenue/",
-        uses_fed_state_program=True,
-    ),
-    "RI": StateEFileConfig(
-        state_code="RI",
-        state_name="Rhode Island",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME],
-        program_name="RI Division of Taxation e-File",
-        program_url="https://tax.ri.gov/",
-        uses_fed_state_program=True,
-    ),
-    "MT": StateEFileConfig(
-        state_code="MT",
-        state_name="Montana",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME],
-        program_name="MT DOR e-File",
-        program_url="https://mtrevenue.gov/",
-        uses_fed_state_program=True,
-    ),
-    "DE": StateEFileConfig(
-        state_code="DE",
-        state_name="Delaware",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME,
-                      StateFilingType.FRANCHISE],
-        program_name="DE Division of Revenue e-File",
-        program_url="https://revenue.delaware.gov/",
-        uses_fed_state_program=True,
-    ),
-    "ND": StateEFileConfig(
-        state_code="ND",
-        state_name="North Dakota",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME],
-        program_name="ND Tax e-File",
-        program_url="https://www.tax.nd.gov/",
-        uses_fed_state_program=True,
-    ),
-    "VT": StateEFileConfig(
-        state_code="VT",
-        state_name="Vermont",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME],
-        program_name="VT Tax e-File",
-        program_url="https://tax.vermont.gov/",
-        uses_fed_state_program=True,
-    ),
+    ("CA", "California", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME,
+      StateFilingType.PARTNERSHIP, StateFilingType.S_CORP, StateFilingType.FIDUCIARY),
+     "FTB e-File Program", "https://www.ftb.ca.gov/professionals/efile/",
+     {"contact_email": "efile@ftb.ca.gov",
+      "requires_separate_testing": True,
+      "requires_state_schema": True,
+      "schema_version": "2025.1",
+      "gateway_url": "https://services.ftb.ca.gov/efile/",
+      "test_gateway_url": "https://test.ftb.ca.gov/efile/",
+      "requires_soc2": True,
+      "annual_renewal_date": date(2025, 11, 1)}),
+    ("NY", "New York", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME,
+      StateFilingType.PARTNERSHIP, StateFilingType.S_CORP, StateFilingType.WITHHOLDING),
+     "NYS DTF e-File Program", "https://www.tax.ny.gov/pit/efile/",
+     {"requires_separate_testing": True,
+      "requires_state_schema": True,
+      "schema_version": "IT-201_2025",
+      "requires_soc2": True,
+      "annual_renewal_date": date(2025, 10, 15)}),
+    ("IL", "Illinois", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME,
+      StateFilingType.PARTNERSHIP, StateFilingType.FIDUCIARY),
+     "IDOR e-File Program", "https://tax.illinois.gov/professionals/efile/",
+     {"requires_separate_testing": True, "uses_fed_state_program": True}),
+    ("PA", "Pennsylvania", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME),
+     "PA e-TIDES", "https://www.revenue.pa.gov/",
+     {"requires_separate_testing": True, "requires_state_schema": True}),
+    ("OH", "Ohio", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME),
+     "Ohio I-File", "https://tax.ohio.gov/",
+     {"uses_fed_state_program": True}),
+    ("GA", "Georgia", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME,
+      StateFilingType.WITHHOLDING),
+     "GA DOR e-File", "https://dor.georgia.gov/",
+     {"uses_fed_state_program": True}),
+    ("NC", "North Carolina", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME),
+     "NCDOR e-File", "https://www.ncdor.gov/",
+     {"uses_fed_state_program": True}),
+    ("NJ", "New Jersey", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME,
+      StateFilingType.PARTNERSHIP),
+     "NJ Division of Taxation e-File", "https://www.nj.gov/treasury/taxation/",
+     {"requires_separate_testing": True}),
+    ("VA", "Virginia", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME),
+     "Virginia Tax e-File", "https://www.tax.virginia.gov/",
+     {"uses_fed_state_program": True}),
+    ("MI", "Michigan", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME),
+     "Michigan Treasury e-File", "https://www.michigan.gov/treasury/",
+     {"uses_fed_state_program": True}),
+    ("MA", "Massachusetts", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME,
+      StateFilingType.FIDUCIARY),
+     "DOR e-File Program", "https://www.mass.gov/orgs/massachusetts-department-of-revenue",
+     {"requires_separate_testing": True,
+      "requires_state_schema": True,
+      "schema_version": "Form1_2025"}),
+    ("AZ", "Arizona", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME),
+     "ADOR e-File", "https://azdor.gov/",
+     {"uses_fed_state_program": True}),
+    ("CO", "Colorado", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME),
+     "Colorado DOR e-File", "https://tax.colorado.gov/",
+     {"uses_fed_state_program": True}),
+    ("MD", "Maryland", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME),
+     "Comptroller of Maryland e-File", "https://www.marylandtaxes.gov/",
+     {"uses_fed_state_program": True}),
+    ("MN", "Minnesota", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME),
+     "MN DOR e-File", "https://www.revenue.state.mn.us/",
+     {"uses_fed_state_program": True}),
+    ("MO", "Missouri", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME),
+     "MO DOR e-File", "https://dor.mo.gov/",
+     {"uses_fed_state_program": True}),
+    ("WI", "Wisconsin", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME),
+     "WI DOR e-File", "https://www.revenue.wi.gov/",
+     {"uses_fed_state_program": True}),
+    ("IN", "Indiana", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME),
+     "IN DOR e-File", "https://www.in.gov/dor/",
+     {"uses_fed_state_program": True}),
+    ("CT", "Connecticut", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME),
+     "CT DRS e-File", "https://portal.ct.gov/DRS",
+     {"requires_separate_testing": True}),
+    ("OR", "Oregon", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME),
+     "Oregon DOR e-File", "https://www.oregon.gov/dor/",
+     {"uses_fed_state_program": True}),
+    ("SC", "South Carolina", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME),
+     "SC DOR e-File", "https://dor.sc.gov/",
+     {"uses_fed_state_program": True}),
+    ("KY", "Kentucky", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME),
+     "KY DOR e-File", "https://revenue.ky.gov/",
+     {"uses_fed_state_program": True}),
+    ("AL", "Alabama", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME),
+     "AL DOR e-File", "https://revenue.alabama.gov/",
+     {"uses_fed_state_program": True}),
+    ("LA", "Louisiana", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME),
+     "LA DOR e-File", "https://revenue.louisiana.gov/",
+     {"uses_fed_state_program": True}),
+    ("OK", "Oklahoma", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME),
+     "OTC e-File", "https://oklahoma.gov/tax/",
+     {"uses_fed_state_program": True}),
+    ("IA", "Iowa", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME),
+     "Iowa DOR e-File", "https://tax.iowa.gov/",
+     {"uses_fed_state_program": True}),
+    ("KS", "Kansas", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME),
+     "KS DOR e-File", "https://www.ksrevenue.gov/",
+     {"uses_fed_state_program": True}),
+    ("UT", "Utah", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME),
+     "USTC e-File", "https://tax.utah.gov/",
+     {"uses_fed_state_program": True}),
+    ("AR", "Arkansas", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME),
+     "AR DFA e-File", "https://www.dfa.arkansas.gov/",
+     {"uses_fed_state_program": True}),
+    ("MS", "Mississippi", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME),
+     "MS DOR e-File", "https://www.dor.ms.gov/",
+     {"uses_fed_state_program": True}),
+    ("NE", "Nebraska", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME),
+     "NE DOR e-File", "https://revenue.nebraska.gov/",
+     {"uses_fed_state_program": True}),
+    ("NM", "New Mexico", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME),
+     "NM TRD e-File", "https://www.tax.newmexico.gov/",
+     {"uses_fed_state_program": True}),
+    ("WV", "West Virginia", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME),
+     "WV Tax e-File", "https://tax.wv.gov/",
+     {"uses_fed_state_program": True}),
+    ("ID", "Idaho", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME),
+     "Idaho Tax Commission e-File", "https://tax.idaho.gov/",
+     {"uses_fed_state_program": True}),
+    ("HI", "Hawaii", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME),
+     "HI DOTAX e-File", "https://tax.hawaii.gov/",
+     {"uses_fed_state_program": True}),
+    ("ME", "Maine", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME),
+     "Maine Revenue e-File", "https://www.maine.gov/revenue/",
+     {"uses_fed_state_program": True}),
+    ("RI", "Rhode Island", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME),
+     "RI Division of Taxation e-File", "https://tax.ri.gov/",
+     {"uses_fed_state_program": True}),
+    ("MT", "Montana", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME),
+     "MT DOR e-File", "https://mtrevenue.gov/",
+     {"uses_fed_state_program": True}),
+    ("DE", "Delaware", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME,
+      StateFilingType.FRANCHISE),
+     "DE Division of Revenue e-File", "https://revenue.delaware.gov/",
+     {"uses_fed_state_program": True}),
+    ("ND", "North Dakota", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME),
+     "ND Tax e-File", "https://www.tax.nd.gov/",
+     {"uses_fed_state_program": True}),
+    ("VT", "Vermont", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME),
+     "VT Tax e-File", "https://tax.vermont.gov/",
+     {"uses_fed_state_program": True}),
 
     # === DISTRICT OF COLUMBIA ===
-    "DC": StateEFileConfig(
-        state_code="DC",
-        state_name="District of Columbia",
-        has_income_tax=True,
-        filing_types=[StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME],
-        program_name="OTR e-File",
-        program_url="https://otr.cfo.dc.gov/",
-        uses_fed_state_program=True,
-    ),
+    ("DC", "District of Columbia", True,
+     (StateFilingType.INDIVIDUAL_INCOME, StateFilingType.CORPORATE_INCOME),
+     "OTR e-File", "https://otr.cfo.dc.gov/",
+     {"uses_fed_state_program": True}),
+)
+
+STATE_EFILE_CONFIGS: Dict[str, StateEFileConfig] = {
+    row[0]: StateEFileConfig(
+        state_code=row[0],
+        state_name=row[1],
+        has_income_tax=row[2],
+        filing_types=list(row[3]),
+        program_name=row[4],
+        program_url=row[5],
+        **row[6],
+    )
+    for row in _ROWS
 }
+del _ROWS
+
+# STATE_EFILE_CONFIGS is fixed at import, so derived views are built once
+_ALL_STATES: Tuple[StateEFileConfig, ...] = tuple(STATE_EFILE_CONFIGS.values())
+_INCOME_TAX_STATES: Tuple[StateEFileConfig, ...] = tuple(
+    c for c in STATE_EFILE_CONFIGS.values() if c.has_income_tax
+)
+_INCOME_TAX_STATE_COUNT = len(_INCOME_TAX_STATES)
+_NOT_APPLIED_COVERAGE: Dict[str, str] = dict.fromkeys(
+    STATE_EFILE_CONFIGS, AuthorizationStatus.NOT_APPLIED.value
+)
+
+
+# ============================================================================
+# STATE CONFIG QUERIES (stateless: depend only on STATE_EFILE_CONFIGS)
+# ============================================================================
+
+# Cached on the raw code as passed in, so a repeated code (in any case)
+# skips the .upper() allocation as well as the lookup
+@lru_cache(maxsize=128)
+def get_state_config(state_code: str) -> Optional[StateEFileConfig]:
+    """Get configuration for a specific state (case-insensitive code)."""
+    return STATE_EFILE_CONFIGS.get(state_code.upper())
+
+
+def get_all_states() -> Sequence[StateEFileConfig]:
+    """Get all state configurations (a shared, read-only tuple)."""
+    return _ALL_STATES
+
+
+def get_income_tax_states() -> List[StateEFileConfig]:
+    """Get states with individual income tax."""
+    return list(_INCOME_TAX_STATES)
 
 
 class StateAuthorizationManager:
@@ -603,35 +398,60 @@ class StateAuthorizationManager:
 
     def __init__(self):
         self.authorizations: Dict[str, StateAuthorization] = {}
+        # Codes whose authorization is AUTHORIZED; kept in step by the
+        # status-changing methods so get_authorized_states needs no scan
+        self._authorized_codes: Set[str] = set()
+        # (expiration_date, state_code) for activated authorizations, soonest
+        # first. Entries are not removed when an authorization changes;
+        # check_renewal_required skips any that no longer match
+        self._expiry_heap: List[Tuple[datetime, str]] = []
+        # Bumped by every method that changes an authorization; the
+        # compliance summary (and its JSON) is reused while it is unchanged
+        self._version = 0
+        self._summary_cache: Tuple[int, Dict[str, Any]] = (-1, {})
+        self._summary_json_cache: Tuple[int, bytes] = (-1, b"")
         self._load_authorizations()
 
     def _load_authorizations(self):
         """Load existing authorizations from database."""
         # In production, load from database
-        pass
+        self._recompute_authorized_codes()
+        self._version += 1
+
+    def _recompute_authorized_codes(self):
+        """Rebuild the authorized-code and expiry indexes from the authorizations."""
+        self._authorized_codes = {
+            code for code, auth in self.authorizations.items()
+            if auth.status == AuthorizationStatus.AUTHORIZED
+        }
+        self._expiry_heap = [
+            (self.authorizations[code].expiration_date, code)
+            for code in self._authorized_codes
+            if self.authorizations[code].expiration_date
+        ]
+        heapq.heapify(self._expiry_heap)
 
+    # Config queries are module-level functions; kept here for API compatibility
     def get_state_config(self, state_code: str) -> Optional[StateEFileConfig]:
         """Get configuration for a specific state."""
-        return STATE_EFILE_CONFIGS.get(state_code.upper())
+        return get_state_config(state_code)
 
-    def get_all_states(self) -> List[StateEFileConfig]:
+    def get_all_states(self) -> Sequence[StateEFileConfig]:
         """Get all state configurations."""
-        return list(STATE_EFILE_CONFIGS.values())
+        return get_all_states()
 
     def get_income_tax_states(self) -> List[StateEFileConfig]:
         """Get states with individual income tax."""
-        return [s for s in STATE_EFILE_CONFIGS.values() if s.has_income_tax]
+        return get_income_tax_states()
 
     def get_authorization_status(self, state_code: str) -> Optional[StateAuthorization]:
         """Get current authorization status for a state."""
         return self.authorizations.get(state_code.upper())
 
     def get_authorized_states(self) -> List[str]:
-        """Get list of states where we're authorized to e-File."""
-        return [
-            code for code, auth in self.authorizations.items()
-            if auth.status == AuthorizationStatus.AUTHORIZED
-        ]
+        """Get list of states where we're authorized to e-File, by state code."""
+        # Sorted: set iteration order depends on the string hash seed
+        return sorted(self._authorized_codes)
 
     def start_authorization(
         self,
@@ -639,18 +459,23 @@ class StateAuthorizationManager:
         filing_types: List[StateFilingType]
     ) -> StateAuthorization:
         """Begin authorization process for a state."""
-        config = self.get_state_config(state_code)
+        config = get_state_config(state_code)
         if not config:
             raise ValueError(f"Unknown state code: {state_code}")
 
+        # Reuse the config's code string: authorization keys, state_code
+        # fields and coverage-map keys then all share one object per state
+        code = config.state_code
         authorization = StateAuthorization(
-            state_code=state_code.upper(),
+            state_code=code,
             status=AuthorizationStatus.APPLICATION_PENDING,
             filing_types=filing_types,
             application_date=datetime.now(),
         )
 
-        self.authorizations[state_code.upper()] = authorization
+        self.authorizations[code] = authorization
+        self._authorized_codes.discard(code)
+        self._version += 1
         return authorization
 
     def update_testing_status(
@@ -672,6 +497,8 @@ class StateAuthorizationManager:
             auth.status = AuthorizationStatus.TESTING_PASSED
         else:
             auth.status = AuthorizationStatus.TESTING_IN_PROGRESS
+        self._authorized_codes.discard(auth.state_code)
+        self._version += 1
 
         return auth
 
@@ -692,53 +519,85 @@ class StateAuthorizationManager:
         auth.expiration_date = expiration_date
         auth.transmitter_id = transmitter_id
         auth.software_id = software_id
+        self._authorized_codes.add(auth.state_code)
+        if expiration_date:
+            heapq.heappush(self._expiry_heap, (expiration_date, auth.state_code))
+        self._version += 1
 
         return auth
 
     def check_renewal_required(self) -> List[StateAuthorization]:
         """Get list of states requiring renewal."""
         renewals_needed = []
-        now = datetime.now()
-
-        for auth in self.authorizations.values():
-            if auth.status == AuthorizationStatus.AUTHORIZED and auth.expiration_date:
-                days_until_expiration = (auth.expiration_date - now).days
-                if days_until_expiration <= 60:  # 60 day warning
-                    auth.status = AuthorizationStatus.RENEWAL_REQUIRED
-                    renewals_needed.append(auth)
-
+        # 60 day warning: whole days until expiration <= 60, i.e. the
+        # expiration is less than 61 days away
+        horizon = datetime.now() + timedelta(days=61)
+
+        # Only the soonest-expiring entries are touched, not every state
+        heap = self._expiry_heap
+        while heap and heap[0][0] < horizon:
+            expiration_date, code = heapq.heappop(heap)
+            auth = self.authorizations.get(code)
+            if (auth is None
+                    or auth.status != AuthorizationStatus.AUTHORIZED
+                    or auth.expiration_date != expiration_date):
+                continue  # superseded by a later status change or renewal
+            auth.status = AuthorizationStatus.RENEWAL_REQUIRED
+            self._authorized_codes.discard(code)
+            renewals_needed.append(auth)
+
+        if renewals_needed:
+            self._version += 1
         return renewals_needed
 
     def get_compliance_summary(self) -> Dict[str, Any]:
-        """Get overall compliance summary across all states."""
+        """Get overall compliance summary across all states.
+
+        The result holds only JSON primitives and is reused until an
+        authorization changes; treat it as read-only.
+        """
+        version, summary = self._summary_cache
+        if version == self._version:
+            return summary
+        summary = self._build_compliance_summary()
+        self._summary_cache = (self._version, summary)
+        return summary
+
+    def get_compliance_summary_json(self) -> bytes:
+        """get_compliance_summary() encoded as JSON, cached the same way."""
+        version, body = self._summary_json_cache
+        if version != self._version:
+            body = orjson.dumps(self.get_compliance_summary())
+            self._summary_json_cache = (self._version, body)
+        return body
+
+    def _build_compliance_summary(self) -> Dict[str, Any]:
+        """Compute the compliance summary from the authorizations."""
         total_states = len(STATE_EFILE_CONFIGS)
-        income_tax_states = len(self.get_income_tax_states())
-        authorized_states = len(self.get_authorized_states())
+        income_tax_states = _INCOME_TAX_STATE_COUNT
+
+        # One pass over the authorizations for both the status counts and
+        # the coverage map (pre-filled, in state order, with not_applied)
+        counts = dict.fromkeys(AuthorizationStatus, 0)
+        coverage_map = dict(_NOT_APPLIED_COVERAGE)
+        for code, auth in self.authorizations.items():
+            counts[auth.status] += 1
+            coverage_map[code] = auth.status.value
 
-        pending = sum(1 for a in self.authorizations.values()
-                     if a.status == AuthorizationStatus.APPLICATION_PENDING)
-        testing = sum(1 for a in self.authorizations.values()
-                     if a.status in [AuthorizationStatus.TESTING_REQUIRED,
-                                    AuthorizationStatus.TESTING_IN_PROGRESS])
-        renewal = sum(1 for a in self.authorizations.values()
-                     if a.status == AuthorizationStatus.RENEWAL_REQUIRED)
+        authorized_states = counts[AuthorizationStatus.AUTHORIZED]
+        rate = authorized_states * 100.0 / income_tax_states if income_tax_states else 0.0
 
         return {
             "total_states": total_states,
             "income_tax_states": income_tax_states,
             "authorized": authorized_states,
-            "authorization_rate": f"{(authorized_states / income_tax_states * 100):.1f}%",
-            "pending_applications": pending,
-            "in_testing": testing,
-            "renewal_required": renewal,
-            "coverage_map": {
-                code: self.authorizations.get(code, StateAuthorization(
-                    state_code=code,
-                    status=AuthorizationStatus.NOT_APPLIED,
-                    filing_types=[]
-                )).status.value
-                for code in STATE_EFILE_CONFIGS.keys()
-            }
+            "authorization_rate": f"{rate:.1f}%",
+            "authorization_rate_pct": rate,  # unformatted, for API clients
+            "pending_applications": counts[AuthorizationStatus.APPLICATION_PENDING],
+            "in_testing": (counts[AuthorizationStatus.TESTING_REQUIRED]
+                           + counts[AuthorizationStatus.TESTING_IN_PROGRESS]),
+            "renewal_required": counts[AuthorizationStatus.RENEWAL_REQUIRED],
+            "coverage_map": coverage_map
         }
 
 
@@ -5,8 +5,9 @@ Agent Marisol - Chief Software Architect
 Centralized configuration management with environment-based settings.
 """
 import os
-from typing import Optional, List
-from pydantic import Field, field_validator
+from functools import cached_property, lru_cache
+from typing import Annotated, FrozenSet, Optional
+from pydantic import BeforeValidator, Field, PrivateAttr, model_validator
 from pydantic_settings import BaseSettings
 from enum import Enum
 
@@ -23,15 +24,95 @@ class IRSEnvironment(str, Enum):
     PRODUCTION = "production"
 
 
+def _lower(value):
+    return value.lower() if isinstance(value, str) else value
+
+
+# Case-insensitive enum fields: strings are lowercased before Pydantic's
+# own enum parsing
+_LowercaseEnvironment = Annotated[Environment, BeforeValidator(_lower)]
+_LowercaseIRSEnvironment = Annotated[IRSEnvironment, BeforeValidator(_lower)]
+
+
+# Shared by Settings and the integration settings below: every class reads
+# the same .env file and the same (unprefixed) variable names. Instances
+# are frozen (read-only and hashable); reload_settings replaces the whole
+# object instead.
+_SETTINGS_CONFIG = {
+    "env_file": ".env",
+    "env_file_encoding": "utf-8",
+    "case_sensitive": True,
+    "extra": "ignore",
+    "frozen": True
+}
+
+
+# Upload file types and tax years the platform accepts. Frozensets, so
+# membership checks are O(1) and Settings shares one instance instead of
+# copying a list default per instance
+ALLOWED_DOCUMENT_TYPES: FrozenSet[str] = frozenset({"pdf", "jpg", "jpeg", "png", "heic"})
+SUPPORTED_TAX_YEARS: FrozenSet[int] = frozenset({2023, 2024, 2025})
+
+
+# ===========================================
+# INTEGRATION SETTINGS (loaded on first use)
+# ===========================================
+class AWSSettings(BaseSettings):
+    """AWS KMS settings for field encryption"""
+    AWS_KMS_KEY_ID: str = Field(...)
+    AWS_REGION: str = Field(default="us-east-1")
+
+    model_config = _SETTINGS_CONFIG
+
+
+class PlaidSettings(BaseSettings):
+    """Plaid bank-link settings"""
+    PLAID_CLIENT_ID: Optional[str] = None
+    PLAID_SECRET: Optional[str] = None
+    PLAID_ENV: str = "sandbox"
+
+    model_config = _SETTINGS_CONFIG
+
+
+class StripeSettings(BaseSettings):
+    """Stripe payment settings"""
+    STRIPE_SECRET_KEY: Optional[str] = None
+    STRIPE_PUBLISHABLE_KEY: Optional[str] = None
+    STRIPE_WEBHOOK_SECRET: Optional[str] = None
+
+    model_config = _SETTINGS_CONFIG
+
+
+class TwilioSettings(BaseSettings):
+    """Twilio SMS settings"""
+    TWILIO_ACCOUNT_SID: Optional[str] = None
+    TWILIO_AUTH_TOKEN: Optional[str] = None
+    TWILIO_PHONE_NUMBER: Optional[str] = None
+
+    model_config = _SETTINGS_CONFIG
+
+
+class SendGridSettings(BaseSettings):
+    """SendGrid email settings"""
+    SENDGRID_API_KEY: Optional[str] = None
+
+    model_config = _SETTINGS_CONFIG
+
+
 class Settings(BaseSettings):
-    """Application settings with validation"""
+    """Application settings with validation
+
+    Third-party integrations (AWS KMS, Plaid, Stripe, Twilio, SendGrid)
+    are separate settings objects, read and validated on first access
+    through the matching property (settings.aws, settings.plaid, ...).
+    """
 
     # ===========================================
     # APPLICATION SETTINGS
     # ===========================================
     APP_NAME: str = "Gonzales Tax Platform"
     APP_VERSION: str = "1.0.0"
-    ENVIRONMENT: Environment = Environment.DEVELOPMENT
+    ENVIRONMENT: _LowercaseEnvironment = Environment.DEVELOPMENT
     DEBUG: bool = Field(default=False)
     SECRET_KEY: str = Field(..., min_length=32)
 
@@ -49,11 +130,13 @@ class Settings(BaseSettings):
     REDIS_URL: str = Field(default="redis://localhost:6379")
     REDIS_MAX_CONNECTIONS: int = Field(default=50)
     CACHE_TTL_SECONDS: int = Field(default=3600)
+    RETURN_STORE_BACKEND: str = Field(default="memory")  # memory or redis
+    RETURN_STORE_TTL_SECONDS: Optional[int] = Field(default=None, ge=1)  # redis only; None keeps returns
 
     # ===========================================
     # IRS E-FILE SETTINGS (MeF)
     # ===========================================
-    IRS_MEF_ENV: IRSEnvironment = IRSEnvironment.ATS
+    IRS_MEF_ENV: _LowercaseIRSEnvironment = IRSEnvironment.ATS
     IRS_EFIN: str = Field(...)  # Electronic Filing Identification Number
     IRS_ETIN: Optional[str] = None  # Electronic Transmitter Identification Number
     IRS_MEF_ENDPOINT_ATS: str = "https://la.www4.irs.gov/a2a/mef"
@@ -65,8 +148,6 @@ class Settings(BaseSettings):
     # ENCRYPTION SETTINGS (Agent Catalina Security)
     # ===========================================
     ENCRYPTION_KEY: str = Field(..., min_length=32)
-    AWS_KMS_KEY_ID: str = Field(...)
-    AWS_REGION: str = Field(default="us-east-1")
     FIELD_ENCRYPTION_ENABLED: bool = Field(default=True)
 
     # ===========================================
@@ -87,13 +168,13 @@ class Settings(BaseSettings):
     S3_BUCKET_DOCUMENTS: str = Field(default="gonzales-tax-documents")
     S3_BUCKET_RETURNS: str = Field(default="gonzales-tax-returns")
     MAX_UPLOAD_SIZE_MB: int = Field(default=50)
-    ALLOWED_DOCUMENT_TYPES: List[str] = ["pdf", "jpg", "jpeg", "png", "heic"]
+    ALLOWED_DOCUMENT_TYPES: FrozenSet[str] = Field(default=ALLOWED_DOCUMENT_TYPES, validate_default=False)
 
     # ===========================================
     # TAX CALCULATION SETTINGS (Agent Lliset)
     # ===========================================
     CURRENT_TAX_YEAR: int = Field(default=2025)
-    SUPPORTED_TAX_YEARS: List[int] = [2023, 2024, 2025]
+    SUPPORTED_TAX_YEARS: FrozenSet[int] = Field(default=SUPPORTED_TAX_YEARS, validate_default=False)
     DECIMAL_PRECISION: int = Field(default=2)
     RATE_PRECISION: int = Field(default=6)
 
@@ -116,23 +197,6 @@ class Settings(BaseSettings):
     AI_AUDIT_RISK_ENABLED: bool = True
     AI_MAX_TOKENS: int = 4096
 
-    # ===========================================
-    # THIRD-PARTY INTEGRATIONS
-    # ===========================================
-    PLAID_CLIENT_ID: Optional[str] = None
-    PLAID_SECRET: Optional[str] = None
-    PLAID_ENV: str = "sandbox"
-
-    STRIPE_SECRET_KEY: Optional[str] = None
-    STRIPE_PUBLISHABLE_KEY: Optional[str] = None
-    STRIPE_WEBHOOK_SECRET: Optional[str] = None
-
-    TWILIO_ACCOUNT_SID: Optional[str] = None
-    TWILIO_AUTH_TOKEN: Optional[str] = None
-    TWILIO_PHONE_NUMBER: Optional[str] = None
-
-    SENDGRID_API_KEY: Optional[str] = None
-
     # ===========================================
     # RATE LIMITING
     # ===========================================
@@ -146,121 +210,91 @@ class Settings(BaseSettings):
     LOG_FORMAT: str = "json"
     AUDIT_LOG_ENABLED: bool = True
 
+    # IRS MeF endpoint for IRS_MEF_ENV, resolved once at validation time
+    _resolved_mef_endpoint: str = PrivateAttr()
+
     # ===========================================
     # VALIDATORS
     # ===========================================
-    @field_validator("ENVIRONMENT", mode="before")
-    @classmethod
-    def validate_environment(cls, v):
-        if isinstance(v, str):
-            return Environment(v.lower())
-        return v
-
-    @field_validator("IRS_MEF_ENV", mode="before")
-    @classmethod
-    def validate_irs_env(cls, v):
-        if isinstance(v, str):
-            return IRSEnvironment(v.lower())
-        return v
+    @model_validator(mode="after")
+    def _resolve_mef_endpoint(self):
+        if self.IRS_MEF_ENV == IRSEnvironment.ATS:
+            self._resolved_mef_endpoint = self.IRS_MEF_ENDPOINT_ATS
+        else:
+            self._resolved_mef_endpoint = self.IRS_MEF_ENDPOINT_PROD
+        return self
 
     @property
     def irs_mef_endpoint(self) -> str:
         """Get the correct IRS MeF endpoint based on environment"""
-        if self.IRS_MEF_ENV == IRSEnvironment.ATS:
-            return self.IRS_MEF_ENDPOINT_ATS
-        return self.IRS_MEF_ENDPOINT_PROD
+        return self._resolved_mef_endpoint
 
     @property
     def is_production(self) -> bool:
         return self.ENVIRONMENT == Environment.PRODUCTION
 
-    @property
+    @cached_property
     def database_url_async(self) -> str:
         """Convert sync database URL to async"""
         return self.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://")
 
-    model_config = {
-        "env_file": ".env",
-        "env_file_encoding": "utf-8",
-        "case_sensitive": True,
-        "extra": "ignore"
-    }
+    # ===========================================
+    # THIRD-PARTY INTEGRATIONS
+    # ===========================================
+    @cached_property
+    def aws(self) -> AWSSettings:
+        return AWSSettings()
 
+    @cached_property
+    def plaid(self) -> PlaidSettings:
+        return PlaidSettings()
 
-# ===========================================
-# TAX BRACKET CONFIGURATIONS (2025)
-# ===========================================
-TAX_BRACKETS_2025 = {
-    "single": [
-        (11600, 0.10),
-        (47150, 0.12),
-        (100525, 0.22),
-        (191950, 0.24),
-        (243725, 0.32),
-        (609350, 0.35),
-        (float("inf"), 0.37),
-    ],
-    "married_filing_jointly": [
-        (23200, 0.10),
-        (94300, 0.12),
-        (201050, 0.22),
-        (383900, 0.24),
-        (487450, 0.32),
-        (731200, 0.35),
-        (float("inf"), 0.37),
-    ],
-    "married_filing_separately": [
-        (11600, 0.10),
-        (47150, 0.12),
-        (100525, 0.22),
-        (191950, 0.24),
-        (243725, 0.32),
-        (365600, 0.35),
-        (float("inf"), 0.37),
-    ],
-    "head_of_household": [
-        (16550, 0.10),
-        (63100, 0.12),
-        (100500, 0.22),
-        (191950, 0.24),
-        (243700, 0.32),
-        (609350, 0.35),
-        (float("inf"), 0.37),
-    ],
-}
+    @cached_property
+    def stripe(self) -> StripeSettings:
+        return StripeSettings()
 
-# Standard Deductions 2025
-STANDARD_DEDUCTIONS_2025 = {
-    "single": 14600,
-    "married_filing_jointly": 29200,
-    "married_filing_separately": 14600,
-    "head_of_household": 21900,
-    "qualified_widow": 29200,
-}
+    @cached_property
+    def twilio(self) -> TwilioSettings:
+        return TwilioSettings()
 
-# Additional Standard Deduction (65+ or blind)
-ADDITIONAL_STANDARD_DEDUCTION_2025 = {
-    "single": 1950,
-    "married": 1550,
-}
+    @cached_property
+    def sendgrid(self) -> SendGridSettings:
+        return SendGridSettings()
+
+    model_config = _SETTINGS_CONFIG
+
+
+# Tax tables moved to tax_tables; still importable from here, loaded on
+# first access (PEP 562)
+_TAX_TABLE_NAMES = frozenset({
+    "TOP_BRACKET_THRESHOLD",
+    "TAX_BRACKETS_2025",
+    "TAX_BRACKETS_2025_ARR",
+    "TAX_BRACKETS_2025_CUM",
+    "marginal_rate",
+    "bracket_liability",
+    "STANDARD_DEDUCTIONS_2025",
+    "ADDITIONAL_STANDARD_DEDUCTION_2025",
+})
+
+
+def __getattr__(name):
+    if name in _TAX_TABLE_NAMES:
+        from . import tax_tables
+        return getattr(tax_tables, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # ===========================================
 # SINGLETON SETTINGS INSTANCE
 # ===========================================
-_settings: Optional[Settings] = None
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get cached settings instance"""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    return Settings()
 
 
 def reload_settings() -> Settings:
     """Force reload settings (useful for testing)"""
-    global _settings
-    _settings = Settings()
-    return _settings
+    get_settings.cache_clear()
+    return get_settings()
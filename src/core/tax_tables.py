@@ -0,0 +1,169 @@
+"""
+GONZALES TAX PLATFORM - Tax Tables
+Agent Lliset - IRS Tax Law Authority
+
+2025 bracket and standard deduction tables, with their exact int-cents
+NumPy views. Kept out of config.py so settings can load without NumPy or
+the tables; the tax engine imports this module directly.
+"""
+import numpy as np
+
+
+SUPPORTED_TABLE_YEARS = (2025,)
+
+
+# ===========================================
+# TAX BRACKET CONFIGURATIONS (2025)
+# ===========================================
+# Upper threshold of the open-ended top bracket: the int64 maximum rather
+# than float("inf"), so threshold arrays can stay integer
+TOP_BRACKET_THRESHOLD = 2**63 - 1
+
+TAX_BRACKETS_2025 = {
+    "single": [
+        (11600, 0.10),
+        (47150, 0.12),
+        (100525, 0.22),
+        (191950, 0.24),
+        (243725, 0.32),
+        (609350, 0.35),
+        (TOP_BRACKET_THRESHOLD, 0.37),
+    ],
+    "married_filing_jointly": [
+        (23200, 0.10),
+        (94300, 0.12),
+        (201050, 0.22),
+        (383900, 0.24),
+        (487450, 0.32),
+        (731200, 0.35),
+        (TOP_BRACKET_THRESHOLD, 0.37),
+    ],
+    "married_filing_separately": [
+        (11600, 0.10),
+        (47150, 0.12),
+        (100525, 0.22),
+        (191950, 0.24),
+        (243725, 0.32),
+        (365600, 0.35),
+        (TOP_BRACKET_THRESHOLD, 0.37),
+    ],
+    "head_of_household": [
+        (16550, 0.10),
+        (63100, 0.12),
+        (100500, 0.22),
+        (191950, 0.24),
+        (243700, 0.32),
+        (609350, 0.35),
+        (TOP_BRACKET_THRESHOLD, 0.37),
+    ],
+}
+
+# Rates are held as integer basis points in the array views below, so
+# bracket arithmetic on int cents stays exact (as in the tax engine)
+BASIS_POINTS = 10000
+
+
+def _threshold_cents(threshold: int) -> int:
+    # The top bracket's sentinel is already the int64 maximum
+    return threshold if threshold == TOP_BRACKET_THRESHOLD else threshold * 100
+
+
+# The same tables as (int64 upper thresholds in cents, int64 rates in
+# basis points) arrays, for bisection with np.searchsorted instead of a
+# linear scan; see marginal_rate
+TAX_BRACKETS_2025_ARR = {
+    status: (
+        np.array([_threshold_cents(threshold) for threshold, _ in brackets], dtype=np.int64),
+        np.array([round(rate * BASIS_POINTS) for _, rate in brackets], dtype=np.int64),
+    )
+    for status, brackets in TAX_BRACKETS_2025.items()
+}
+
+
+def marginal_rate(status: str, taxable_income_cents):
+    """
+    Marginal bracket rate, in basis points, for a filing status.
+
+    taxable_income_cents may be an int or an array of int cents (one
+    C-level bisection for the whole batch); a scalar gets a plain int
+    back. Income exactly at a threshold is in the lower bracket, matching
+    the bracket tables' upper bounds.
+    """
+    thresholds, rates = TAX_BRACKETS_2025_ARR.get(status, TAX_BRACKETS_2025_ARR["single"])
+    rate = rates[np.searchsorted(thresholds, taxable_income_cents, side="left")]
+    return rate if isinstance(rate, np.ndarray) else int(rate)
+
+
+# Per status: (bracket lower edges in cents, rates in basis points, tax in
+# cents * basis points accumulated below each edge), so the tax on any
+# income is one bisection plus one multiply-add; see bracket_liability
+def _cumulative_brackets(thresholds, rates):
+    lower_edges = np.concatenate(([0], thresholds[:-1]))
+    cum_at_lower = np.zeros_like(lower_edges)
+    cum_at_lower[1:] = np.cumsum(np.diff(lower_edges) * rates[:-1])
+    return lower_edges, rates, cum_at_lower
+
+
+TAX_BRACKETS_2025_CUM = {
+    status: _cumulative_brackets(thresholds, rates)
+    for status, (thresholds, rates) in TAX_BRACKETS_2025_ARR.items()
+}
+
+# Largest income the int64 array path handles without overflowing
+# cents * basis points * 2
+_MAX_ARRAY_INCOME_CENTS = np.iinfo(np.int64).max // (2 * BASIS_POINTS)
+
+
+def bracket_liability(status: str, taxable_income_cents):
+    """
+    Regular income tax from the 2025 brackets, in int cents.
+
+    Accumulates cents * basis points and rounds half-up once, so results
+    equal the tax engine's bracket tax to the cent for any int64 income
+    (past that the engine caps the income). taxable_income_cents
+    may be an int (plain int math, exact at any size) or an array of int
+    cents (one searchsorted and one multiply-add over the whole batch,
+    int64 out). Negative income is taxed as zero.
+    """
+    lower_edges, rates, cum_at_lower = TAX_BRACKETS_2025_CUM.get(
+        status, TAX_BRACKETS_2025_CUM["single"]
+    )
+    if np.ndim(taxable_income_cents) == 0:
+        income = max(int(taxable_income_cents), 0)
+        # Searching with the income capped at the top edge keeps huge ints
+        # out of int64 and lands in the same (top) bracket
+        i = int(np.searchsorted(lower_edges, min(income, int(lower_edges[-1])), side="right")) - 1
+        tax = int(cum_at_lower[i]) + (income - int(lower_edges[i])) * int(rates[i])
+        return (tax * 2 + BASIS_POINTS) // (2 * BASIS_POINTS)
+
+    income = np.maximum(np.asarray(taxable_income_cents, dtype=np.int64), 0)
+    i = np.searchsorted(lower_edges, income, side="right") - 1
+    tax = cum_at_lower[i] + (income - lower_edges[i]) * rates[i]
+    tax = (tax * 2 + BASIS_POINTS) // (2 * BASIS_POINTS)
+    # Incomes too large for int64 intermediates take the exact int path
+    for j in np.flatnonzero(income > _MAX_ARRAY_INCOME_CENTS):
+        tax[j] = bracket_liability(status, int(income[j]))
+    return tax
+
+
+# Standard Deductions 2025
+STANDARD_DEDUCTIONS_2025 = {
+    "single": 14600,
+    "married_filing_jointly": 29200,
+    "married_filing_separately": 14600,
+    "head_of_household": 21900,
+    "qualified_widow": 29200,
+}
+
+# Additional Standard Deduction (65+ or blind)
+ADDITIONAL_STANDARD_DEDUCTION_2025 = {
+    "single": 1950,
+    "married": 1550,
+}
+
+
+def brackets_for(year: int = 2025):
+    """Bracket tables {status: [(upper_threshold, rate), ...]} for a tax year"""
+    if year not in SUPPORTED_TABLE_YEARS:
+        raise ValueError(f"No tax tables for {year}")
+    return TAX_BRACKETS_2025
@@ -0,0 +1,148 @@
+"""
+GONZALES TAX PLATFORM - Core Utilities
+Agent Marisol - Chief Software Architect
+
+Hot-path helpers shared by the API layer: batched UUID generation and a
+millisecond-resolution cached UTC clock.
+"""
+import asyncio
+import os
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Deque, Optional, Tuple
+from uuid import UUID
+
+
+# ===========================================
+# BATCHED UUID GENERATION
+# ===========================================
+class UUIDPool:
+    """
+    Pool of pre-generated version 4 UUIDs.
+
+    uuid4() costs one os.urandom(16) syscall per id. The pool pulls entropy
+    for a whole batch with a single os.urandom call and slices it into
+    16-byte chunks. When the pool drops below the low watermark a refill is
+    scheduled on the running event loop (or done inline outside one).
+    """
+
+    def __init__(self, size: int = 1024, batch_size: int = 512, low_watermark: int = 128):
+        self.size = size
+        self.batch_size = batch_size
+        self.low_watermark = low_watermark
+        self._pool: Deque[UUID] = deque()
+        self._refill_task: Optional[asyncio.Task] = None
+        self._fill(size)
+
+    def _fill(self, count: int):
+        """Generate `count` UUIDs, one urandom syscall per batch"""
+        while count > 0:
+            batch = min(count, self.batch_size)
+            entropy = os.urandom(16 * batch)
+            self._pool.extend(
+                UUID(bytes=entropy[i:i + 16], version=4)
+                for i in range(0, len(entropy), 16)
+            )
+            count -= batch
+
+    async def refill(self):
+        """Top the pool back up to its configured size"""
+        try:
+            self._fill(self.size - len(self._pool))
+        finally:
+            self._refill_task = None
+
+    def _schedule_refill(self):
+        if self._refill_task is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._fill(self.size - len(self._pool))
+            return
+        self._refill_task = loop.create_task(self.refill())
+
+    def reset(self):
+        """
+        Drop every pre-generated id. Registered to run in forked children:
+        ids inherited from the parent would otherwise be handed out by
+        both processes.
+        """
+        self._pool.clear()
+        self._refill_task = None
+
+    def get(self) -> UUID:
+        """Take a UUID from the pool"""
+        if len(self._pool) <= self.low_watermark:
+            self._schedule_refill()
+        try:
+            return self._pool.popleft()
+        except IndexError:
+            self._fill(self.batch_size)
+            return self._pool.popleft()
+
+
+# ===========================================
+# CACHED CLOCK
+# ===========================================
+class CachedClock:
+    """
+    UTC clock cached for `resolution` seconds.
+
+    A read within `resolution` seconds (by time.monotonic) of the last
+    real read returns the same value, so a burst of reads shares one
+    clock call. Expiry is checked on read, so the cached value never
+    outlives its window whether or not an event loop is running.
+    """
+
+    def __init__(self, resolution: float = 0.001):
+        self.resolution = resolution
+        # (monotonic time of the real read, value read); one attribute so
+        # threads always see a consistent pair
+        self._cached: Tuple[float, Optional[datetime]] = (float("-inf"), None)
+
+    def now(self) -> datetime:
+        """Naive UTC timestamp, same convention as datetime.utcnow()"""
+        read_at, current = self._cached
+        monotonic_now = time.monotonic()
+        if monotonic_now - read_at < self.resolution:
+            return current
+        current = datetime.utcnow()
+        self._cached = (monotonic_now, current)
+        return current
+
+
+_uuid_pool = UUIDPool()
+_clock = CachedClock()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_uuid_pool.reset)
+
+# Smallest step mutation_time() moves a timestamp forward by
+_TICK = timedelta(microseconds=1)
+
+
+def new_uuid() -> UUID:
+    """Get a random (version 4) UUID from the shared pool"""
+    return _uuid_pool.get()
+
+
+def utcnow() -> datetime:
+    """Get the current naive UTC time at millisecond resolution"""
+    return _clock.now()
+
+
+def mutation_time(previous: Optional[datetime] = None) -> datetime:
+    """
+    Timestamp for a change to a record last stamped `previous`.
+
+    utcnow() is shared across a millisecond, so two changes to the same
+    record can read the same value; the result is moved one microsecond
+    past `previous` when needed, so each change gets a distinct
+    updated_at (ETags and cached results are keyed on it).
+    """
+    current = utcnow()
+    if previous is not None and current <= previous:
+        return previous + _TICK
+    return current
@@ -10,155 +10,111 @@ Reference Publications:
 - Publication 5594: Standard Postal Service State Abbreviations and ZIP Codes
 """
 
-from .mef_standards import (
-    MeFVersion,
-    SubmissionType,
-    TransmissionType,
-    MeFNamespaces,
-    MeFTransmitterInfo,
-    MeFSubmissionManifest,
-    MeFSecurityHeader,
-    MeFValidationRules,
-    MeFErrorCodes,
-    ATSTestScenario,
-    ATSTestSuite
-)
+import importlib
 
-from .xml_builder import (
-    XMLNamespaceManager,
-    IRSAmount,
-    IRSXMLBuilder
-)
-
-from .ack_parser import (
-    AckStatus,
-    AlertCategory,
-    IRSError,
-    StateAck,
-    AckResult,
-    ACKParser,
-    ACKStatusChecker
-)
-
-from .security_compliance import (
-    SecurityLevel,
-    ComplianceFramework,
-    AuditLogEntry,
-    PIIProtection,
-    EncryptionService,
-    AuditLogger,
-    AccessControl,
-    ComplianceChecker,
-    SessionManager
-)
-
-from .a2a_toolkit import (
-    MeFEndpoint,
-    MeFOperation,
-    CertificateType,
-    MeFCertificate,
-    A2AConfiguration,
-    A2ASOAPEnvelope,
-    ATSTestManager,
-    IRSPublicationReference
-)
-
-from .form_schemas import (
-    FormCategory,
-    FormSchema,
-    FORM_1040_SCHEMAS,
-    SCHEDULE_SCHEMAS,
-    BUSINESS_FORM_SCHEMAS,
-    US_STATE_CODES,
-    STATES_WITH_INCOME_TAX,
-    STATES_NO_INCOME_TAX,
-    BinaryAttachmentSpec,
-    BINARY_ATTACHMENT_TYPES,
-    PDF_NAMING_CONVENTIONS,
-    FormSchemaManager
-)
-
-from .mef_providers import (
-    MeFFormCategory,
-    MeFFormType,
-    MEF_FORM_TYPES,
-    MeFProviderCredentials,
-    SSAConfiguration,
-    SSAFormats,
-    MeFProviderManager,
-    InformationReturnManager
-)
-
-__all__ = [
+# Public names by submodule. Submodules are imported on first access to one
+# of their names (PEP 562), so e.g. using ACKParser does not load the
+# security or XML modules
+_SUBMODULE_EXPORTS = {
     # MeF Standards
-    'MeFVersion',
-    'SubmissionType',
-    'TransmissionType',
-    'MeFNamespaces',
-    'MeFTransmitterInfo',
-    'MeFSubmissionManifest',
-    'MeFSecurityHeader',
-    'MeFValidationRules',
-    'MeFErrorCodes',
-    'ATSTestScenario',
-    'ATSTestSuite',
-
+    'mef_standards': (
+        'MeFVersion',
+        'SubmissionType',
+        'TransmissionType',
+        'MeFNamespaces',
+        'MeFTransmitterInfo',
+        'MeFSubmissionManifest',
+        'MeFSecurityHeader',
+        'MeFValidationRules',
+        'MeFErrorCodes',
+        'ATSTestScenario',
+        'ATSTestSuite',
+    ),
     # XML Builder
-    'XMLNamespaceManager',
-    'IRSAmount',
-    'IRSXMLBuilder',
-
+    'xml_builder': (
+        'XMLNamespaceManager',
+        'IRSAmount',
+        'IRSXMLBuilder',
+    ),
     # ACK Parser
-    'AckStatus',
-    'AlertCategory',
-    'IRSError',
-    'StateAck',
-    'AckResult',
-    'ACKParser',
-    'ACKStatusChecker',
-
+    'ack_parser': (
+        'AckStatus',
+        'AlertCategory',
+        'IRSError',
+        'StateAck',
+        'AckResult',
+        'ACKParser',
+        'ACKStatusChecker',
+    ),
     # Security & Compliance
-    'SecurityLevel',
-    'ComplianceFramework',
-    'AuditLogEntry',
-    'PIIProtection',
-    'EncryptionService',
-    'AuditLogger',
-    'AccessControl',
-    'ComplianceChecker',
-    'SessionManager',
-
+    'security_compliance': (
+        'SecurityLevel',
+        'ComplianceFramework',
+        'AuditLogEntry',
+        'PIIProtection',
+        'EncryptionService',
+        'AuditLogger',
+        'AccessControl',
+        'ComplianceChecker',
+        'SessionManager',
+    ),
     # A2A Toolkit
-    'MeFEndpoint',
-    'MeFOperation',
-    'CertificateType',
-    'MeFCertificate',
-    'A2AConfiguration',
-    'A2ASOAPEnvelope',
-    'ATSTestManager',
-    'IRSPublicationReference',
-
+    'a2a_toolkit': (
+        'MeFEndpoint',
+        'MeFOperation',
+        'CertificateType',
+        'MeFCertificate',
+        'A2AConfiguration',
+        'A2ASOAPEnvelope',
+        'ATSTestManager',
+        'IRSPublicationReference',
+        'clear_ssl_context_cache',
+    ),
     # Form Schemas
-    'FormCategory',
-    'FormSchema',
-    'FORM_1040_SCHEMAS',
-    'SCHEDULE_SCHEMAS',
-    'BUSINESS_FORM_SCHEMAS',
-    'US_STATE_CODES',
-    'STATES_WITH_INCOME_TAX',
-    'STATES_NO_INCOME_TAX',
-    'BinaryAttachmentSpec',
-    'BINARY_ATTACHMENT_TYPES',
-    'PDF_NAMING_CONVENTIONS',
-    'FormSchemaManager',
-
+    'form_schemas': (
+        'FormCategory',
+        'FormSchema',
+        'FORM_1040_SCHEMAS',
+        'SCHEDULE_SCHEMAS',
+        'BUSINESS_FORM_SCHEMAS',
+        'US_STATE_CODES',
+        'STATES_WITH_INCOME_TAX',
+        'STATES_NO_INCOME_TAX',
+        'BinaryAttachmentSpec',
+        'BINARY_ATTACHMENT_TYPES',
+        'PDF_NAMING_CONVENTIONS',
+        'FormSchemaManager',
+    ),
     # MeF Providers
-    'MeFFormCategory',
-    'MeFFormType',
-    'MEF_FORM_TYPES',
-    'MeFProviderCredentials',
-    'SSAConfiguration',
-    'SSAFormats',
-    'MeFProviderManager',
-    'InformationReturnManager'
-]
+    'mef_providers': (
+        'MeFFormCategory',
+        'MeFFormType',
+        'MEF_FORM_TYPES',
+        'MeFProviderCredentials',
+        'SSAConfiguration',
+        'SSAFormats',
+        'MeFProviderManager',
+        'InformationReturnManager',
+    ),
+}
+
+_EXPORTS = {
+    name: module
+    for module, names in _SUBMODULE_EXPORTS.items()
+    for name in names
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -10,12 +10,13 @@ Reference Publications:
 
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any, Tuple
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from enum import Enum
 import hashlib
 import base64
 import ssl
 import os
+import time
 from pathlib import Path
 
 
@@ -52,6 +53,19 @@ class CertificateType(Enum):
     STRONG_AUTH = "strong_auth"  # IdenTrust or ORC certificates
 
 
+# (monotonic time of last refresh, today's date ordinal); see _today_ordinal
+_TODAY_CACHE = [float("-inf"), 0]
+
+
+def _today_ordinal() -> int:
+    """date.today().toordinal(), re-read at most once per second"""
+    now = time.monotonic()
+    if now - _TODAY_CACHE[0] > 1.0:
+        _TODAY_CACHE[0] = now
+        _TODAY_CACHE[1] = date.today().toordinal()
+    return _TODAY_CACHE[1]
+
+
 @dataclass
 class MeFCertificate:
     """
@@ -77,10 +91,10 @@ class MeFCertificate:
 
     def is_valid(self) -> bool:
         """Check if certificate is currently valid"""
-        today = date.today()
-        if self.valid_from and today < self.valid_from:
+        today = _today_ordinal()
+        if self.valid_from and today < self.valid_from.toordinal():
             return False
-        if self.valid_to and today > self.valid_to:
+        if self.valid_to and today > self.valid_to.toordinal():
             return False
         return True
 
@@ -88,7 +102,40 @@ class MeFCertificate:
         """Get days until certificate expires"""
         if not self.valid_to:
             return -1
-        return (self.valid_to - date.today()).days
+        return self.valid_to.toordinal() - _today_ordinal()
+
+
+# (cert_path, key_path, cert mtime, key mtime) -> client SSL context
+_SSL_CONTEXTS: Dict[Tuple[str, str, int, int], ssl.SSLContext] = {}
+_MAX_SSL_CONTEXTS = 8
+
+
+def _build_ssl_context(cert_path: str, key_path: str,
+                       password: Optional[str]) -> ssl.SSLContext:
+    """
+    Client SSL context for a MeF certificate, built once per certificate
+    and shared by every connection that uses it (loading the chain parses
+    and decrypts the key files). Keyed on the files' modification times so
+    a renewed certificate written over the old paths is picked up; the
+    password is never part of the key.
+    """
+    key = (cert_path, key_path,
+           os.stat(cert_path).st_mtime_ns, os.stat(key_path).st_mtime_ns)
+    context = _SSL_CONTEXTS.get(key)
+    if context is None:
+        context = ssl.create_default_context()
+        context.load_cert_chain(cert_path, key_path, password)
+        for stale in [k for k in _SSL_CONTEXTS if k[:2] == key[:2]]:
+            del _SSL_CONTEXTS[stale]
+        if len(_SSL_CONTEXTS) >= _MAX_SSL_CONTEXTS:
+            del _SSL_CONTEXTS[next(iter(_SSL_CONTEXTS))]
+        _SSL_CONTEXTS[key] = context
+    return context
+
+
+def clear_ssl_context_cache() -> None:
+    """Drop every cached client SSL context (e.g. after revoking a certificate)"""
+    _SSL_CONTEXTS.clear()
 
 
 @dataclass
@@ -136,6 +183,15 @@ class A2AConfiguration:
             return self.production_certificate
         return self.ats_certificate
 
+    def get_ssl_context(self) -> ssl.SSLContext:
+        """Get the (cached) client SSL context for the active certificate"""
+        certificate = self.active_certificate
+        if certificate is None:
+            raise ValueError("No MeF certificate configured for the active environment")
+        return _build_ssl_context(
+            certificate.cert_path, certificate.key_path, certificate.password
+        )
+
 
 class A2ASOAPEnvelope:
     """
@@ -157,23 +213,118 @@ class A2ASOAPEnvelope:
 
     def build_login_request(self) -> str:
         """Build SOAP Login request"""
-        timestamp = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+        timestamp, expires = self._now_and_expiry()
         nonce = base64.b64encode(os.urandom(16)).decode()
 
-        return f'''<?xml version="1.0" encoding="UTF-8"?>
-<soap:Envelope xmlns:soap="{self.SOAP_NS}"
-               xmlns:wsse="{self.WSSE_NS}"
-               xmlns:wsu="{self.WSU_NS}"
-               xmlns:mef="{self.MEF_NS}">
+        return _LOGIN_ENVELOPE.format_map({
+            "timestamp": timestamp,
+            "expires": expires,
+            "username": self.config.username,
+            "password": self.config.password,
+            "nonce": nonce,
+            "etin": self.config.etin,
+        })
+
+    def build_send_submissions_request(self, submission_id: str,
+                                        submission_xml: str,
+                                        attachments: List[Dict] = None) -> str:
+        """
+        Build SOAP SendSubmissions request with MTOM attachments
+
+        Per Publication 5446, submissions must include:
+        - Submission manifest
+        - Return XML
+        - Binary attachments (PDFs) as MTOM
+        """
+        timestamp, expires = self._now_and_expiry()
+
+        # Encode once; the base64 payload and the checksum share the bytes
+        submission_bytes = submission_xml.encode("utf-8")
+        submission_b64 = base64.b64encode(submission_bytes).decode()
+
+        # Manifest checksum (MD5 digest of the return XML)
+        checksum = hashlib.md5(submission_bytes, usedforsecurity=False).hexdigest()
+
+        return _SEND_SUBMISSIONS_ENVELOPE.format_map({
+            "security_header": self._build_security_header(timestamp, expires),
+            "submission_id": submission_id,
+            "timestamp": timestamp,
+            "efin": self.config.efin,
+            "etin": self.config.etin,
+            "software_id": self.config.software_id,
+            "software_version": self.config.software_version,
+            "checksum": checksum,
+            "submission_b64": submission_b64,
+        })
+
+    def build_get_ack_request(self, submission_id: str) -> str:
+        """Build GetAckForSubmission request"""
+        timestamp, expires = self._now_and_expiry()
+
+        return _GET_ACK_ENVELOPE.format_map({
+            "security_header": self._build_security_header(timestamp, expires),
+            "submission_id": submission_id,
+        })
+
+    def build_get_new_acks_request(self, max_results: int = 100) -> str:
+        """Build GetNewAcksForETIN request"""
+        timestamp, expires = self._now_and_expiry()
+
+        return _GET_NEW_ACKS_ENVELOPE.format_map({
+            "security_header": self._build_security_header(timestamp, expires),
+            "etin": self.config.etin,
+            "max_results": max_results,
+        })
+
+    def build_logout_request(self) -> str:
+        """Build Logout request"""
+        timestamp, expires = self._now_and_expiry()
+
+        return _LOGOUT_ENVELOPE.format_map({
+            "security_header": self._build_security_header(timestamp, expires),
+        })
+
+    def _build_security_header(self, timestamp: str, expires: str) -> str:
+        """Build WS-Security header"""
+        nonce = base64.b64encode(os.urandom(16)).decode()
+
+        return _SECURITY_HEADER.format_map({
+            "timestamp": timestamp,
+            "expires": expires,
+            "username": self.config.username,
+            "password": self.config.password,
+            "nonce": nonce,
+        })
+
+    def _now_and_expiry(self, minutes: int = 5) -> Tuple[str, str]:
+        """Current UTC timestamp and the security expiry, both as ISO strings"""
+        now = datetime.utcnow()
+        expires = now + timedelta(minutes=minutes)
+        return now.strftime("%Y-%m-%dT%H:%M:%SZ"), expires.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+# SOAP envelope templates, with the fixed namespace URIs substituted once at
+# import; the builders above only fill in the per-request fields
+def _compile_envelope(raw: str) -> str:
+    for name in ("SOAP_NS", "WSSE_NS", "WSU_NS", "MEF_NS"):
+        raw = raw.replace("{" + name + "}", getattr(A2ASOAPEnvelope, name))
+    return raw
+
+
+_LOGIN_ENVELOPE = _compile_envelope('''<?xml version="1.0" encoding="UTF-8"?>
+<soap:Envelope xmlns:soap="{SOAP_NS}"
+               xmlns:wsse="{WSSE_NS}"
+               xmlns:wsu="{WSU_NS}"
+               xmlns:mef="{MEF_NS}">
     <soap:Header>
         <wsse:Security soap:mustUnderstand="1">
             <wsu:Timestamp wsu:Id="TS-1">
                 <wsu:Created>{timestamp}</wsu:Created>
-                <wsu:Expires>{self._add_minutes(timestamp, 5)}</wsu:Expires>
+                <wsu:Expires>{expires}</wsu:Expires>
             </wsu:Timestamp>
             <wsse:UsernameToken wsu:Id="UT-1">
-                <wsse:Username>{self.config.username}</wsse:Username>
-                <wsse:Password Type="http://docs.oasis-open.org/wss/2004/01/oasis-200401-wss-username-token-profile-1.0#PasswordText">{self.config.password}</wsse:Password>
+                <wsse:Username>{username}</wsse:Username>
+                <wsse:Password Type="http://docs.oasis-open.org/wss/2004/01/oasis-200401-wss-username-token-profile-1.0#PasswordText">{password}</wsse:Password>
                 <wsse:Nonce EncodingType="http://docs.oasis-open.org/wss/2004/01/oasis-200401-wss-soap-message-security-1.0#Base64Binary">{nonce}</wsse:Nonce>
                 <wsu:Created>{timestamp}</wsu:Created>
             </wsse:UsernameToken>
@@ -181,35 +332,16 @@ class A2ASOAPEnvelope:
     </soap:Header>
     <soap:Body>
         <mef:LoginRequest>
-            <mef:ETIN>{self.config.etin}</mef:ETIN>
+            <mef:ETIN>{etin}</mef:ETIN>
         </mef:LoginRequest>
     </soap:Body>
-</soap:Envelope>'''
+</soap:Envelope>''')
 
-    def build_send_submissions_request(self, submission_id: str,
-                                        submission_xml: str,
-                                        attachments: List[Dict] = None) -> str:
-        """
-        Build SOAP SendSubmissions request with MTOM attachments
-
-        Per Publication 5446, submissions must include:
-        - Submission manifest
-        - Return XML
-        - Binary attachments (PDFs) as MTOM
-        """
-        timestamp = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
-
-        # Base64 encode the submission XML
-        submission_b64 = base64.b64encode(submission_xml.encode()).decode()
-
-        # Calculate checksum
-        checksum = hashlib.md5(submission_xml.encode()).hexdigest()
-
-        return f'''<?xml version="1.0" encoding="UTF-8"?>
-<soap:Envelope xmlns:soap="{self.SOAP_NS}"
-               xmlns:mef="{self.MEF_NS}">
+_SEND_SUBMISSIONS_ENVELOPE = _compile_envelope('''<?xml version="1.0" encoding="UTF-8"?>
+<soap:Envelope xmlns:soap="{SOAP_NS}"
+               xmlns:mef="{MEF_NS}">
     <soap:Header>
-        {self._build_security_header(timestamp)}
+        {security_header}
     </soap:Header>
     <soap:Body>
         <mef:SendSubmissionsRequest>
@@ -218,10 +350,10 @@ class A2ASOAPEnvelope:
                     <mef:SubmissionId>{submission_id}</mef:SubmissionId>
                     <mef:ElectronicPostmark>{timestamp}</mef:ElectronicPostmark>
                     <mef:SubmissionManifest>
-                        <mef:EFIN>{self.config.efin}</mef:EFIN>
-                        <mef:ETIN>{self.config.etin}</mef:ETIN>
-                        <mef:SoftwareId>{self.config.software_id}</mef:SoftwareId>
-                        <mef:SoftwareVersionNum>{self.config.software_version}</mef:SoftwareVersionNum>
+                        <mef:EFIN>{efin}</mef:EFIN>
+                        <mef:ETIN>{etin}</mef:ETIN>
+                        <mef:SoftwareId>{software_id}</mef:SoftwareId>
+                        <mef:SoftwareVersionNum>{software_version}</mef:SoftwareVersionNum>
                         <mef:Checksum>{checksum}</mef:Checksum>
                     </mef:SubmissionManifest>
                     <mef:ReturnData>{submission_b64}</mef:ReturnData>
@@ -229,83 +361,60 @@ class A2ASOAPEnvelope:
             </mef:SubmissionDataList>
         </mef:SendSubmissionsRequest>
     </soap:Body>
-</soap:Envelope>'''
-
-    def build_get_ack_request(self, submission_id: str) -> str:
-        """Build GetAckForSubmission request"""
-        timestamp = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+</soap:Envelope>''')
 
-        return f'''<?xml version="1.0" encoding="UTF-8"?>
-<soap:Envelope xmlns:soap="{self.SOAP_NS}"
-               xmlns:mef="{self.MEF_NS}">
+_GET_ACK_ENVELOPE = _compile_envelope('''<?xml version="1.0" encoding="UTF-8"?>
+<soap:Envelope xmlns:soap="{SOAP_NS}"
+               xmlns:mef="{MEF_NS}">
     <soap:Header>
-        {self._build_security_header(timestamp)}
+        {security_header}
     </soap:Header>
     <soap:Body>
         <mef:GetAckForSubmissionRequest>
             <mef:SubmissionId>{submission_id}</mef:SubmissionId>
         </mef:GetAckForSubmissionRequest>
     </soap:Body>
-</soap:Envelope>'''
-
-    def build_get_new_acks_request(self, max_results: int = 100) -> str:
-        """Build GetNewAcksForETIN request"""
-        timestamp = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+</soap:Envelope>''')
 
-        return f'''<?xml version="1.0" encoding="UTF-8"?>
-<soap:Envelope xmlns:soap="{self.SOAP_NS}"
-               xmlns:mef="{self.MEF_NS}">
+_GET_NEW_ACKS_ENVELOPE = _compile_envelope('''<?xml version="1.0" encoding="UTF-8"?>
+<soap:Envelope xmlns:soap="{SOAP_NS}"
+               xmlns:mef="{MEF_NS}">
     <soap:Header>
-        {self._build_security_header(timestamp)}
+        {security_header}
     </soap:Header>
     <soap:Body>
         <mef:GetNewAcksForETINRequest>
-            <mef:ETIN>{self.config.etin}</mef:ETIN>
+            <mef:ETIN>{etin}</mef:ETIN>
             <mef:MaxResultCnt>{max_results}</mef:MaxResultCnt>
         </mef:GetNewAcksForETINRequest>
     </soap:Body>
-</soap:Envelope>'''
+</soap:Envelope>''')
 
-    def build_logout_request(self) -> str:
-        """Build Logout request"""
-        timestamp = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
-
-        return f'''<?xml version="1.0" encoding="UTF-8"?>
-<soap:Envelope xmlns:soap="{self.SOAP_NS}"
-               xmlns:mef="{self.MEF_NS}">
+_LOGOUT_ENVELOPE = _compile_envelope('''<?xml version="1.0" encoding="UTF-8"?>
+<soap:Envelope xmlns:soap="{SOAP_NS}"
+               xmlns:mef="{MEF_NS}">
     <soap:Header>
-        {self._build_security_header(timestamp)}
+        {security_header}
     </soap:Header>
     <soap:Body>
         <mef:LogoutRequest/>
     </soap:Body>
-</soap:Envelope>'''
-
-    def _build_security_header(self, timestamp: str) -> str:
-        """Build WS-Security header"""
-        nonce = base64.b64encode(os.urandom(16)).decode()
+</soap:Envelope>''')
 
-        return f'''<wsse:Security xmlns:wsse="{self.WSSE_NS}"
-                          xmlns:wsu="{self.WSU_NS}"
+_SECURITY_HEADER = _compile_envelope('''<wsse:Security xmlns:wsse="{WSSE_NS}"
+                          xmlns:wsu="{WSU_NS}"
                           soap:mustUnderstand="1">
             <wsu:Timestamp wsu:Id="TS-1">
                 <wsu:Created>{timestamp}</wsu:Created>
-                <wsu:Expires>{self._add_minutes(timestamp, 5)}</wsu:Expires>
+                <wsu:Expires>{expires}</wsu:Expires>
             </wsu:Timestamp>
             <wsse:UsernameToken wsu:Id="UT-1">
-                <wsse:Username>{self.config.username}</wsse:Username>
-                <wsse:Password>{self.config.password}</wsse:Password>
+                <wsse:Username>{username}</wsse:Username>
+                <wsse:Password>{password}</wsse:Password>
                 <wsse:Nonce>{nonce}</wsse:Nonce>
                 <wsu:Created>{timestamp}</wsu:Created>
             </wsse:UsernameToken>
-        </wsse:Security>'''
-
-    def _add_minutes(self, timestamp: str, minutes: int) -> str:
-        """Add minutes to ISO timestamp"""
-        dt = datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%SZ")
-        from datetime import timedelta
-        dt = dt + timedelta(minutes=minutes)
-        return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+        </wsse:Security>''')
 
 
 class ATSTestManager:
@@ -373,12 +482,19 @@ class ATSTestManager:
         {"id": "ATS-EDGE-004", "category": "edge_case", "name": "Large refund"},
     ]
 
+    # Scenario lookups by id and by category, built once with the class
+    _BY_ID: Dict[str, Dict] = {s["id"]: s for s in REQUIRED_SCENARIOS}
+    _BY_CATEGORY: Dict[str, List[Dict]] = {}
+    for _scenario in REQUIRED_SCENARIOS:
+        _BY_CATEGORY.setdefault(_scenario["category"], []).append(_scenario)
+    del _scenario
+
     def __init__(self):
         self.results: List[Dict] = []
 
     def get_scenarios_by_category(self, category: str) -> List[Dict]:
         """Get test scenarios by category"""
-        return [s for s in self.REQUIRED_SCENARIOS if s["category"] == category]
+        return list(self._BY_CATEGORY.get(category, ()))
 
     def get_all_scenarios(self) -> List[Dict]:
         """Get all required ATS scenarios"""
@@ -387,10 +503,7 @@ class ATSTestManager:
     def record_result(self, scenario_id: str, passed: bool,
                       details: Optional[Dict] = None):
         """Record ATS test result"""
-        scenario = next(
-            (s for s in self.REQUIRED_SCENARIOS if s["id"] == scenario_id),
-            None
-        )
+        scenario = self._BY_ID.get(scenario_id)
 
         self.results.append({
             "scenario_id": scenario_id,
@@ -451,19 +564,23 @@ SUMMARY:
 RESULTS BY CATEGORY:
 """
 
+        # First result per scenario and passes per category, in one pass
+        first_result: Dict[str, Dict] = {}
+        passed_by_category: Dict[str, int] = {}
+        for r in self.results:
+            first_result.setdefault(r["scenario_id"], r)
+            if r["passed"]:
+                passed_by_category[r["category"]] = passed_by_category.get(r["category"], 0) + 1
+
         for category, name in self.SCENARIO_CATEGORIES.items():
-            cat_scenarios = self.get_scenarios_by_category(category)
-            cat_results = [r for r in self.results if r["category"] == category]
-            cat_passed = sum(1 for r in cat_results if r["passed"])
+            cat_scenarios = self._BY_CATEGORY.get(category, ())
+            cat_passed = passed_by_category.get(category, 0)
 
             report += f"\n  {name}:\n"
             report += f"    Passed: {cat_passed} / {len(cat_scenarios)}\n"
 
             for scenario in cat_scenarios:
-                result = next(
-                    (r for r in self.results if r["scenario_id"] == scenario["id"]),
-                    None
-                )
+                result = first_result.get(scenario["id"])
                 status_icon = "✓" if result and result["passed"] else "✗" if result else "○"
                 report += f"      {status_icon} {scenario['id']}: {scenario['name']}\n"
 
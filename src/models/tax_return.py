@@ -9,7 +9,7 @@ from decimal import Decimal, ROUND_HALF_UP
 from typing import Optional, List, Dict, Any
 from enum import Enum
 from uuid import UUID, uuid4
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 
 # ===========================================
@@ -80,6 +80,8 @@ def gaap_round(amount: Decimal, precision: int = 2) -> Decimal:
 # ===========================================
 class TaxpayerInfo(BaseModel):
     """Taxpayer personal information"""
+    model_config = ConfigDict(ser_json_bytes="base64", val_json_bytes="base64")
+
     id: UUID = Field(default_factory=uuid4)
     first_name: str = Field(..., min_length=1, max_length=50)
     middle_name: Optional[str] = Field(None, max_length=50)
@@ -149,6 +151,8 @@ class TaxpayerInfo(BaseModel):
 # ===========================================
 class Dependent(BaseModel):
     """Dependent information for tax return"""
+    model_config = ConfigDict(ser_json_bytes="base64", val_json_bytes="base64")
+
     id: UUID = Field(default_factory=uuid4)
     first_name: str = Field(..., min_length=1, max_length=50)
     last_name: str = Field(..., min_length=1, max_length=50)
@@ -503,6 +507,9 @@ class TaxReturn(BaseModel):
     completed_by: Optional[str] = None  # User or preparer ID
 
     class Config:
+        # Encrypted fields are arbitrary bytes - round-trip them as base64
+        ser_json_bytes = "base64"
+        val_json_bytes = "base64"
         json_encoders = {
             Decimal: lambda v: str(v),
             datetime: lambda v: v.isoformat(),
@@ -0,0 +1,2 @@
+"""Application services"""
+from .return_store import ReturnStore, get_return_store
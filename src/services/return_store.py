@@ -0,0 +1,297 @@
+"""
+GONZALES TAX PLATFORM - Tax Return Store
+Agent Valentina - Backend/API Master
+
+Storage interface for tax returns used by the API layer.
+
+Provides:
+- InMemoryReturnStore: process-local store (development / single worker)
+- RedisReturnStore: shared store for multi-worker deployments, with
+  per-user sorted-set indexes so listing is an O(log N) range query
+
+Read-modify-write sequences hold the store's per-return lock(), which the
+Redis store shares between workers.
+"""
+from abc import ABC, abstractmethod
+from typing import AsyncContextManager, Dict, List, Optional, Tuple
+from uuid import UUID
+from weakref import WeakValueDictionary
+import asyncio
+
+import redis.asyncio as aioredis
+from pydantic import TypeAdapter
+
+from ..models.tax_return import TaxReturn, ReturnStatus
+from ..core.config import get_settings
+
+
+# ===========================================
+# STORE INTERFACE
+# ===========================================
+class ReturnStore(ABC):
+    """Async storage interface for tax returns"""
+
+    @abstractmethod
+    def lock(self, return_id: UUID) -> AsyncContextManager:
+        """
+        Lock serializing get -> modify -> put of one return across every
+        process sharing the store.
+        """
+
+    @abstractmethod
+    async def get(self, return_id: UUID) -> Optional[TaxReturn]:
+        ...
+
+    @abstractmethod
+    async def put(self, tax_return: TaxReturn) -> None:
+        ...
+
+    @abstractmethod
+    async def delete(self, tax_return: TaxReturn) -> None:
+        ...
+
+    @abstractmethod
+    async def list_for_user(
+        self,
+        user_id: UUID,
+        tax_year: Optional[int] = None,
+        status: Optional[ReturnStatus] = None,
+        offset: int = 0,
+        limit: int = 20
+    ) -> Tuple[List[TaxReturn], int]:
+        """
+        List a user's returns, most recently updated first.
+        Returns (page_of_returns, total_matching).
+        """
+
+
+# ===========================================
+# IN-MEMORY STORE
+# ===========================================
+class InMemoryReturnStore(ReturnStore):
+    """Process-local store; returns are held as live objects"""
+
+    def __init__(self):
+        self._returns: Dict[UUID, TaxReturn] = {}
+        # Weakly held: a lock lives only while some request is holding or
+        # waiting on it
+        self._locks: "WeakValueDictionary[UUID, asyncio.Lock]" = WeakValueDictionary()
+
+    def lock(self, return_id: UUID) -> asyncio.Lock:
+        lock = self._locks.get(return_id)
+        if lock is None:
+            lock = self._locks[return_id] = asyncio.Lock()
+        return lock
+
+    async def get(self, return_id: UUID) -> Optional[TaxReturn]:
+        return self._returns.get(return_id)
+
+    async def put(self, tax_return: TaxReturn) -> None:
+        self._returns[tax_return.id] = tax_return
+
+    async def delete(self, tax_return: TaxReturn) -> None:
+        self._returns.pop(tax_return.id, None)
+
+    async def list_for_user(
+        self,
+        user_id: UUID,
+        tax_year: Optional[int] = None,
+        status: Optional[ReturnStatus] = None,
+        offset: int = 0,
+        limit: int = 20
+    ) -> Tuple[List[TaxReturn], int]:
+        user_returns = [
+            r for r in self._returns.values()
+            if r.user_id == user_id
+            and (not tax_year or r.tax_year == tax_year)
+            and (not status or r.status == status)
+        ]
+        user_returns.sort(key=lambda x: x.updated_at, reverse=True)
+        return user_returns[offset:offset + limit], len(user_returns)
+
+
+# ===========================================
+# REDIS STORE
+# ===========================================
+# Validates a whole page of returns in one call
+_TAX_RETURN_LIST = TypeAdapter(List[TaxReturn])
+
+
+class RedisReturnStore(ReturnStore):
+    """
+    Redis-backed store shared by all workers.
+
+    Keys:
+        ret:{id}                          - return serialized as JSON
+        user:{uid}:by_updated             - sorted set of ids scored by updated_at
+        user:{uid}:year:{year}            - same, restricted to a tax year
+        user:{uid}:status:{status}        - same, restricted to a status
+        lock:ret:{id}                     - per-return lock held by lock()
+
+    Multi-key writes go through one pipeline (one round trip).
+    """
+
+    TEMP_KEY_TTL_SECONDS = 30
+    # A lock expires on its own if its holder dies; waiting for one gives
+    # up (redis.exceptions.LockError) after LOCK_WAIT_SECONDS
+    LOCK_TIMEOUT_SECONDS = 30
+    LOCK_WAIT_SECONDS = 10
+
+    def __init__(self, url: str, max_connections: int = 50, ttl_seconds: Optional[int] = None):
+        self.redis = aioredis.from_url(url, max_connections=max_connections)
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def _return_key(return_id: UUID) -> str:
+        return f"ret:{return_id}"
+
+    @staticmethod
+    def _user_key(user_id: UUID, suffix: str = "by_updated") -> str:
+        return f"user:{user_id}:{suffix}"
+
+    def lock(self, return_id: UUID) -> AsyncContextManager:
+        return self.redis.lock(
+            f"lock:ret:{return_id}",
+            timeout=self.LOCK_TIMEOUT_SECONDS,
+            blocking_timeout=self.LOCK_WAIT_SECONDS
+        )
+
+    async def get(self, return_id: UUID) -> Optional[TaxReturn]:
+        data = await self.redis.get(self._return_key(return_id))
+        if data is None:
+            return None
+        return TaxReturn.model_validate_json(data)
+
+    async def put(self, tax_return: TaxReturn) -> None:
+        uid = tax_return.user_id
+        member = str(tax_return.id)
+        score = tax_return.updated_at.timestamp()
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.set(
+                self._return_key(tax_return.id),
+                tax_return.model_dump_json(),
+                ex=self.ttl_seconds
+            )
+            pipe.zadd(self._user_key(uid), {member: score})
+            pipe.zadd(self._user_key(uid, f"year:{tax_return.tax_year}"), {member: score})
+            # Status may have changed - drop the id from every other status index
+            for status in ReturnStatus:
+                key = self._user_key(uid, f"status:{status.value}")
+                if status == tax_return.status:
+                    pipe.zadd(key, {member: score})
+                else:
+                    pipe.zrem(key, member)
+            await pipe.execute()
+
+    async def delete(self, tax_return: TaxReturn) -> None:
+        uid = tax_return.user_id
+        member = str(tax_return.id)
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(self._return_key(tax_return.id))
+            pipe.zrem(self._user_key(uid), member)
+            pipe.zrem(self._user_key(uid, f"year:{tax_return.tax_year}"), member)
+            for status in ReturnStatus:
+                pipe.zrem(self._user_key(uid, f"status:{status.value}"), member)
+            await pipe.execute()
+
+    async def list_for_user(
+        self,
+        user_id: UUID,
+        tax_year: Optional[int] = None,
+        status: Optional[ReturnStatus] = None,
+        offset: int = 0,
+        limit: int = 20
+    ) -> Tuple[List[TaxReturn], int]:
+        while True:
+            total, ids = await self._query_index(user_id, tax_year, status, offset, limit)
+            if not ids:
+                return [], total
+
+            payloads = await self.redis.mget([self._return_key(rid.decode()) for rid in ids])
+
+            # Returns whose key expired (ttl_seconds) are still indexed: drop
+            # them from the indexes and re-query, so the page is full and
+            # total counts only live returns
+            stale = [rid for rid, payload in zip(ids, payloads) if payload is None]
+            if stale:
+                await self._drop_from_indexes(user_id, stale, tax_year)
+                continue
+
+            page = _TAX_RETURN_LIST.validate_json(b"[" + b",".join(payloads) + b"]")
+            return page, total
+
+    async def _query_index(
+        self,
+        user_id: UUID,
+        tax_year: Optional[int],
+        status: Optional[ReturnStatus],
+        offset: int,
+        limit: int
+    ) -> Tuple[int, List[bytes]]:
+        """(total, ids of the requested page) from the matching index"""
+        end = offset + limit - 1
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            if tax_year and status:
+                # Intersect the two filter indexes, keeping updated_at scores
+                key = self._user_key(user_id, f"tmp:{tax_year}:{status.value}")
+                pipe.zinterstore(
+                    key,
+                    [
+                        self._user_key(user_id, f"year:{tax_year}"),
+                        self._user_key(user_id, f"status:{status.value}"),
+                    ],
+                    aggregate="MAX"
+                )
+                pipe.expire(key, self.TEMP_KEY_TTL_SECONDS)
+            elif tax_year:
+                key = self._user_key(user_id, f"year:{tax_year}")
+            elif status:
+                key = self._user_key(user_id, f"status:{status.value}")
+            else:
+                key = self._user_key(user_id)
+
+            pipe.zcard(key)
+            pipe.zrevrange(key, offset, end)
+            *_, total, ids = await pipe.execute()
+
+        return total, ids
+
+    async def _drop_from_indexes(self, user_id: UUID, members: List[bytes],
+                                 tax_year: Optional[int]) -> None:
+        """
+        Remove expired return ids from the user's indexes. The tax year of
+        an expired return is unknown, so only the queried year index is
+        cleaned; other year indexes are cleaned when they are listed.
+        """
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.zrem(self._user_key(user_id), *members)
+            if tax_year:
+                pipe.zrem(self._user_key(user_id, f"year:{tax_year}"), *members)
+            for status in ReturnStatus:
+                pipe.zrem(self._user_key(user_id, f"status:{status.value}"), *members)
+            await pipe.execute()
+
+
+# ===========================================
+# STORE FACTORY
+# ===========================================
+_store: Optional[ReturnStore] = None
+
+
+def get_return_store() -> ReturnStore:
+    """Get the configured return store instance"""
+    global _store
+    if _store is None:
+        settings = get_settings()
+        if settings.RETURN_STORE_BACKEND == "redis":
+            _store = RedisReturnStore(
+                settings.REDIS_URL,
+                max_connections=settings.REDIS_MAX_CONNECTIONS,
+                ttl_seconds=settings.RETURN_STORE_TTL_SECONDS
+            )
+        else:
+            _store = InMemoryReturnStore()
+    return _store
@@ -0,0 +1,253 @@
+"""
+Cent-for-cent equivalence of the tax engine with the per-step-rounding
+implementation it replaced.
+
+Bracket tax, self-employment tax and the charitable limit used to be
+rounded at every intermediate step; they now accumulate exactly and round
+once. The reference functions below are the previous implementation,
+kept verbatim so the claim that both round to the same cent is checked
+rather than argued.
+"""
+import random
+from datetime import date
+from decimal import Decimal
+from uuid import UUID
+
+import numpy as np
+import pytest
+
+from src.calculations.tax_engine import TaxEngine, to_cents
+from src.core.config import TAX_BRACKETS_2025, TOP_BRACKET_THRESHOLD
+from src.models.tax_return import (
+    Dependent,
+    FilingStatus,
+    Form1099,
+    ItemizedDeductions,
+    SelfEmploymentIncome,
+    TaxpayerInfo,
+    TaxReturn,
+    W2Income,
+    gaap_round,
+)
+
+
+SAMPLE_SEEDS = range(200)
+
+
+# ===========================================
+# REFERENCE (PER-STEP ROUNDING)
+# ===========================================
+def reference_bracket_tax(taxable_income: Decimal, filing_status: FilingStatus) -> Decimal:
+    if taxable_income <= 0:
+        return Decimal("0")
+
+    brackets = TAX_BRACKETS_2025.get(filing_status.value, TAX_BRACKETS_2025["single"])
+    tax = Decimal("0")
+    previous_threshold = Decimal("0")
+
+    for threshold, rate in brackets:
+        threshold = Decimal(str(threshold))
+        rate = Decimal(str(rate))
+
+        if taxable_income <= previous_threshold:
+            break
+
+        taxable_in_bracket = min(taxable_income, threshold) - previous_threshold
+        if taxable_in_bracket > 0:
+            tax += gaap_round(taxable_in_bracket * rate)
+
+        previous_threshold = threshold
+
+    return gaap_round(tax)
+
+
+def reference_self_employment_tax(tax_return: TaxReturn) -> Decimal:
+    se_income = sum(se.net_profit for se in tax_return.self_employment)
+
+    if se_income <= 0:
+        return Decimal("0")
+
+    net_se_earnings = gaap_round(se_income * Decimal("0.9235"))
+    ss_tax = gaap_round(min(net_se_earnings, Decimal("168600")) * Decimal("0.124"))
+    medicare_tax = gaap_round(net_se_earnings * Decimal("0.029"))
+
+    return gaap_round(ss_tax + medicare_tax)
+
+
+def reference_itemized_deductions(itemized: ItemizedDeductions, agi: Decimal) -> Decimal:
+    total = Decimal("0")
+
+    medical_floor = gaap_round(agi * Decimal("0.075"))
+    total += max(itemized.medical_dental_expenses - medical_floor, Decimal("0"))
+    total += itemized.total_salt
+    total += itemized.total_interest
+
+    max_charitable = gaap_round(agi * Decimal("0.60"))
+    total += min(itemized.total_charitable, max_charitable)
+
+    total += itemized.casualty_theft_losses
+    total += itemized.gambling_losses
+    total += itemized.other_deductions
+
+    return gaap_round(total)
+
+
+# ===========================================
+# SAMPLE RETURNS
+# ===========================================
+def _money(rng: random.Random, low: float, high: float) -> Decimal:
+    return Decimal(str(round(rng.uniform(low, high), 2)))
+
+
+def _person(rng: random.Random, birth_years) -> TaxpayerInfo:
+    return TaxpayerInfo(
+        first_name="Test",
+        last_name="Filer",
+        date_of_birth=date(rng.choice(birth_years), 5, 5),
+        street_address="1 Main St",
+        city="Laredo",
+        state="TX",
+        zip_code="78040",
+        is_blind=rng.random() < 0.2,
+    )
+
+
+def make_sample_return(seed: int) -> TaxReturn:
+    """A random but reproducible return exercising every income source"""
+    rng = random.Random(seed)
+    filing_status = rng.choice(list(FilingStatus))
+
+    spouse = None
+    if filing_status == FilingStatus.MARRIED_FILING_JOINTLY and rng.random() < 0.8:
+        spouse = _person(rng, (1950, 1980))
+
+    itemized = None
+    if rng.random() < 0.5:
+        itemized = ItemizedDeductions(
+            medical_dental_expenses=_money(rng, 0, 30000),
+            state_local_income_tax=_money(rng, 0, 50000),
+            mortgage_interest=_money(rng, 0, 40000),
+            cash_contributions=_money(rng, 0, 80000),
+            auto_loan_interest=_money(rng, 0, 12000),
+        )
+
+    return TaxReturn(
+        user_id=UUID(int=seed),
+        tax_year=2025,
+        filing_status=filing_status,
+        taxpayer=_person(rng, (1950, 1958, 1970, 1990)),
+        spouse=spouse,
+        dependents=[
+            Dependent(
+                first_name="Kid",
+                last_name="Filer",
+                date_of_birth=date(2015, 1, 1),
+                relationship="son",
+                months_lived_with_taxpayer=12,
+                qualifies_for_ctc=rng.random() < 0.7,
+                qualifies_for_odc=rng.random() < 0.2,
+            )
+            for _ in range(rng.randint(0, 4))
+        ],
+        w2_income=[
+            W2Income(
+                employer_name="Employer",
+                employer_ein="12-3456789",
+                box_1_wages=_money(rng, 0, 300000),
+                box_2_federal_withheld=_money(rng, 0, 40000),
+            )
+            for _ in range(rng.randint(1, 3))
+        ],
+        form_1099s=[
+            Form1099(
+                form_type=rng.choice(["1099-INT", "1099-DIV", "1099-NEC", "1099-MISC"]),
+                payer_name="Payer",
+                amount=_money(rng, 0, 60000),
+                federal_withheld=_money(rng, 0, 1000),
+            )
+            for _ in range(rng.randint(0, 10))
+        ],
+        self_employment=[
+            SelfEmploymentIncome(
+                principal_business_code="1",
+                gross_receipts=_money(rng, 0, 250000),
+                supplies=_money(rng, 0, 90000),
+                meals=_money(rng, 0, 5001),
+            )
+            for _ in range(rng.randint(0, 2))
+        ],
+        tip_income=rng.choice([Decimal("0"), _money(rng, 0, 40000)]),
+        overtime_income=rng.choice([Decimal("0"), _money(rng, 0, 15000)]),
+        social_security_income=_money(rng, 0, 30000),
+        capital_gains_short=_money(rng, -3000, 20000),
+        capital_gains_long=rng.choice([Decimal("0"), _money(rng, 0, 200000)]),
+        rental_income=_money(rng, 0, 30000),
+        educator_expenses=_money(rng, 0, 500),
+        hsa_deduction=_money(rng, 0, 4000),
+        student_loan_interest=_money(rng, 0, 4000),
+        itemized_deductions=itemized,
+        estimated_payments=_money(rng, 0, 10000),
+    )
+
+
+def _bracket_edge_incomes():
+    """Every bracket threshold below the open-ended top bracket, and the cent either side of it"""
+    for status in FilingStatus:
+        for threshold, _ in TAX_BRACKETS_2025.get(status.value, TAX_BRACKETS_2025["single"]):
+            if threshold == TOP_BRACKET_THRESHOLD:
+                continue
+            for offset in ("-0.01", "0", "0.01"):
+                yield status, Decimal(str(threshold)) + Decimal(offset)
+
+
+# ===========================================
+# TESTS
+# ===========================================
+@pytest.fixture
+def engine():
+    return TaxEngine(2025)
+
+
+@pytest.mark.parametrize("seed", SAMPLE_SEEDS)
+def test_sample_return_matches_per_step_rounding(engine, seed):
+    tax_return = make_sample_return(seed)
+    result = engine.calculate_final_tax(tax_return)
+    taxable_income = engine.calculate_taxable_income(tax_return)
+
+    assert engine._calculate_bracket_tax(taxable_income, tax_return.filing_status) == (
+        reference_bracket_tax(taxable_income, tax_return.filing_status)
+    )
+    assert engine._calculate_self_employment_tax(tax_return) == (
+        reference_self_employment_tax(tax_return)
+    )
+    if tax_return.itemized_deductions is not None:
+        agi = engine.calculate_agi(tax_return)
+        assert engine._calculate_itemized_deductions(tax_return.itemized_deductions, agi) == (
+            reference_itemized_deductions(tax_return.itemized_deductions, agi)
+        )
+    assert result.taxable_income == taxable_income
+
+
+def test_bracket_tax_matches_per_step_rounding_at_every_edge(engine):
+    for status, income in _bracket_edge_incomes():
+        assert engine._calculate_bracket_tax(income, status) == reference_bracket_tax(income, status)
+
+
+def test_bracket_tax_matches_per_step_rounding_on_random_cents(engine):
+    rng = random.Random(2025)
+    for _ in range(5000):
+        status = rng.choice(list(FilingStatus))
+        income = Decimal(rng.randint(1, 1_500_000_00)) / 100
+        assert engine._calculate_bracket_tax(income, status) == reference_bracket_tax(income, status)
+
+
+def test_batch_bracket_tax_matches_scalar(engine):
+    rng = random.Random(7)
+    statuses = [rng.choice(list(FilingStatus)) for _ in range(2000)]
+    incomes = np.array([rng.randint(0, 1_500_000_00) for _ in statuses], dtype=np.int64)
+
+    batch = TaxEngine.batch_bracket_tax(incomes, statuses)
+
+    for income, status, tax in zip(incomes, statuses, batch):
+        expected = reference_bracket_tax(Decimal(int(income)) / 100, status)
+        assert int(tax) == to_cents(expected)